@@ -1,5 +1,7 @@
 from __future__ import print_function
 
+import collections
+import json
 import logging
 import os
 import re
@@ -33,27 +35,56 @@ def target_file_name(schema_name):
 
 
 def generate_python(version, schema_root, target_directory):
-    init = make_init(schema_root, target_directory, version)
-
+    schemas = {}
     for schema in os.listdir(schema_root):
         if not schema.endswith('.usda'):
             continue
 
         source = os.path.join(schema_root, schema)
         target = os.path.join(target_directory, target_file_name(schema))
-        convert_schema(source, target)
+        schemas[os.path.splitext(os.path.basename(target))[0]] = convert_schema(source, target)
+
+    make_init(schema_root, target_directory, version, schemas)
 
     os.chdir(target_directory)
     subprocess.call(['git', 'add', '.'])
 
 
-def make_init(schema_root, target_directory, version):
+def make_init(schema_root, target_directory, version, schemas=None):
+    """Write the USD version and an index of the generated classes
+
+    The index lets aud import the module of a class the first time that it's used,
+    instead of importing every module up front.
+
+    Args:
+        schemas (dict): The classes that convert_schema generated, by module name
+
+    """
+    modules = {}
+    types = {}
+    for module_name in sorted(schemas or {}):
+        for cls in schemas[module_name]:
+            modules.setdefault(cls.name, module_name)
+            if cls.as_type:
+                types.setdefault(cls.as_type, cls.name)
+
     file_path = os.path.join(target_directory, '__init__.py')
     with open(file_path, 'w') as f:
         f.write('__usd_version__ = "{}"\n'.format(version))
+        f.write('\n# The generated module that defines each schema class\n')
+        f.write('SCHEMA_MODULES = {\n')
+        for name in sorted(modules):
+            f.write("    '{}': '{}',\n".format(name, modules[name]))
+        f.write('}\n')
+        f.write('\n# The schema class of each prim type\n')
+        f.write('SCHEMA_TYPES = {\n')
+        for as_type in sorted(types):
+            f.write("    '{}': '{}',\n".format(as_type, types[as_type]))
+        f.write('}\n')
 
 
 def convert_schema(source, target):
+    schema_parser = None
     try:
         schema_parser = ParseSchema(source)
         schema_parser.process()
@@ -65,6 +96,67 @@ def convert_schema(source, target):
     with open(target, 'w') as f:
         f.writelines('\n'.join(lines or []))
 
+    if lines is None:
+        return []
+
+    classes = [cls for cls in schema_parser.classes if cls.name]
+    write_docs(target, collections.OrderedDict((cls.name, cls.docs()) for cls in classes))
+    return classes
+
+
+def docs_file_name(target):
+    """Return the file that the documentation of a generated module is written to"""
+    return '{}.docs.json'.format(os.path.splitext(target)[0])
+
+
+def write_docs(target, docs):
+    """Write the documentation of the classes of a generated module beside it
+
+    The modules only embed the first sentence of each class's docs, so that importing
+    them stays quick and small. aud reads this file the first time that one of the
+    docstrings is requested.
+
+    Args:
+        target (str): The generated module
+        docs (dict): The documentation of each class, as returned by USDClassParser.docs
+
+    """
+    with open(docs_file_name(target), 'w') as f:
+        json.dump(docs, f, indent=1, separators=(',', ': '))
+        f.write('\n')
+
+
+# The escape sequences of the doc strings in the schemas, which are escaped like C strings
+ESCAPES = {
+    '\\': '\\', "'": "'", '"': '"', '\n': '',
+    'a': '\a', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t', 'v': '\v',
+}
+
+
+def doc_text(doc):
+    """Return the text of a doc string from a schema, without its indentation or blank lines"""
+    text = '\n'.join(line.strip() for line in doc.split('\n')) + '\n'
+    text = re.sub(r'\\(.)', lambda match: ESCAPES.get(match.group(1), match.group(0)), text,
+                  flags=re.DOTALL)
+    return '\n'.join(line for line in text.split('\n') if line.strip())
+
+
+def doc_summary(doc):
+    """Return the first sentence of a doc string from a schema, or None if it has none
+
+    The generated classes keep this much of their documentation as their docstring, so
+    that it's there without the docs file. aud serves the full text from that file.
+    """
+    return first_sentence(doc_text(doc))
+
+
+def first_sentence(text):
+    """Return the first sentence of documentation text on one line, without its markup"""
+    text = ' '.join(re.sub(r'<[^>]+>|\\', '', text).split())
+    # Sentences are sometimes run together, and some of them introduce a list
+    match = re.search(r'(?<!\bi\.e)(?<!\be\.g)(\.(?=\s|[A-Z]|$)|:(?=\s+-\s|$))', text)
+    return text[:match.end()] if match else text or None
+
 
 class USDDataParser(object):
     def __init__(self):
@@ -146,21 +238,6 @@ class USDAttributeParser(USDDataParser):
                 prop.value
             ))
 
-        # Handle docstring
-        docs = ''
-        for line in self.doc.split('\n'):
-            stripped = line.strip()
-            if not stripped: continue
-            docs += ('{}{}\n'.format(
-                self.indent(),
-                line.strip()
-            ))
-        lines.append('{0}docstring = {1}\n{2}{0}{1}\n'.format(
-            self.indent(),
-            "'''" if '"""' in docs else '""",',
-            docs
-        ))
-
         self._indent = indent
         lines.append("{})".format(self.indent()))
         return lines
@@ -279,19 +356,11 @@ class USDClassParser(USDDataParser):
         # Make class def
         lines.append('\nclass {}({}):'.format(self.name, ', '.join(self.bases)))
         self._indent += 1
-        docs = ''
-        for line in self.doc.split('\n'):
-            stripped = line.strip()
-            if not stripped: continue
-            docs += ('{}{}\n'.format(
-                self.indent(),
-                line.strip()
-            ))
-        lines.append('{0}{1}\n{2}\n{0}{1}\n'.format(
-            self.indent(),
-            "'''" if '"""' in docs else '"""',
-            docs
-        ))
+        summary = doc_summary(self.doc)
+        if summary:
+            lines.append('{}"""{}"""'.format(self.indent(), summary.replace('"', '\\"')))
+        # Keep schema instances as small as the base classes they inherit from
+        lines.append('{}__slots__ = ()'.format(self.indent()))
         if self.as_type:
             lines.append('{}as_type = "{}"'.format(self.indent(), self.as_type))
 
@@ -301,17 +370,30 @@ class USDClassParser(USDDataParser):
         for attr in self.attributes:
             lines.extend(attr.lines(indent=self._indent))
 
-        if not any([self.attributes, self.properties, self.as_type]):
-            lines.append("{}pass".format(self.indent()))
-
         return lines
 
+    def docs(self):
+        """Return the documentation of the class and its attributes, which write_docs
+        stores outside of the generated module
+        """
+        docs = collections.OrderedDict()
+        if doc_text(self.doc):
+            docs['doc'] = doc_text(self.doc)
+
+        attributes = collections.OrderedDict(
+            (attr.name, doc_text(attr.doc)) for attr in self.attributes if doc_text(attr.doc)
+        )
+        if attributes:
+            docs['attributes'] = attributes
+        return docs
+
 
 class ParseSchema(object):
     def __init__(self, source):
         super(ParseSchema, self).__init__()
         self.source = source
         self.lines = []
+        self.classes = []
 
         self.class_lines = []
 
@@ -322,6 +404,7 @@ class ParseSchema(object):
         for cls_lines in self.class_lines:
             schema_class = USDClassParser(cls_lines)
             self.lines.extend(schema_class.lines())
+            self.classes.append(schema_class)
 
     def make_imports(self):
         self.lines.append('from .base import Prim, Attribute, Property')
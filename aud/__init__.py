@@ -1,12 +1,48 @@
+import importlib
 import os
 from .base import *
 from .base import __version__
-
-from .generated import __usd_version__
-
+from .generated import SCHEMA_MODULES, __usd_version__
 from pkgutil import extend_path
 __path__ = extend_path(__path__, __name__)
-__path__.append(os.path.join(
-    os.path.dirname(os.path.abspath(__file__)),
-    'generated'
-))
\ No newline at end of file
+__path__.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'generated'))
+from .usda import UnsupportedDataWarning, open, open_stage
+
+# What `from aud import *` imports, which leaves out open so the builtin isn't shadowed
+__all__ = [
+    'AbstractData', 'Aggregator', 'Attribute', 'CRATE_EXTENSIONS', 'CrateReader',
+    'CrateWriter', 'DOUBLE', 'DedupeReport', 'FLOAT32', 'FLOAT_CODES', 'GEOMETRY_TYPES',
+    'IterObject', 'Iterable', 'LazyValue', 'METADATA_TYPES', 'MIN_COMPRESSED_ARRAY_SIZE',
+    'PROTOTYPES_NAME', 'Prim', 'Property', 'SCHEMA_DIRECTORY', 'SCHEMA_MODULES',
+    'SCHEMA_TYPES', 'SPECIFIERS', 'SPEC_ATTRIBUTE', 'SPEC_PRIM', 'SPEC_PSEUDO_ROOT',
+    'SPEC_RELATIONSHIP', 'SPEC_VARIANT', 'SPEC_VARIANT_SET', 'SUBTREES_PER_WORKER',
+    'SaveOptions', 'Stage', 'StageStats', 'TimeSamples', 'USDZ_EXTENSION',
+    'UnsupportedDataWarning', 'UsdzWriter', 'Variant', 'VariantSet', 'WRITE_BUFFER_SIZE',
+    'add_hook', 'as_buffer', 'buffer_length', 'check_precision', 'create_usdz',
+    'format_typed', 'formatted_value', 'indentation', 'infer_type', 'instrumented',
+    'is_array_type', 'is_buffer', 'open_stage', 'package_assets', 'reduce_samples',
+    'remove_hook', 'schema_class', 'type_code', 'type_width',
+]
+
+# The generated schema modules, e.g. audGeom, which are only imported when they're used
+_SCHEMA_MODULE_NAMES = frozenset(SCHEMA_MODULES.values())
+
+
+def __getattr__(name):
+    """Import a generated schema module, or the module of a schema class, when it's first
+    used as aud.audGeom or aud.Mesh. Python 2 and 3.6 need to import them explicitly
+    """
+    if name in _SCHEMA_MODULE_NAMES:
+        value = importlib.import_module('.' + name, __name__)
+    elif name in SCHEMA_MODULES:
+        module = importlib.import_module('.' + SCHEMA_MODULES[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _SCHEMA_MODULE_NAMES | set(SCHEMA_MODULES))
@@ -1,65 +1,976 @@
+import contextlib
+import importlib
+import itertools
+import numbers
 import os
+import struct
+import sys
+import time
 import weakref
+from collections import OrderedDict
+
+try:
+    from collections.abc import MutableSequence
+except ImportError:
+    from collections import MutableSequence
+
+from .formatting import (
+    FLOAT32, FLOAT_CODES, DOUBLE, as_buffer, buffer_length, check_precision, format_typed,
+    is_array_type, is_buffer, type_code, type_width
+)
+from .crate import (
+    METADATA_TYPES, MIN_COMPRESSED_ARRAY_SIZE, SPEC_ATTRIBUTE, SPEC_PRIM, SPEC_PSEUDO_ROOT,
+    SPEC_RELATIONSHIP, SPEC_VARIANT, SPEC_VARIANT_SET, SPECIFIERS, CrateReader, CrateWriter,
+    LazyValue, infer_type
+)
+from .timesamples import TimeSamples, reduce_samples
+from .usdz import UsdzWriter, create_usdz, package_assets
+from .generated import SCHEMA_MODULES, SCHEMA_TYPES
 
 __version__ = "0.0.2"
 
-
-def formatted_value(value, array=True):
+# Number of characters gathered before the streaming writer flushes to disk
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Number of subtrees given to each worker process when a stage is written in parallel,
+# so the work still evens out when some subtrees are much bigger than others
+SUBTREES_PER_WORKER = 8
+
+# The prim types that save_deduplicated shares between prims by default
+GEOMETRY_TYPES = ('Mesh', 'Points', 'BasisCurves', 'NurbsCurves')
+
+# The name of the class prim that save_deduplicated writes the prototypes under
+PROTOTYPES_NAME = '_prototypes'
+
+# Extensions that are saved as binary crate files rather than as usda
+CRATE_EXTENSIONS = ('.usdc', '.usd')
+USDZ_EXTENSION = '.usdz'
+
+# Fields of specs read from a usdc file that aud handles itself rather than keeping as
+# metadata properties. The stage always writes its own comment
+_STAGE_FIELDS = frozenset(['comment', 'primChildren', 'subLayers', 'subLayerOffsets'])
+_PRIM_FIELDS = frozenset([
+    'specifier', 'typeName', 'primChildren', 'properties', 'variantSetChildren',
+    'variantSetNames', 'references', 'inheritPaths', 'payload', 'apiSchemas',
+])
+_ATTRIBUTE_FIELDS = frozenset([
+    'typeName', 'variability', 'default', 'timeSamples', 'custom', 'connectionPaths',
+    'targetPaths',
+])
+
+# The list op fields of a prim in a usdc file and the name of their Iterable
+_LIST_OP_FIELDS = (
+    ('variantSetNames', 'variantSets'),
+    ('references', 'references'),
+    ('payload', 'payload'),
+    ('inheritPaths', 'inherits'),
+    ('apiSchemas', 'apiSchemas'),
+)
+
+# The slot of a prim that each kind of Iterable is kept in. aud has always written its
+# references as 'reference', so files it wrote before are read back the same way
+_LIST_SLOTS = {
+    'variantSets': '_variants',
+    'references': '_references',
+    'reference': '_references',
+    'payload': '_payloads',
+    'inherits': '_inherits',
+    'apiSchemas': '_api_schemas',
+}
+
+# The directory of the modules generated from the USD schemas
+SCHEMA_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'generated')
+_schema_classes = {}
+
+# The documentation of the generated schemas by module, loaded when it's first read
+_schema_docs = {}
+
+# Set once an incremental save has kept the text of a prim. Until then, changes don't
+# need to look for text to drop
+_keeping_text = False
+
+# The characters escaped in strings, with the backslash first so it's only escaped once
+_STRING_ESCAPES = (('\\', '\\\\'), ('"', '\\"'), ('\n', '\\n'), ('\r', '\\r'), ('\t', '\\t'))
+
+# Plain dicts keep insertion order from Python 3.7 onwards and are much smaller
+_ordered_dict = dict if sys.version_info >= (3, 7) else OrderedDict
+
+try:
+    from types import MappingProxyType
+    _EMPTY_MAPPING = MappingProxyType({})
+except ImportError:
+    _EMPTY_MAPPING = {}
+
+
+def _escape(text):
+    """Escape a string so it can be written between double quotes"""
+    for char, escaped in _STRING_ESCAPES:
+        if char in text:
+            text = text.replace(char, escaped)
+    return text
+
+
+def _formatted_asset(value, sep=', '):
+    """Format an asset path, or a list of them, between @ delimiters"""
+    if isinstance(value, (list, tuple)):
+        return '[{}]'.format(sep.join('@{}@'.format(path) for path in value))
+    return '@{}@'.format(value)
+
+
+def formatted_value(value, array=True, as_type=None, sep=', ', precision=None):
     """Format a given input value to be compliant for USD
 
     Args:
         array (bool): If provided, will treat iterables as an array rather than a tuple
+        as_type (str): If provided, numeric values of this USD type are formatted in bulk
+        sep (str): The separator between the elements of arrays and tuples
+        precision: How floating point values of as_type are written. See Stage.set_precision
 
     """
+    if as_type:
+        if as_type.startswith('asset') and value is not None:
+            return _formatted_asset(value, sep=sep)
+
+        typed = format_typed(value, as_type, sep=sep, precision=precision)
+        if typed is not None:
+            return typed
+
     if isinstance(value, str):
-        value = '"{}"'.format(value.replace('"', '\\"'))
+        value = '"{}"'.format(_escape(value))
     elif isinstance(value, (list, tuple)):
         temp = []
 
         for val in value:
             if isinstance(val, str):
                 val = formatted_value(val, array=False)
+            elif sep != ', ' and isinstance(val, tuple):
+                val = formatted_value(val, array=False, sep=sep)
             temp.append(str(val))
         value = '{}{}{}'.format(
             '[' if array else '(',
-            ', '.join(temp),
+            sep.join(temp),
             ']' if array else ')'
         )
 
     return str(value)
 
 
+# The callables that instrumentation events are sent to. Instrumentation is off while
+# this is empty, which is all that the hot paths check before doing any work for it
+_hooks = []
+
+# The clock that spans are timed with
+_clock = getattr(time, 'perf_counter', time.time)
+
+
+def add_hook(hook):
+    """Send instrumentation events to a hook
+
+    Spans are sent as hook('span', name, seconds, tags) once they end, and counters as
+    hook('count', name, amount, tags). The tags are a dict, or None. Spans nest, e.g. the
+    attribute.format spans of a prim are inside its prim.lines span, which is inside the
+    save span, and each includes the time of the spans inside it.
+
+    The events are:
+        save: Writing a file with Stage.save, tagged with its format
+        prim.lines: Writing the text of a prim up to its children, tagged with its type
+        attribute.format: Formatting a value or time sample for usda, tagged with the
+            type and the number of elements
+        attribute.pack: Adding an attribute to a usdc file, tagged in the same way and
+            with the number of time samples
+        schema.default: Resolving a schema default in get_attribute or get_property,
+            tagged with the kind of default and the class it's looked up on
+        io.flush: Writing buffered usda text to the file, tagged with the number of
+            characters, or the data of a usdc file, tagged with its format
+        schema.registry: Counts the schema registries that are built for a class
+        prim.text_reused: Counts the prims that incremental saves reuse the text of
+
+    Only the events of the main process are sent when writing with workers.
+
+    Args:
+        hook: A callable, e.g. an Aggregator
+
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook):
+    """Stop sending instrumentation events to a hook added with add_hook"""
+    _hooks.remove(hook)
+
+
+@contextlib.contextmanager
+def instrumented(hook=None):
+    """Send instrumentation events to a hook while inside a with block
+
+    Args:
+        hook: A callable, see add_hook. Defaults to a new Aggregator
+
+    Yields:
+        The hook
+
+    """
+    if hook is None:
+        hook = Aggregator()
+    add_hook(hook)
+    try:
+        yield hook
+    finally:
+        remove_hook(hook)
+
+
+def _emit_span(name, start, tags=None):
+    """Send a span that started at a time from _clock to the hooks"""
+    seconds = _clock() - start
+    for hook in list(_hooks):
+        hook('span', name, seconds, tags)
+
+
+def _emit_count(name, amount=1, tags=None):
+    """Send a counter to the hooks"""
+    for hook in list(_hooks):
+        hook('count', name, amount, tags)
+
+
+def _element_count(value, as_type):
+    """Return the number of elements in a value, to tag instrumentation with"""
+    if value is None:
+        return 0
+
+    count = buffer_length(value, as_type)
+    if count is not None:
+        return count // (type_width(as_type) or 1)
+    if as_type and as_type.endswith('[]') and isinstance(value, (list, tuple)):
+        return len(value)
+    return 1
+
+
+class Aggregator(object):
+    """Adds up instrumentation events to report where the time of a save goes
+
+    Events are grouped by their name and the tags that aren't numbers, e.g. formatting
+    is grouped by type. Tags that are numbers, like the number of elements, are summed.
+
+    Attributes:
+        totals (dict): The number of events, their total seconds or amount, and the sums
+            of their number tags, keyed by the kind, name and text tags of the events
+    """
+    __slots__ = ('totals',)
+
+    def __init__(self):
+        super(Aggregator, self).__init__()
+        self.totals = {}
+
+    def __call__(self, kind, name, value, tags=None):
+        labels = ()
+        sums = None
+        if tags:
+            labels = []
+            for tag, tag_value in sorted(tags.items()):
+                if isinstance(tag_value, numbers.Number) and not isinstance(tag_value, bool):
+                    sums = sums or {}
+                    sums[tag] = tag_value
+                else:
+                    labels.append((tag, tag_value))
+            labels = tuple(labels)
+
+        total = self.totals.get((kind, name, labels))
+        if total is None:
+            total = self.totals[kind, name, labels] = [0, 0, {}]
+        total[0] += 1
+        total[1] += value
+        if sums:
+            for tag, tag_value in sums.items():
+                total[2][tag] = total[2].get(tag, 0) + tag_value
+
+    def top(self, count=10, kind='span'):
+        """Return the groups of events with the highest totals
+
+        Returns:
+            list: The name, text tags, number of events, total and number tag sums of
+                each group, highest total first
+
+        """
+        groups = [(name, labels, calls, total, sums)
+                  for (group_kind, name, labels), (calls, total, sums) in self.totals.items()
+                  if group_kind == kind]
+        groups.sort(key=lambda group: group[3], reverse=True)
+        return groups[:count]
+
+    def report(self, count=10):
+        """Return a table of the spans that took the most time, followed by the counters"""
+        lines = ['{:<20}{:<32}{:>10}{:>12}{:>12}  {}'.format(
+            'Span', 'Tags', 'Calls', 'Seconds', 'Mean (ms)', 'Sums'
+        )]
+        for name, labels, calls, total, sums in self.top(count):
+            lines.append('{:<20}{:<32}{:>10}{:>12.4f}{:>12.4f}  {}'.format(
+                name, _format_tags(labels), calls, total, total * 1000.0 / calls,
+                _format_tags(sorted(sums.items()))
+            ))
+
+        counters = self.top(count, kind='count')
+        if counters:
+            lines.append('')
+            lines.append('{:<20}{:<32}{:>10}{:>12}'.format('Counter', 'Tags', 'Calls', 'Total'))
+            for name, labels, calls, total, _ in counters:
+                lines.append('{:<20}{:<32}{:>10}{:>12}'.format(
+                    name, _format_tags(labels), calls, total
+                ))
+        return '\n'.join(lines)
+
+    def print_report(self, count=10):
+        """Print the report of the spans that took the most time"""
+        sys.stdout.write(self.report(count) + '\n')
+
+    def clear(self):
+        """Forget the events added up so far"""
+        self.totals.clear()
+
+
+def _format_tags(tags):
+    return ' '.join('{}={}'.format(tag, value) for tag, value in tags) or '-'
+
+
+class SaveOptions(object):
+    """Settings that control how a stage is written out
+
+    Args:
+        reduce_tolerance (float): If given, time samples that can be recovered from
+            their neighbours within this tolerance are dropped as they're written.
+            Use 0 to only drop samples that are exactly redundant.
+        compact (bool): Write the file without indentation, blank lines or spaces
+            between array elements. The result is smaller and faster to write, and is
+            still valid usda.
+        precision: How floating point values are written, unless an attribute sets its
+            own precision. See Stage.set_precision
+        incremental (bool): Keep the text of every prim that's written, and reuse it in
+            later incremental saves for the prims that haven't changed since. Only the
+            prims written by the main process are kept when writing in parallel.
+            Buffer values that are changed in place aren't noticed, so the prims that
+            hold them have to be marked with AbstractData.mark_dirty
+
+    Attributes:
+        reduced (dict): The number of time samples dropped for each animated attribute,
+            keyed by the attribute path
+        subtrees: The text of subtrees that have already been written, which is written
+            in their place. It's looked up with get(id(prim)), and is None when there
+            aren't any
+        stand_ins: Prims that are written in place of others, e.g. the prims that load
+            layers split out of the stage. It's keyed by the id of the prim they replace,
+            and is None when there aren't any
+    """
+    __slots__ = (
+        'reduce_tolerance', 'reduced', 'compact', 'precision', 'incremental', 'subtrees',
+        'stand_ins'
+    )
+
+    def __init__(self, reduce_tolerance=None, compact=False, precision=None,
+                 incremental=False):
+        super(SaveOptions, self).__init__()
+        self.reduce_tolerance = reduce_tolerance
+        self.reduced = {}
+        self.compact = compact
+        self.precision = check_precision(precision)
+        self.incremental = incremental
+        self.subtrees = None
+        self.stand_ins = None
+
+    def copy(self):
+        """Return options with the same settings, that haven't written anything yet"""
+        options = SaveOptions(
+            reduce_tolerance=self.reduce_tolerance,
+            compact=self.compact,
+            precision=self.precision,
+            incremental=self.incremental
+        )
+        options.stand_ins = self.stand_ins
+        return options
+
+    @property
+    def text_key(self):
+        """The settings that the text kept by incremental saves depends on"""
+        return self.compact, self.precision, self.reduce_tolerance
+
+    @property
+    def separator(self):
+        """The separator between the elements of arrays and tuples"""
+        return ',' if self.compact else ', '
+
+
+class DedupeReport(object):
+    """What save_deduplicated shared between prims with the same geometry
+
+    Attributes:
+        prims (int): The number of prims whose geometry was hashed
+        unique (int): The number of distinct geometries among them
+        prototypes (int): The number of geometries written once as a prototype, because
+            more than one prim has them
+        instances (int): The number of prims written as instances of a prototype
+        bytes_saved (int): The bytes of attribute values that weren't written again,
+            counting raw buffer sizes rather than the size they're written as
+        reduced (dict): The number of time samples dropped per attribute path
+    """
+    __slots__ = ('prims', 'unique', 'prototypes', 'instances', 'bytes_saved', 'reduced')
+
+    def __init__(self):
+        super(DedupeReport, self).__init__()
+        self.prims = 0
+        self.unique = 0
+        self.prototypes = 0
+        self.instances = 0
+        self.bytes_saved = 0
+        self.reduced = {}
+
+    @property
+    def ratio(self):
+        """How many prims there are for each distinct geometry"""
+        if not self.unique:
+            return 1.0
+        return float(self.prims) / self.unique
+
+    def __repr__(self):
+        return '<DedupeReport {} prims, {} unique, {:.2f}x, {} bytes saved>'.format(
+            self.prims, self.unique, self.ratio, self.bytes_saved
+        )
+
+
+class StageStats(object):
+    """What a stage holds, and roughly how big it is in memory and when it's written
+
+    Attributes:
+        prims (int): The number of prims, including variant sets and variants
+        prims_by_type (dict): The number of prims of each type name. Prims without a type
+            are counted under None, and variant sets and variants under VariantSet and
+            Variant
+        attributes (int): The number of attributes, including relationships
+        attributes_by_type (dict): The number of attributes of each USD type
+        array_elements (int): The number of elements in the values and time samples of
+            array attributes, e.g. the number of points rather than of floats
+        keyframes (int): The number of time samples
+        max_depth (int): The depth of the deepest prim, where root prims are at 1
+        memory_bytes (int): An estimate of the memory that the nodes and values take
+        usda_bytes (int): An estimate of the size of the stage saved as usda
+        compact_bytes (int): An estimate of the size of the stage saved as compact usda
+        usdc_bytes (int): An estimate of the size of the stage saved as usdc
+    """
+    __slots__ = (
+        'prims', 'prims_by_type', 'attributes', 'attributes_by_type', 'array_elements',
+        'keyframes', 'max_depth', 'memory_bytes', 'usda_bytes', 'compact_bytes', 'usdc_bytes'
+    )
+
+    def __init__(self):
+        super(StageStats, self).__init__()
+        self.prims = 0
+        self.prims_by_type = {}
+        self.attributes = 0
+        self.attributes_by_type = {}
+        self.array_elements = 0
+        self.keyframes = 0
+        self.max_depth = 0
+        self.memory_bytes = 0
+        self.usda_bytes = 0
+        self.compact_bytes = 0
+        self.usdc_bytes = 0
+
+    def __repr__(self):
+        return '<StageStats {} prims, {} attributes, ~{} bytes of usda, ~{} of usdc>'.format(
+            self.prims, self.attributes, self.usda_bytes, self.usdc_bytes
+        )
+
+
 def indentation(level):
     """Return the indentation string for a given level of indentation"""
     return level * 4 * ' '
 
 
-class AbstractData(object):
-    """Base class for all our primitives"""
-    as_type = None
+class _TypeName(object):
+    """Descriptor for as_type that falls back to the default declared on the class"""
+
+    def __get__(self, instance, owner):
+        if instance is not None and instance._as_type is not None:
+            return instance._as_type
+        return owner._default_as_type
+
+    def __set__(self, instance, value):
+        instance._as_type = value
+        instance.mark_dirty()
+
+
+class _DataType(type):
+    """Metaclass for our primitives
+
+    Nodes are slotted to keep them small, so a plain class level as_type (as declared by
+    the generated schemas) would hide the instance slot and make as_type read-only.
+    Instead it is stored as the class default that the _TypeName descriptor falls back to.
+
+    The generated schemas also leave most of their documentation out of their modules,
+    so their classes and attributes are given docstrings that are read from it when
+    requested. A class keeps the summary that it was generated with for when it can't be.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        if 'as_type' in namespace and not isinstance(namespace['as_type'], _TypeName):
+            namespace['_default_as_type'] = namespace.pop('as_type')
+
+        module = namespace.get('__module__', '')
+        if SCHEMA_MODULES.get(name) == module.rpartition('.')[2]:
+            namespace['__doc__'] = _SchemaDoc(module, name, summary=namespace.get('__doc__'))
+            for value in namespace.values():
+                if isinstance(value, Attribute) and value._docstring is None:
+                    value._docstring = _SchemaDoc(module, name, value.name)
+        return super(_DataType, mcs).__new__(mcs, name, bases, namespace)
+
+    def _class_doc(cls):
+        doc = vars(cls).get('__doc__')
+        if isinstance(doc, (_DocString, _SchemaDoc)):
+            return doc.__get__(None, cls)
+        return doc
+
+    # pydoc reads the __doc__ of a class without calling the descriptor it holds, so the
+    # metaclass resolves it instead. This replaces the docstring of the metaclass itself
+    __doc__ = property(_class_doc)
+
+
+class _DocString(object):
+    """Descriptor for __doc__ that returns the docstring of an instance when accessed on one"""
+
+    def __init__(self, doc):
+        self.doc = doc
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.doc
+        return instance.docstring
+
+
+class _SchemaDoc(object):
+    """The documentation of a generated schema class or attribute, read on first use
+
+    The generator writes the docs of each module to a json file beside it. This is the
+    __doc__ descriptor of the classes, and stands in for the docstring of attributes.
+    Classes fall back to the summary that their module was generated with.
+    """
+    __slots__ = ('module', 'class_name', 'attribute', 'summary')
+
+    def __init__(self, module, class_name, attribute=None, summary=None):
+        self.module = module
+        self.class_name = class_name
+        self.attribute = attribute
+        self.summary = summary
+
+    def __get__(self, instance, owner):
+        return self.text()
+
+    def text(self):
+        """Return the documentation, or None if there isn't any"""
+        module = self.module.rpartition('.')[2]
+        docs = _schema_docs.get(module)
+        if docs is None:
+            # Imported here since the docs are rarely read
+            import io
+            import json
+
+            try:
+                location = os.path.join(SCHEMA_DIRECTORY, module + '.docs.json')
+                with io.open(location, encoding='utf-8') as f:
+                    docs = json.load(f)
+            except (IOError, OSError, ValueError):
+                docs = {}
+            _schema_docs[module] = docs
+
+        docs = docs.get(self.class_name, {})
+        if self.attribute is None:
+            return docs.get('doc', self.summary)
+        return docs.get('attributes', {}).get(self.attribute)
+
+
+class _ListView(MutableSequence):
+    """A live list of what an object holds, that makes its changes through the object
+
+    Objects only create their containers the first time something is added to them,
+    and keep their properties and attributes keyed by name, so they hand out views like
+    this one as their children, properties, attributes and composition lists. Reading a
+    view reads the container as it is now, and changing it parents, indexes and marks
+    the object dirty the same way the object's own add methods do.
+
+    Args:
+        owner (AbstractData): The object
+        slot (str): The slot of the object that holds the container
+
+    """
+    __slots__ = ('_owner', '_slot')
+    __hash__ = None
+
+    def __init__(self, owner, slot):
+        self._owner = owner
+        self._slot = slot
+
+    def _items(self):
+        """Return the items in the container, which is a list or the values of a dict"""
+        return getattr(self._owner, self._slot) or ()
+
+    def _add(self, item):
+        """Add an item to the end of the container"""
+        self._replace(list(self) + [item])
+
+    def _replace(self, items):
+        """Make the object hold a new list of items"""
+        raise NotImplementedError
+
+    def __len__(self):
+        return len(self._items())
+
+    def __iter__(self):
+        return iter(self._items())
+
+    def __reversed__(self):
+        return reversed(list(self._items()))
+
+    def __contains__(self, item):
+        return item in self._items()
+
+    def __getitem__(self, index):
+        items = self._items()
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        return items[index]
+
+    def __setitem__(self, index, item):
+        items = list(self)
+        items[index] = item
+        self._replace(items)
+
+    def __delitem__(self, index):
+        items = list(self)
+        del items[index]
+        self._replace(items)
+
+    def insert(self, index, item):
+        if index >= len(self):
+            self._add(item)
+            return
+        items = list(self)
+        items.insert(index, item)
+        self._replace(items)
+
+    def index(self, item, *args):
+        return list(self._items()).index(item, *args)
+
+    def count(self, item):
+        return list(self._items()).count(item)
+
+    def clear(self):
+        self._replace([])
+
+    def reverse(self):
+        self._replace(list(reversed(self)))
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, _ListView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _ChildList(_ListView):
+    """The child prims of an object, which are parented and indexed as they're added"""
+    __slots__ = ()
+
+    def _add(self, prim):
+        self._owner.add_child(prim)
+
+    def _replace(self, prims):
+        for prim in prims:
+            assert isinstance(prim, Prim), "Child must be a primitive"
+
+        owner = self._owner
+        old = owner._children or ()
+        kept = set(id(prim) for prim in prims)
+        for child in old:
+            if id(child) not in kept:
+                child.unset_parent()
+
+        present = set(id(child) for child in old)
+        owner._children = prims or None
+        stage = owner._stage()
+        for prim in prims:
+            if id(prim) not in present:
+                prim.set_parent(owner)
+                if stage is not None:
+                    stage._index_prims(prim)
+        owner.mark_dirty()
+
+
+class _NamedList(_ListView):
+    """The properties or attributes of an object, which are kept keyed by their names
+
+    Adding one with the name of another that the object already has raises a ValueError.
+    """
+    __slots__ = ()
+
+    def _mapping(self):
+        if self._slot == '_attributes':
+            return self._owner._loaded_attributes()
+        return self._owner._properties
+
+    def _items(self):
+        mapping = self._mapping()
+        return () if mapping is None else mapping.values()
+
+    def _check(self, item):
+        item_type = Attribute if self._slot == '_attributes' else Property
+        if not isinstance(item, item_type):
+            raise TypeError("{!r} is not an {}".format(item, item_type.__name__))
+
+    def _duplicate(self, item):
+        return ValueError("{} already has {} named {}".format(
+            self._owner.path(), 'an attribute' if self._slot == '_attributes' else 'a property',
+            item.name
+        ))
+
+    def __contains__(self, item):
+        mapping = self._mapping()
+        return (mapping is not None and isinstance(item, AbstractData)
+                and mapping.get(item.name) is item)
+
+    def _add(self, item):
+        self._check(item)
+        mapping = self._mapping()
+        if mapping is not None and item.name in mapping:
+            raise self._duplicate(item)
+
+        if self._slot == '_attributes':
+            self._owner.add_attribute(item)
+        else:
+            self._owner.add_property(item)
+
+    def _replace(self, items):
+        mapping = _ordered_dict()
+        for item in items:
+            self._check(item)
+            if item.name in mapping:
+                raise self._duplicate(item)
+            mapping[item.name] = item
+
+        owner = self._owner
+        old = self._mapping() or {}
+        for item in old.values():
+            if mapping.get(item.name) is not item:
+                item.unset_parent()
+
+        setattr(owner, self._slot, mapping or None)
+        for item in items:
+            if old.get(item.name) is not item:
+                item.set_parent(owner)
+        owner.mark_dirty()
+
+
+class _CompositionList(_ListView):
+    """The reference, payload, inherit, variant set or API schema lists of a prim"""
+    __slots__ = ()
+
+    def _replace(self, iterables):
+        for iterable in iterables:
+            if not isinstance(iterable, Iterable):
+                raise TypeError("{!r} is not an Iterable".format(iterable))
+        setattr(self._owner, self._slot, iterables or None)
+        self._owner.mark_dirty()
+
+
+# Declares the metaclass in a way that works for both Python 2 and 3
+_DataBase = _DataType('_DataBase', (object,), {'__slots__': ()})
+
+
+class AbstractData(_DataBase):
+    """Base class for all our primitives
+
+    Nodes use __slots__ and only create their containers (children, properties,
+    attributes and keyframes) the first time something is added to them, since large
+    stages hold millions of nodes that mostly leave them empty.
+    """
+    __slots__ = (
+        'level', '_name', '_value', 'parent', 'was_set', '_as_type', '_path',
+        '_children', '_properties', '_attributes', '_keyframes', '__weakref__'
+    )
+    as_type = _TypeName()
+    _default_as_type = None
 
     def __init__(self, *args, **kwargs):
         super(AbstractData, self).__init__()
         self.level = 0
-        self.children = []
-        self.properties = []
-        self.attributes = []
         self.was_set = False
-        self.name = None
-        self.value = None
         self.parent = None
-        self.keyframes = {}
+        self._path = None
+        self._name = None
+        self._value = None
+        self._as_type = None
+        self._children = None
+        # Properties and attributes are indexed by name so they can be found in constant
+        # time, while still being written out in the order they were added
+        self._properties = None
+        self._attributes = None
+        self._keyframes = None
+
+    @property
+    def name(self):
+        """The name of this object"""
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self.mark_dirty()
+        # Nothing can have cached or indexed this object's path until path() is called
+        if self._path is None:
+            self._name = name
+            return
 
-    def indent(self, level=None):
-        """Returns the indentation string"""
+        stage = self._stage()
+        if stage is not None and isinstance(self, Prim):
+            stage._unindex_prims(self)
+
+        self._name = name
+        self._invalidate_path()
+
+        if stage is not None and isinstance(self, Prim):
+            stage._index_prims(self)
+
+    @property
+    def value(self):
+        """The value of this object
+
+        Values read from a usdc file, or lazily from a usda file, are only loaded from it
+        the first time they're used.
+        """
+        value = self._value
+        if type(value) is LazyValue:
+            value = self._value = value.load()
+        return value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self.mark_dirty()
+
+    @property
+    def children(self):
+        """The child prims of this object, as a live list. Prims added to it are parented
+        to the object as they are by add_child
+        """
+        return _ChildList(self, '_children')
+
+    @children.setter
+    def children(self, prims):
+        _ChildList(self, '_children')[:] = prims
+
+    @property
+    def keyframes(self):
+        """The time samples of this object keyed by frame
+
+        This is a dict when keyframes are set one at a time, or a columnar TimeSamples
+        mapping when they were set in bulk with set_keyframes or read from a file.
+        """
+        keyframes = self._keyframes
+        if keyframes is None:
+            return _EMPTY_MAPPING
+        if type(keyframes) is LazyValue:
+            keyframes = self._keyframes = keyframes.load()
+        return keyframes
+
+    @property
+    def properties(self):
+        """The properties of this object in the order they were added, as a live list.
+        Their names have to be unique
+        """
+        return _NamedList(self, '_properties')
+
+    @properties.setter
+    def properties(self, properties):
+        _NamedList(self, '_properties')[:] = properties
+
+    @property
+    def attributes(self):
+        """The attributes of this object in the order they were added, as a live list.
+        Their names have to be unique
+        """
+        return _NamedList(self, '_attributes')
+
+    @attributes.setter
+    def attributes(self, attributes):
+        _NamedList(self, '_attributes')[:] = attributes
+
+    def iter_properties(self):
+        """Iterate over the properties without copying them into a list"""
+        if self._properties is None:
+            return iter(())
+        return iter(self._properties.values())
+
+    def iter_attributes(self):
+        """Iterate over the attributes without copying them into a list"""
+        attributes = self._loaded_attributes()
+        if attributes is None:
+            return iter(())
+        return iter(attributes.values())
+
+    def _loaded_attributes(self):
+        """Return the attributes keyed by name, or None if there aren't any
+
+        The attributes of objects read lazily from a usda file are only parsed the first
+        time they're used.
+        """
+        attributes = self._attributes
+        if type(attributes) is LazyValue:
+            attributes = self._attributes = attributes.load()
+            for attr in attributes.values():
+                attr.set_parent(self)
+        return attributes
+
+    def indent(self, level=None, options=None):
+        """Returns the indentation string, which is empty when writing compact output"""
+        if options is not None and options.compact:
+            return ''
         if level is None:
             level = self.level
         return indentation(level)
 
     def lines(self, indent=0):
         """Create the lines required to write out"""
+        return list(self.iter_lines(indent=indent))
+
+    def iter_lines(self, indent=0, options=None):
+        """Yield the lines required to write out, one chunk at a time.
+
+        Subclasses extend this as a generator so that large hierarchies can be
+        written out without ever holding the full document in memory.
+        """
         self.level = indent
-        return []
+        return iter(())
+
+    def write_specs(self, writer, path=(), options=None):
+        """Add the specs of this object and everything below it to a crate writer
+
+        This is the binary counterpart of iter_lines.
+
+        Args:
+            writer (CrateWriter): The writer of the usdc file
+            path (tuple): The path elements of this object's parent
+            options (SaveOptions): Settings for how the stage is written
+
+        """
+        raise NotImplementedError(
+            "{} cannot be written to a usdc file".format(type(self).__name__)
+        )
 
     def formatted_name(self):
         name = self.name
@@ -68,7 +979,7 @@ class AbstractData(object):
 
         return name
 
-    def formatted_value(self, frame=None):
+    def formatted_value(self, frame=None, options=None):
         if frame is None:
             value = self.value
         elif frame in self.keyframes:
@@ -76,10 +987,29 @@ class AbstractData(object):
         else:
             raise KeyError("No keyframe value for frame: {}".format(frame))
 
-        return formatted_value(value, array=self.as_type and '[' in self.as_type)
-
-
+        return self.format_value(value, options=options)
+
+    def format_value(self, value, options=None):
+        """Format a value, or the value of a time sample, as this object's type"""
+        start = _clock() if _hooks else None
+        text = formatted_value(
+            value,
+            # Relationships with several targets are written as a list of paths
+            array=self.as_type and ('[' in self.as_type or self.as_type == 'rel'),
+            as_type=self.as_type,
+            sep=', ' if options is None else options.separator,
+            precision=self._precision(options)
+        )
+        if start is not None:
+            _emit_span('attribute.format', start, {
+                'type': self.as_type, 'elements': _element_count(value, self.as_type)
+            })
+        return text
 
+    def _precision(self, options=None):
+        """The precision policy used to write this object's floating point values"""
+        if options is not None:
+            return options.precision
 
     def set_value(self, value):
         self.was_set = True
@@ -90,30 +1020,93 @@ class AbstractData(object):
         self.value = None
 
     def set_parent(self, parent):
+        self.unset_parent()
         self.parent = weakref.proxy(parent)
+        # A detached subtree may have cached its paths from before it had this parent
+        self._invalidate_path()
+        self.mark_dirty()
 
     def unset_parent(self):
+        if self.parent is not None:
+            self.mark_dirty()
+            stage = self._stage()
+            if stage is not None and isinstance(self, Prim):
+                stage._unindex_prims(self)
+            self._invalidate_path()
+
         self.parent = None
 
-    def path(self):
-        tokens = []
-        node = self
+    def mark_dirty(self):
+        """Drop the text that incremental saves kept for the prim this object is part of
+
+        The prim is the object itself, or the prim that holds it if it's an attribute or
+        property. This is done whenever something is changed through aud's methods, and
+        only needs to be called after changing plain attributes like is_over or
+        is_uniform directly.
+
+        Changes made to a buffer value in place, e.g. assigning to the elements of an
+        array.array or NumPy array that was set as a value, can't be detected either,
+        and need this to be called before the next incremental save.
+        """
+        if not _keeping_text:
+            return
 
-        while node:
-            tokens.append(node.name)
+        node = self
+        while node is not None and not isinstance(node, Prim):
             node = node.parent
-            if not node:
-                tokens.append('/')
+        if node is not None:
+            node._text = None
 
-        tokens = [t for t in tokens[::-1] if t]
-        path = os.path.join(*tokens)
+    def path(self):
+        """Return the path of this object in the hierarchy
+
+        The path is cached, and is invalidated for the whole subtree whenever the object
+        is renamed or moved under a different parent.
+        """
+        if self._path is not None:
+            return self._path
+
+        if self.parent is None:
+            path = '/'
+        else:
+            path = self.parent.path()
+
+        if self.name:
+            path = '{}{}'.format(path if path.endswith('/') else path + '/', self.name)
+
+        self._path = path
         return path
 
+    def _invalidate_path(self):
+        """Clear the cached paths of this object and everything below it"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            # Descendants only cache a path after their parent has, so stop early
+            if node._path is None:
+                continue
+
+            node._path = None
+            stack.extend(node.children)
+            # Attributes that haven't been parsed yet haven't cached a path either
+            if type(node._attributes) is not LazyValue:
+                stack.extend(node.iter_attributes())
+            stack.extend(node.iter_properties())
+
+    def _stage(self):
+        """Return the stage at the root of this object's hierarchy, if there is one"""
+        node = self
+        while node.parent is not None:
+            node = node.parent
+
+        if isinstance(node, Stage):
+            return node
+
     def set_property(self, prop, value):
         prop_obj = self.get_property(prop, defaults=True)
         if not prop_obj:
             prop_obj = self.add_property(prop)
-        elif prop_obj not in self.properties:
+        elif self.get_property(prop_obj.name) is not prop_obj:
             prop_obj = self.add_property(prop_obj)
 
         prop_obj.set_value(value)
@@ -123,71 +1116,84 @@ class AbstractData(object):
         attr_obj = self.get_attribute(attr, defaults=True)
         if not attr_obj:
             attr_obj = self.add_attribute(attr, as_type=as_type, is_uniform=is_uniform)
-        elif attr_obj not in self.attributes:
+        elif self.get_attribute(attr_obj.name) is not attr_obj:
             attr_obj = self.add_attribute(attr_obj)
 
-        attr_obj.set_value(value)
         if as_type is not None:
             attr_obj.as_type = as_type
         if is_uniform is not None:
             attr_obj.is_uniform = is_uniform
+        attr_obj.set_value(value)
         return attr_obj
 
     def get_property(self, name, defaults=False):
-        for prop in self.properties:
-            if name == prop.name:
+        if self._properties is not None:
+            prop = self._properties.get(name)
+            if prop is not None:
                 return prop
 
         if not defaults:
             return
 
-        for cls in self._class_inheritence():
-            for k, v in cls.__dict__.items():
-                if not isinstance(v, Property):
-                    continue
-
-                if name == v.name:
-                    prop = Property(
-                        name=v.name,
-                        value=v.value,
-                        values=v.values
-                    )
-
-                    return prop
+        start = _clock() if _hooks else None
+        v = self._schema_defaults()[1].get(name)
+        if v is None:
+            prop = None
+        else:
+            prop = Property(
+                name=v.name,
+                value=v.value,
+                values=v.values
+            )
+
+        if start is not None:
+            _emit_span('schema.default', start, {
+                'kind': 'property', 'class': type(self).__name__
+            })
+        return prop
 
     def get_attribute(self, name, defaults=False):
-        for attr in self.attributes:
-            if name == attr.name:
+        attributes = self._loaded_attributes()
+        if attributes is not None:
+            attr = attributes.get(name)
+            if attr is not None:
                 return attr
 
         if not defaults:
             return
 
-        for cls in self._class_inheritence():
-            for k, v in cls.__dict__.items():
-                if not isinstance(v, Attribute):
-                    continue
-
-                if name == v.name:
-                    attr = Attribute(
-                        name=v.name,
-                        value=v.value,
-                        is_uniform=v.is_uniform,
-                        as_type=v.as_type,
-                        allowedTokens=v.allowed_tokens
-                    )
-
-                    return attr
+        start = _clock() if _hooks else None
+        v = self._schema_defaults()[0].get(name)
+        if v is None:
+            attr = None
+        else:
+            attr = Attribute(
+                name=v.name,
+                value=v.value,
+                is_uniform=v.is_uniform,
+                as_type=v.as_type,
+                docstring=v._docstring,
+                allowedTokens=v.allowed_tokens
+            )
+
+        if start is not None:
+            _emit_span('schema.default', start, {
+                'kind': 'attribute', 'class': type(self).__name__
+            })
+        return attr
 
     def add_property(self, prop):
         if not isinstance(prop, Property):
             prop = Property(prop)
 
-        for pr in self.properties:
-            if pr.name == prop.name:
-                return pr
+        if self._properties is None:
+            self._properties = _ordered_dict()
+
+        existing = self._properties.get(prop.name)
+        if existing is not None:
+            return existing
 
-        self.properties.append(prop)
+        self._properties[prop.name] = prop
         prop.set_parent(self)
         return prop
 
@@ -195,73 +1201,1289 @@ class AbstractData(object):
         if not isinstance(attr, Attribute):
             attr = Attribute(name=attr, value=value, as_type=as_type, is_uniform=is_uniform)
 
-        for at in self.attributes:
-            if at.name == attr.name:
-                return at
+        if self._loaded_attributes() is None:
+            self._attributes = _ordered_dict()
+
+        existing = self._attributes.get(attr.name)
+        if existing is not None:
+            return existing
 
-        self.attributes.append(attr)
+        self._attributes[attr.name] = attr
         attr.set_parent(self)
         return attr
 
     def remove_property(self, prop):
         if isinstance(prop, Property):
-            for i, pr in enumerate(self.properties):
-                if pr.name == prop.name:
-                    return self.properties.pop(i)
+            prop = prop.name
 
-        else:
-            for i, pr in enumerate(self.properties):
-                if pr.name == prop.name:
-                    return self.properties.pop(i)
+        if self._properties is not None:
+            self.mark_dirty()
+            return self._properties.pop(prop, None)
 
     def add_child(self, prim):
         assert isinstance(prim, Prim), "Child must be a primitive"
-        self.children.append(prim)
+        if self._children is None:
+            self._children = []
+        self._children.append(prim)
         prim.set_parent(self)
+
+        stage = self._stage()
+        if stage is not None:
+            stage._index_prims(prim)
         return prim
 
-    def _class_inheritence(self):
-        classes = list(self.__class__.__bases__)
-        classes.append(self.__class__)
+    @classmethod
+    def _class_inheritence(cls):
+        classes = list(cls.__bases__)
+        classes.append(cls)
 
         return classes
 
+    @classmethod
+    def _schema_defaults(cls):
+        """Return the schema attributes and properties of this class, keyed by USD name
+
+        The registry is built once per class on first use, so resolving a schema default
+        is a single dictionary lookup rather than a walk over every class dictionary.
+
+        Returns:
+            tuple(dict, dict): The attributes and properties
+        """
+        registry = cls.__dict__.get('_schema_registry')
+        if registry is not None:
+            return registry
+
+        attributes = {}
+        properties = {}
+        for klass in cls._class_inheritence():
+            for v in klass.__dict__.values():
+                if isinstance(v, Attribute):
+                    attributes.setdefault(v.name, v)
+                elif isinstance(v, Property):
+                    properties.setdefault(v.name, v)
+
+        registry = cls._schema_registry = (attributes, properties)
+        if _hooks:
+            _emit_count('schema.registry', tags={'class': cls.__name__})
+        return registry
+
     def set_keyframe(self, frame, value):
         self.value = None
-        self.keyframes[frame] = value
+        self.mark_dirty()
+        if isinstance(self.keyframes, TimeSamples):
+            self._keyframes.set(frame, value)
+            return
+
+        if self._keyframes is None:
+            self._keyframes = {}
+        self._keyframes[frame] = value
+
+    def set_keyframes(self, frames, values):
+        """Set many time samples at once
+
+        The samples are kept as a sorted column of frames and a column of values rather
+        than one dictionary entry per frame, and buffers are stored without copying them
+        when the frames are already in order.
+
+        Args:
+            frames: A 1-D sequence or buffer of frames
+            values: Either a sequence with one value per frame, or a buffer with the
+                same number of values for every frame, e.g. N x 3 for a double3
+
+        """
+        samples = TimeSamples(frames, values, as_type=self.as_type)
+        self._check_samples(samples)
+
+        self.value = None
+        if self.keyframes:
+            # Merge with the existing samples, letting the new ones win
+            merged = dict(self.keyframes.items())
+            merged.update(samples.items())
+            frames = sorted(merged)
+            samples = TimeSamples(frames, [merged[f] for f in frames])
+
+        self._keyframes = samples
+        self.mark_dirty()
+
+    def _check_samples(self, samples):
+        """Validate time samples before they're set"""
+
+
+def schema_class(type_name):
+    """Return the generated prim class for a USD type name, or Prim if there isn't one
+
+    Only the generated module that defines the type is imported, the first time the type
+    is looked up. A module that fails to import leaves its types to be read as plain prims.
+
+    Args:
+        type_name (str): The type of a prim, e.g. Mesh
+
+    """
+    if not type_name:
+        return Prim
+
+    cls = _schema_classes.get(type_name)
+    if cls is None:
+        cls = Prim
+        name = SCHEMA_TYPES.get(type_name)
+        if name is not None:
+            try:
+                module = importlib.import_module('.' + SCHEMA_MODULES[name], __package__)
+            except (ImportError, SyntaxError):
+                pass
+            else:
+                cls = getattr(module, name, Prim)
+        _schema_classes[type_name] = cls
+    return cls
+
+
+def _read_field(reader, fields, name, default=None):
+    """Read a field of a spec in a usdc file, or return default if the spec has none"""
+    rep = fields.get(name)
+    if rep is None:
+        return default
+    return reader.value(rep)
+
+
+def _read_metadata(obj, reader, fields, handled):
+    """Set the fields of a spec read from a usdc file as properties of an object
+
+    Fields that aud handles itself are left out, as are values like dictionaries that
+    it can't represent.
+    """
+    for name, rep in fields.items():
+        if name in handled or not reader.readable(rep):
+            continue
+
+        value = reader.value(rep)
+        if not isinstance(value, dict):
+            obj.set_property(name, value)
+
+
+def _read_prim(reader, name, fields):
+    """Create a prim from the fields of its spec in a usdc file"""
+    specifier = _read_field(reader, fields, 'specifier', 0)
+    as_type = _read_field(reader, fields, 'typeName')
+    prim = schema_class(as_type)(
+        name,
+        is_class=specifier == SPECIFIERS['class'],
+        is_over=specifier == SPECIFIERS['over'],
+        as_type=as_type or None
+    )
+
+    for field, list_name in _LIST_OP_FIELDS:
+        rep = fields.get(field)
+        if rep is None or not reader.readable(rep):
+            continue
+
+        for mode, items in reader.value(rep).items():
+            if mode not in Iterable.modes:
+                continue
+
+            iterable = Iterable(list_name, mode=mode)
+            for item in items:
+                if field in ('references', 'payload'):
+                    asset, path = item
+                    iterable.append(IterObject(asset or None, object_name=path,
+                                               is_file=bool(asset)))
+                elif field == 'inheritPaths':
+                    iterable.append(IterObject(object_name=item))
+                else:
+                    iterable.append(IterObject(item))
+
+            prim.add_list(iterable)
+
+    _read_metadata(prim, reader, fields, _PRIM_FIELDS)
+    return prim
+
+
+def _read_attribute(reader, name, spec_type, fields):
+    """Create an attribute from the fields of its spec in a usdc file
+
+    Default values and time samples that aren't stored in their ValueRep are left in the
+    file until they're first used.
+    """
+    if spec_type == SPEC_RELATIONSHIP:
+        lists = _read_field(reader, fields, 'targetPaths', {})
+        targets = lists.get(None)
+        if targets is None:
+            targets = [path for mode in ('prepend', 'add', 'append')
+                       for path in lists.get(mode, ())]
+
+        targets = [IterObject(object_name=target) for target in targets]
+        attr = Attribute(name, as_type='rel')
+        attr.set_value(targets[0] if len(targets) == 1 else targets)
+    else:
+        attr = Attribute(
+            name,
+            as_type=_read_field(reader, fields, 'typeName'),
+            is_uniform=_read_field(reader, fields, 'variability', 0) == 1
+        )
+
+        samples = fields.get('timeSamples')
+        default = fields.get('default')
+        if samples is not None and reader.readable(samples):
+            attr.was_set = True
+            attr._keyframes = reader.lazy(samples)
+        elif default is not None and reader.readable(default):
+            attr.was_set = True
+            attr.value = reader.lazy(default)
+
+    _read_metadata(attr, reader, fields, _ATTRIBUTE_FIELDS)
+    return attr
+
+
+def _flush(fileobj, buffered, size):
+    """Write buffered chunks of text to a file"""
+    if not _hooks:
+        fileobj.write(''.join(buffered))
+        return
+
+    start = _clock()
+    fileobj.write(''.join(buffered))
+    _emit_span('io.flush', start, {'characters': size})
+
+
+def _iter_child_lines(child, indent, options):
+    """Yield the lines of a child prim, or its text if it has already been written"""
+    if options is not None and options.subtrees is not None:
+        text = options.subtrees.get(id(child))
+        if text is not None:
+            return iter((text,))
+    return _stand_in(child, options).iter_lines(indent=indent, options=options)
+
+
+def _stand_in(child, options):
+    """Return the prim that's written in place of a child, which is usually the child"""
+    if options is None or options.stand_ins is None:
+        return child
+    return options.stand_ins.get(id(child), child)
+
+
+# Roughly how many characters each kind of scalar is written as in usda. Estimates use
+# these rather than formatting anything: doubles and floats written in full, floats
+# written as float32, and integers
+_DOUBLE_CHARS = 18
+_FLOAT32_CHARS = 10
+_INT_CHARS = 5
+
+# Roughly how many characters the declaration of a prim and of an attribute take in
+# usda, besides their names, types and indentation
+_PRIM_CHARS = 24
+_ATTRIBUTE_CHARS = 6
+
+# Roughly how many bytes the specs, fields and paths of a prim and of an attribute take
+# in a usdc file, and each integer of a compressed array
+_CRATE_PRIM_BYTES = 64
+_CRATE_ATTRIBUTE_BYTES = 48
+_CRATE_COMPRESSED_INT_BYTES = 2
+
+
+def _scalar_chars(code, precision):
+    """Return roughly how many characters a scalar is written as in usda"""
+    if code not in FLOAT_CODES:
+        return _INT_CHARS
+    if precision == FLOAT32 and code != 'd':
+        return _FLOAT32_CHARS
+    if isinstance(precision, int) and not isinstance(precision, bool):
+        # A sign, a decimal point and sometimes an exponent besides the digits
+        return precision + 6
+    return _DOUBLE_CHARS
+
+
+def _value_stats(value, as_type, precision=None):
+    """Estimate the size of a value without formatting it
+
+    Returns:
+        tuple: The number of elements, the bytes it takes in memory, the characters it's
+            written as in usda, the number of separators between its scalars, which
+            compact usda writes a character shorter, and the bytes it takes in usdc
+
+    """
+    if value is None:
+        return 0, 0, 0, 0, 0
+
+    code = type_code(as_type)
+    width = type_width(as_type) or 1
+    if isinstance(value, str):
+        size = len(value)
+        return 1, sys.getsizeof(value), size + 2, 0, size + 8
+
+    buf = as_buffer(value, as_type) if code else None
+    if buf is not None:
+        scalars = len(buf)
+        memory = max(sys.getsizeof(value), scalars * buf.itemsize)
+    elif isinstance(value, (list, tuple)):
+        first = value[0] if value else None
+        if isinstance(first, str):
+            size = sum(len(item) for item in value)
+            return (len(value), sys.getsizeof(value) + size, size + 4 * len(value),
+                    len(value), size + 4 * len(value))
+
+        # Elements are assumed to be the same size as the first one
+        element = sys.getsizeof(first) if first is not None else 0
+        if isinstance(first, (list, tuple)):
+            element += sum(sys.getsizeof(item) for item in first)
+            scalars = len(value) * len(first)
+            first = first[0] if first else None
+        else:
+            scalars = len(value)
+        memory = sys.getsizeof(value) + element * len(value)
+    else:
+        scalars = 1
+        memory = sys.getsizeof(value)
+        first = value
+
+    # Python ints are written as they are, even when the type is a float
+    if buf is None and isinstance(first, int) and not isinstance(first, bool):
+        scalar_chars = _INT_CHARS
+    else:
+        scalar_chars = _scalar_chars(code, precision)
+
+    elements = max(scalars // width, 1) if scalars else 0
+    separators = max(scalars - 1, 0)
+    chars = scalars * scalar_chars + 2 * separators + 2
+    if width > 1:
+        chars += 2 * elements
+
+    if code in ('i', 'I', 'q', 'Q') and width == 1 and scalars >= MIN_COMPRESSED_ARRAY_SIZE:
+        crate = scalars * _CRATE_COMPRESSED_INT_BYTES
+    else:
+        crate = scalars * (struct.calcsize(code) if code else 8)
+    return elements, memory, chars, separators, crate
+
+
+def _attribute_stats(attr, precision=None):
+    """Estimate the size of the value or time samples of an attribute
+
+    Returns:
+        tuple: The number of elements, the number of time samples, and the memory, usda,
+            separator and usdc sizes of _value_stats, summed over the samples
+
+    """
+    if not attr.keyframes:
+        elements, memory, chars, separators, crate = _value_stats(
+            attr.value, attr.as_type, precision
+        )
+        return elements, 0, memory, chars, separators, crate
+
+    keyframes = attr.keyframes
+    samples = len(keyframes)
+    if isinstance(keyframes, TimeSamples):
+        frames = keyframes.frames
+        if keyframes.width is None:
+            # The values are one Python object per sample
+            values = [keyframes.values[0]]
+        else:
+            values = keyframes.values[:keyframes.width]
+        memory = sys.getsizeof(keyframes) + sys.getsizeof(frames) - sys.getsizeof(values)
+        if keyframes.width is not None:
+            memory += max(sys.getsizeof(keyframes.values),
+                          len(keyframes.values) * keyframes.values.itemsize)
+        frame = frames[0]
+        first = values if keyframes.width is not None else values[0]
+    else:
+        # The samples are assumed to be the same size as the first one
+        frame, first = next(iter(keyframes.items()))
+        memory = sys.getsizeof(keyframes) + samples * sys.getsizeof(frame)
+
+    elements, value_memory, chars, separators, crate = _value_stats(
+        first, attr.as_type, precision
+    )
+    if not isinstance(keyframes, TimeSamples) or keyframes.width is None:
+        memory += value_memory * samples
+    # The frame, its colon and the comma after the value, on a line of their own
+    chars = (chars + len(str(_frame_text(frame))) + 4) * samples
+    return (elements * samples, samples, memory, chars, (separators + 1) * samples,
+            (crate + 16) * samples)
+
+
+def _frame_text(frame):
+    """Return a frame as it's written, where whole frames don't have a decimal point"""
+    return int(frame) if float(frame).is_integer() else frame
+
+
+def _estimated_size(prim):
+    """Return roughly how many characters a prim is written as, without its children"""
+    attributes = prim._attributes
+    if type(attributes) is LazyValue and attributes.rep[0] == 'attributes':
+        # Prims read lazily from usda already know how much text their attributes are
+        return _PRIM_CHARS + sum(end - start for start, end in attributes.rep[1])
+
+    size = _PRIM_CHARS + len(prim.name) + len(prim.as_type or '')
+    for attr in prim.iter_attributes():
+        size += (_ATTRIBUTE_CHARS + len(attr.name) + len(attr.as_type or '')
+                 + _attribute_stats(attr)[3])
+    return size
+
+
+# The subtrees that the worker processes of a parallel write are writing. Workers are
+# forked, so they inherit the stage rather than having it pickled and sent to them
+_subtree_jobs = None
+
+
+def _write_subtree(index):
+    """Write one of the subtrees of a parallel write in a worker process
+
+    Returns:
+        tuple: The index of the subtree, its text and the samples it reduced
+
+    """
+    node, indent, options = _subtree_jobs[index]
+    node = _stand_in(node, options)
+    return index, ''.join(node.iter_lines(indent=indent, options=options)), options.reduced
+
+
+def _is_transform(attr):
+    """Return True if an attribute is one of the transform ops of its prim"""
+    return attr.name.startswith('xformOp')
+
+
+def _digest_value(digest, value, as_type):
+    """Add a value to a hash, reading buffers as their raw bytes
+
+    Returns:
+        int: The number of bytes of the value that were hashed
+
+    """
+    buf = as_buffer(value, as_type)
+    if buf is None:
+        data = repr(value).encode('utf-8')
+        digest.update(data)
+        return len(data)
+
+    digest.update(repr(getattr(buf, 'dtype', None) or getattr(buf, 'typecode', None)
+                       or buf.format).encode('utf-8'))
+    digest.update(buf)
+    return len(buf) * buf.itemsize
+
+
+def _geometry_digest(prim):
+    """Hash the type of a prim and all of its attributes that aren't transforms
+
+    Returns:
+        tuple: The hex digest and the number of bytes of values that were hashed
+
+    """
+    # Imported here, like multiprocessing, to keep importing aud quick
+    import hashlib
+
+    digest = hashlib.sha1(repr(prim.as_type).encode('utf-8'))
+    size = 0
+    for attr in prim.iter_attributes():
+        if _is_transform(attr):
+            continue
+
+        digest.update(repr((
+            attr.name, attr.as_type, attr.is_uniform, attr.was_set,
+            [(prop.name, prop.value) for prop in attr.iter_properties()]
+        )).encode('utf-8'))
+        if attr.keyframes:
+            for frame, value in sorted(attr.keyframes.items(), key=lambda item: item[0]):
+                digest.update(repr(frame).encode('utf-8'))
+                size += _digest_value(digest, value, attr.as_type)
+        else:
+            size += _digest_value(digest, attr.value, attr.as_type)
+    return digest.hexdigest(), size
+
+
+# The layers that the worker processes of save_layers are writing, inherited when forked
+_layer_jobs = None
+
+
+def _save_layer(index):
+    """Save one of the layers split out of a stage in a worker process
+
+    Returns:
+        dict: The time samples that the layer reduced
+
+    """
+    layer, location, kwargs = _layer_jobs[index]
+    return layer.save(location, **kwargs)
+
+
+def _fork_context():
+    """Return the multiprocessing context that forks its workers, or None if there isn't one"""
+    if not hasattr(os, 'fork'):
+        return
+
+    # Imported here since it takes a good part of the time of importing aud, and only
+    # saving in parallel needs it
+    import multiprocessing
+
+    # Python 2 always forks
+    get_context = getattr(multiprocessing, 'get_context', None)
+    return multiprocessing if get_context is None else get_context('fork')
+
+
+class _WrittenSubtrees(object):
+    """The text of the subtrees written by worker processes, as SaveOptions.subtrees
+
+    Args:
+        indices (dict): The index of each subtree, keyed by the id of its prim
+        results: An iterator over the results of _write_subtree
+        reduced (dict): Where the samples reduced by the workers are gathered
+    """
+
+    def __init__(self, indices, results, reduced):
+        super(_WrittenSubtrees, self).__init__()
+        self.indices = indices
+        self.results = results
+        self.reduced = reduced
+        self._pending = {}
+
+    def get(self, key):
+        index = self.indices.get(key)
+        if index is None:
+            return
+
+        while index not in self._pending:
+            result_index, text, reduced = next(self.results)
+            self._pending[result_index] = text
+            self.reduced.update(reduced)
+        return self._pending.pop(index)
+
+
+def _separated(lines, compact=False):
+    """Yield the lines of a statement, followed by the newline that separates it
+
+    Readable output always adds the newline, leaving a blank line after statements
+    that already end with one, while compact output only adds it when it's needed.
+    """
+    line = '\n'
+    for line in lines:
+        yield line
+
+    if not (compact and line.endswith('\n')):
+        yield '\n'
 
 
 class Stage(AbstractData):
     """Represents the main USD stage that contains all the elements"""
+    __slots__ = ('_prim_index', 'precision')
 
-    def save(self, location):
-
-        # Always force a usda extension
+    def __init__(self, *args, **kwargs):
+        super(Stage, self).__init__(*args, **kwargs)
+        self._prim_index = {}
+        self.precision = None
+
+    @classmethod
+    def read_crate(cls, location):
+        """Read a binary usdc file into a new stage
+
+        The file is memory mapped and only its tables are read here. Values that aren't
+        stored in their ValueRep, like arrays and time samples, are read from the map the
+        first time they're used. Fields that aud can't represent, like dictionaries, are
+        skipped.
+
+        Args:
+            location (str): The usdc file to read
+
+        Returns:
+            Stage: The stage
+
+        """
+        reader = CrateReader(location)
+        stage = cls()
+
+        fields = reader.specs.get((), (SPEC_PSEUDO_ROOT, {}))[1]
+        _read_metadata(stage, reader, fields, _STAGE_FIELDS)
+
+        pending = [(stage, (), fields)]
+        while pending:
+            parent, path, fields = pending.pop()
+
+            if isinstance(parent, Prim):
+                for name in _read_field(reader, fields, 'properties', ()):
+                    spec = reader.specs.get(path + ('.' + name,))
+                    if spec is not None:
+                        parent.add_attribute(_read_attribute(reader, name, *spec))
+
+            for name in _read_field(reader, fields, 'primChildren', ()):
+                spec = reader.specs.get(path + (name,))
+                if spec is not None:
+                    prim = parent.add_child(_read_prim(reader, name, spec[1]))
+                    pending.append((prim, path + (name,), spec[1]))
+
+            for name in _read_field(reader, fields, 'variantSetChildren', ()):
+                variant_set = parent.add_child(VariantSet(name))
+                set_fields = reader.specs.get(path + ('{{{}=}}'.format(name),), (None, {}))[1]
+
+                # Variants are named by their selection on the prim that holds the set
+                for variant_name in _read_field(reader, set_fields, 'variantChildren', ()):
+                    variant_path = path + ('{{{}={}}}'.format(name, variant_name),)
+                    spec = reader.specs.get(variant_path, (None, {}))
+                    variant = variant_set.add_child(Variant(variant_name))
+                    pending.append((variant, variant_path, spec[1]))
+
+        return stage
+
+    def get_prim_at_path(self, path):
+        """Return the prim at the given path, or None if there isn't one
+
+        Args:
+            path (str): The absolute path of the prim, e.g. /root/geo
+
+        """
+        return self._prim_index.get(path)
+
+    def _index_prims(self, prim):
+        """Add a prim and all the prims below it to the path index"""
+        stack = [prim]
+        while stack:
+            node = stack.pop()
+            self._prim_index[node.path()] = node
+            stack.extend(node.children)
+
+    def _unindex_prims(self, prim):
+        """Remove a prim and all the prims below it from the path index"""
+        stack = [prim]
+        while stack:
+            node = stack.pop()
+            path = node.path()
+            if self._prim_index.get(path) is node:
+                del self._prim_index[path]
+            stack.extend(node.children)
+
+    def save(self, location, reduce_tolerance=None, compact=False, precision=None,
+             workers=None, incremental=False):
+        """Write the stage out to disk
+
+        Args:
+            location (str): The file to write to. Files ending in .usdc or .usd are
+                written in the binary crate format, files ending in .usdz are written as
+                a package (see write_usdz), and anything else as usda
+            reduce_tolerance (float): If given, drop the time samples that are constant
+                or linear within this tolerance. See SaveOptions
+            compact (bool): Write without indentation or blank lines. See SaveOptions
+            precision: Overrides the precision set on the stage for this save
+            workers (int): The number of processes to write usda files with. See
+                iter_chunks
+            incremental (bool): Keep the text of the prims in usda files, so that the
+                next incremental save only formats the prims that changed. See
+                SaveOptions
+
+        Returns:
+            dict: The number of time samples dropped per attribute path, if any were
+                reduced
+
+        """
+        options = SaveOptions(
+            reduce_tolerance=reduce_tolerance,
+            compact=compact,
+            precision=self.precision if precision is None else precision,
+            incremental=incremental
+        )
+        return self._write_file(location, options, workers)
+
+    def _write_file(self, location, options, workers=None):
+        """Write the stage to a file in the format that its extension asks for"""
+        if not _hooks:
+            return self._write_format(location, options, workers)
+
+        ext = os.path.splitext(location)[1]
+        start = _clock()
+        try:
+            return self._write_format(location, options, workers)
+        finally:
+            _emit_span('save', start, {
+                'format': ext[1:] if ext in CRATE_EXTENSIONS + (USDZ_EXTENSION,) else 'usda'
+            })
+
+    def _write_format(self, location, options, workers=None):
         base, ext = os.path.splitext(location)
+        if ext == USDZ_EXTENSION:
+            with open(location, 'w+b') as f:
+                self.write_usdz(f, '{}.usdc'.format(os.path.basename(base)),
+                                asset_directory=os.path.dirname(location), options=options)
+            return options.reduced
+
+        if ext in CRATE_EXTENSIONS:
+            with open(location, 'wb') as f:
+                self.write_crate(f, options=options)
+            return options.reduced
+
+        # Anything that isn't binary is written as usda
         location = '{}.usda'.format(base)
 
         with open(location, 'w') as f:
-            f.writelines(self.lines())
+            self.write_to(f, options=options, workers=workers)
+
+        return options.reduced
+
+    def save_layers(self, location, depth=None, types=None, min_size=None, arc='payload',
+                    workers=None, reduce_tolerance=None, compact=False, precision=None):
+        """Save the stage with some of its subtrees split out into layers of their own
+
+        Each split prim is saved to its own layer next to the root layer, named after the
+        root layer and the path of the prim, e.g. shot.root.geo.usda for /root/geo in
+        shot.usda. The root layer keeps the prim, with its metadata but without its
+        attributes or children, and loads the layer with a payload or a reference.
+
+        Args:
+            location (str): The root layer to write. Layers use the same format as it,
+                and usdz packages can't be split
+            depth (int): Split the prims at this depth, where 1 is the root prims
+            types: A prim class, or tuple of them, to split, e.g. audGeom.Mesh
+            min_size (int): Split the smallest subtrees that are estimated to be written
+                as at least this many characters of usda
+            arc (str): Load the layers with a 'payload', so that they can be deferred, or
+                with 'references'
+            workers (int): The number of processes that write the layers, while the
+                main process writes the root layer
+            reduce_tolerance (float): See save
+            compact (bool): See save
+            precision: See save
+
+        Returns:
+            dict: The layer written for each split prim, keyed by the path of the prim
+
+        """
+        global _layer_jobs
+
+        if arc not in ('payload', 'references'):
+            raise ValueError("{} is not a valid arc, use payload or references".format(arc))
 
-    def lines(self, indent=0):
-        lines = super(Stage, self).lines(indent)
+        base, ext = os.path.splitext(location)
+        if ext == USDZ_EXTENSION:
+            raise ValueError("Layers can't be split out of a usdz package")
+        if ext not in CRATE_EXTENSIONS:
+            ext = '.usda'
+            location = base + ext
+
+        options = SaveOptions(
+            reduce_tolerance=reduce_tolerance,
+            compact=compact,
+            precision=self.precision if precision is None else precision
+        )
+        options.stand_ins = {}
+        kwargs = dict(reduce_tolerance=reduce_tolerance, compact=compact,
+                      precision=options.precision)
+
+        layers = _ordered_dict()
+        jobs = []
+        for prim in self._split_prims(depth, types, min_size):
+            path = prim.path()
+            name = '{}.{}{}'.format(os.path.basename(base), path.strip('/').replace('/', '.'), ext)
+            layer_location = os.path.join(os.path.dirname(location), name)
+
+            layer = Stage()
+            for prop in self.iter_properties():
+                if prop.was_set:
+                    layer.set_property(prop.name, prop.value)
+            layer.set_property('defaultPrim', prim.name)
+            # The prim isn't reparented, so it's still found under this stage
+            layer._children = [prim]
+            jobs.append((layer, layer_location, kwargs))
+
+            stand_in = Prim(prim.name, is_class=prim.is_class, is_over=prim.is_over,
+                            as_type=prim.as_type)
+            stand_in._properties = prim._properties
+            arcs = stand_in.add_list(Iterable(arc, mode='prepend'))
+            arcs.append(IterObject('./' + name, object_name='/' + prim.name, is_file=True))
+            options.stand_ins[id(prim)] = stand_in
+            layers[path] = layer_location
+
+        context = _fork_context()
+        if workers is None or workers < 2 or len(jobs) < 2 or context is None:
+            for layer, layer_location, _ in jobs:
+                options.reduced.update(layer.save(layer_location, **kwargs))
+            self._write_file(location, options)
+            return layers
+
+        _layer_jobs = jobs
+        try:
+            pool = context.Pool(min(workers, len(jobs)))
+        finally:
+            # The workers have their own copy by now
+            _layer_jobs = None
+
+        try:
+            results = pool.imap_unordered(_save_layer, range(len(jobs)))
+            self._write_file(location, options)
+            for reduced in results:
+                options.reduced.update(reduced)
+        except BaseException:
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+        return layers
+
+    def _split_prims(self, depth=None, types=None, min_size=None):
+        """Return the prims that save_layers splits out, in the order they're written
+
+        Prims below a split prim, and in variant sets, are never split themselves.
+        """
+        sizes = {}
+        if min_size is not None:
+            stack = [(child, False) for child in self.children]
+            while stack:
+                node, counted = stack.pop()
+                if counted:
+                    sizes[id(node)] = _estimated_size(node) + sum(
+                        sizes[id(child)] for child in node.children
+                    )
+                else:
+                    stack.append((node, True))
+                    stack.extend((child, False) for child in node.children)
+
+        split = []
+        stack = [(child, 1) for child in reversed(self.children)]
+        while stack:
+            node, level = stack.pop()
+            if isinstance(node, VariantSet):
+                continue
+            if ((depth is not None and level == depth)
+                    or (types is not None and isinstance(node, types))
+                    or (min_size is not None and sizes[id(node)] >= min_size and not any(
+                        sizes[id(child)] >= min_size for child in node.children
+                        if not isinstance(child, VariantSet)
+                    ))):
+                split.append(node)
+            else:
+                stack.extend((child, level + 1) for child in reversed(node.children))
+        return split
+
+    def save_deduplicated(self, location, types=None, reduce_tolerance=None, compact=False,
+                          precision=None, workers=None):
+        """Save the stage with prims that have the same geometry sharing a single copy of it
+
+        The attributes of geometry prims, other than their transform ops, are hashed.
+        Each geometry that more than one prim has is written once as a class prim under
+        a /_prototypes class, and the prims that have it are written as instanceable
+        prims that reference it, with only their metadata and transform ops authored.
+        The stage itself isn't changed. Only prims without children, variants or
+        composition arcs of their own are shared.
+
+        Args:
+            location (str): The file to write to. See save
+            types: A prim class, or tuple of them, whose geometry is shared. Defaults to
+                the prims whose type is in GEOMETRY_TYPES
+            reduce_tolerance (float): See save
+            compact (bool): See save
+            precision: See save
+            workers (int): See save
+
+        Returns:
+            DedupeReport: How much geometry was shared
+
+        """
+        report = DedupeReport()
+        groups = _ordered_dict()
+        stack = list(reversed(self.children))
+        while stack:
+            prim = stack.pop()
+            stack.extend(reversed(prim.children))
+            if types is None:
+                if prim.as_type not in GEOMETRY_TYPES:
+                    continue
+            elif not isinstance(prim, types):
+                continue
+            if (prim.children or prim.references or prim.payloads or prim.inherits
+                    or prim.variants or isinstance(prim, (VariantSet, Variant))):
+                continue
+
+            digest, size = _geometry_digest(prim)
+            groups.setdefault(digest, (size, []))[1].append(prim)
+            report.prims += 1
+        report.unique = len(groups)
+
+        names = set(child.name for child in self.children)
+        root_name = PROTOTYPES_NAME
+        while root_name in names:
+            root_name += '_'
+        prototypes = Prim(root_name, is_class=True)
+        prototypes._children = []
+
+        stand_ins = {}
+        for size, prims in groups.values():
+            if len(prims) < 2:
+                continue
+
+            source = prims[0]
+            prototype = Prim('prototype_{}'.format(len(prototypes._children)), is_class=True,
+                             as_type=source.as_type)
+            prototype._attributes = _ordered_dict(
+                (attr.name, attr) for attr in source.iter_attributes() if not _is_transform(attr)
+            )
+            prototypes._children.append(prototype)
+            path = '/{}/{}'.format(root_name, prototype.name)
+
+            for prim in prims:
+                stand_in = Prim(prim.name, is_class=prim.is_class, is_over=prim.is_over,
+                                as_type=prim.as_type)
+                stand_in._properties = _ordered_dict(prim._properties or ())
+                instanceable = Property('instanceable')
+                instanceable.set_value(True)
+                stand_in._properties['instanceable'] = instanceable
+                instanceable.set_parent(stand_in)
+                stand_in._api_schemas = prim._api_schemas
+                stand_in._attributes = _ordered_dict(
+                    (attr.name, attr) for attr in prim.iter_attributes() if _is_transform(attr)
+                )
+                references = stand_in.add_list(Iterable('references', mode='prepend'))
+                references.append(IterObject(object_name=path))
+                stand_ins[id(prim)] = stand_in
+
+            report.prototypes += 1
+            report.instances += len(prims)
+            report.bytes_saved += size * (len(prims) - 1)
+
+        # The prims stay parented to this stage, the written stage only lists them
+        written = Stage()
+        written._properties = self._properties
+        written.precision = self.precision
+        written._children = list(self.children)
+        if prototypes.children:
+            written._children.append(prototypes)
+
+        options = SaveOptions(
+            reduce_tolerance=reduce_tolerance,
+            compact=compact,
+            precision=self.precision if precision is None else precision
+        )
+        options.stand_ins = stand_ins
+        report.reduced = written._write_file(location, options, workers)
+        return report
+
+    def stats(self, precision=None):
+        """Count what's in the stage and estimate how big it is when it's written
+
+        This is a single pass over the hierarchy that only looks at the lengths and types
+        of values, without formatting them, so it's cheap enough to decide how to save a
+        stage with, e.g. whether to split it with save_layers.
+
+        Args:
+            precision: The precision to estimate usda with. Defaults to the precision
+                set on the stage
+
+        Returns:
+            StageStats: The counts and estimates
+
+        """
+        if precision is None:
+            precision = self.precision
+
+        stats = StageStats()
+        memory = sys.getsizeof(self)
+        usda = compact = usdc = _PRIM_CHARS * 2
+        for prop in self.iter_properties():
+            chars = _value_stats(prop.value, prop.as_type)[2] + len(prop.name) + 4
+            usda += chars + 4
+            compact += chars
+            usdc += chars
+
+        stack = [(child, 1) for child in reversed(self.children)]
+        while stack:
+            prim, depth = stack.pop()
+            stats.prims += 1
+            key = type(prim).__name__ if isinstance(prim, (VariantSet, Variant)) else prim.as_type
+            stats.prims_by_type[key] = stats.prims_by_type.get(key, 0) + 1
+            if depth > stats.max_depth:
+                stats.max_depth = depth
+
+            indent = 4 * (depth - 1)
+            chars = _PRIM_CHARS + len(prim.name) + len(prim.as_type or '')
+            usda += chars + 3 * indent
+            compact += chars
+            usdc += _CRATE_PRIM_BYTES + len(prim.name)
+            memory += sys.getsizeof(prim)
+
+            metadata = prim.iter_properties()
+            if (prim._variants or prim._references or prim._payloads or prim._inherits
+                    or prim._api_schemas):
+                metadata = itertools.chain(prim.variants, prim.references, prim.payloads,
+                                           prim.inherits, prim.api_schemas, metadata)
+            for iterable in metadata:
+                if isinstance(iterable, Property):
+                    chars = _value_stats(iterable.value, iterable.as_type)[2]
+                    chars += len(iterable.name) + 4
+                else:
+                    chars = sum(len(obj.value or '') + len(obj.object_name or '') + 6
+                                for obj in iterable) + len(iterable.name) + 16
+                usda += chars + indent + 5
+                compact += chars
+                usdc += chars
+                memory += sys.getsizeof(iterable)
+
+            for attr in prim.iter_attributes():
+                attr_precision = getattr(attr, 'precision', None)
+                elements, samples, value_memory, chars, separators, crate = _attribute_stats(
+                    attr, precision if attr_precision is None else attr_precision
+                )
+                stats.attributes += 1
+                stats.attributes_by_type[attr.as_type] = (
+                    stats.attributes_by_type.get(attr.as_type, 0) + 1
+                )
+                if is_array_type(attr.as_type):
+                    stats.array_elements += elements
+                stats.keyframes += samples
+
+                chars += _ATTRIBUTE_CHARS + len(attr.name) + len(attr.as_type or '')
+                if attr.is_uniform:
+                    chars += 8
+                # Each time sample is on a line of its own
+                usda += chars + indent + 5 + samples * (indent + 4)
+                compact += chars - separators
+                usdc += _CRATE_ATTRIBUTE_BYTES + len(attr.name) + crate
+                memory += sys.getsizeof(attr) + value_memory
+
+            for container in (prim._children, prim._properties, prim._attributes):
+                if container is not None:
+                    memory += sys.getsizeof(container)
+
+            stack.extend((child, depth + 1) for child in reversed(prim.children))
+
+        stats.memory_bytes = memory
+        stats.usda_bytes = usda
+        stats.compact_bytes = compact
+        stats.usdc_bytes = usdc
+        return stats
+
+    def clear_kept_text(self):
+        """Drop the text that incremental saves kept for the prims, to free its memory"""
+        stack = list(self.children)
+        while stack:
+            prim = stack.pop()
+            prim._text = None
+            stack.extend(prim.children)
+
+    def write_crate(self, fileobj, options=None):
+        """Write the stage into an open file object as a binary usdc file
+
+        Args:
+            fileobj: A seekable file object opened for writing bytes
+            options (SaveOptions): Settings for how the stage is written. Only the
+                time sample reduction applies to binary files
+
+        """
+        writer = CrateWriter(fileobj)
+        self.write_specs(writer, options=options)
+        if not _hooks:
+            writer.close()
+            return
+
+        start = _clock()
+        writer.close()
+        _emit_span('io.flush', start, {'format': 'usdc'})
+
+    def write_usdz(self, fileobj, layer_name, asset_directory=None, options=None):
+        """Write the stage into an open file object as a usdz package
+
+        The stage is written as a usdc root layer straight into the package, followed by
+        the files of the assets it uses (see asset_paths), and of the assets that the
+        layers among those use in turn. Assets with absolute paths or URIs are left as
+        they are, pointing outside of the package.
+
+        Args:
+            fileobj: A seekable file object opened for reading and writing bytes
+            layer_name (str): The name of the root layer in the package, e.g. stage.usdc
+            asset_directory (str): The directory that relative asset paths are found in.
+                Defaults to the current directory
+            options (SaveOptions): Settings for how the stage is written
+
+        Returns:
+            list: The names of the files in the package
+
+        Raises:
+            ValueError: If a relative asset path is outside asset_directory or its file
+                doesn't exist. Nothing is written in that case
+
+        """
+        directory = asset_directory or os.curdir
+        assets = package_assets(self.asset_paths(), directory, directory,
+                                packaged=[layer_name])
+
+        writer = UsdzWriter(fileobj)
+        with writer.open_entry(layer_name) as f:
+            self.write_crate(f, options=options)
+
+        for name, location in assets:
+            writer.add_file(name, location)
+
+        writer.close()
+        return writer.names
+
+    def asset_paths(self):
+        """Return the asset paths used by the stage, in the order they're first used
+
+        These are the values and time samples of asset attributes and the files of
+        references and payloads, anywhere in the hierarchy.
+        """
+        paths = _ordered_dict()
+        stack = list(reversed(self.children))
+        while stack:
+            prim = stack.pop()
+            for iterable in itertools.chain(prim.references, prim.payloads):
+                for obj in iterable:
+                    if obj.is_file and obj.value:
+                        paths[obj.value] = None
+
+            for attr in prim.iter_attributes():
+                if attr.as_type not in ('asset', 'asset[]') or not attr.was_set:
+                    continue
+
+                values = ([value for _, value in attr.keyframes.items()] if attr.keyframes
+                          else [attr.value])
+                for value in values:
+                    if isinstance(value, (list, tuple)):
+                        paths.update((path, None) for path in value if path)
+                    elif value:
+                        paths[value] = None
+
+            stack.extend(reversed(prim.children))
+
+        return list(paths)
+
+    def write_to(self, fileobj, buffer_size=WRITE_BUFFER_SIZE, options=None, workers=None):
+        """Stream the stage into an open file object
+
+        Chunks are gathered into a small buffer that is flushed once it grows past
+        buffer_size characters, so peak memory is bounded by the largest single chunk
+        (typically one attribute value) instead of the whole document.
+
+        Args:
+            fileobj: Any object with a write method that accepts strings
+            buffer_size (int): Number of characters to gather before each write
+            options (SaveOptions): Settings for how the stage is written
+            workers (int): The number of processes to write with. See iter_chunks
+
+        """
+        buffered = []
+        size = 0
+        for chunk in self.iter_chunks(options=options, workers=workers):
+            buffered.append(chunk)
+            size += len(chunk)
+            if size >= buffer_size:
+                _flush(fileobj, buffered, size)
+                buffered = []
+                size = 0
+
+        if buffered:
+            _flush(fileobj, buffered, size)
+
+    def iter_chunks(self, options=None, workers=None):
+        """Yield the text of the stage in order without building it up in memory
+
+        Args:
+            options (SaveOptions): Settings for how the stage is written
+            workers (int): If more than one, the hierarchy is split into subtrees that
+                are written by this many forked processes, and their text is joined in
+                order. The text is the same as when it's written by a single process,
+                where the subtrees are only held in memory until they're reached
+
+        """
+        if workers is None or workers < 2:
+            return self.iter_lines(options=options)
+        return self._iter_parallel_chunks(options or SaveOptions(), workers)
+
+    def _iter_parallel_chunks(self, options, workers):
+        global _subtree_jobs
+
+        subtrees = self._parallel_subtrees(workers)
+        context = _fork_context()
+        if len(subtrees) < 2 or context is None:
+            for line in self.iter_lines(options=options):
+                yield line
+            return
 
-        lines.append('#usda 1.0\n')
-        lines.append('(\n')
+        _subtree_jobs = [(node, indent, options.copy()) for node, indent in subtrees]
+        try:
+            pool = context.Pool(min(workers, len(subtrees)))
+        finally:
+            # The workers have their own copy by now
+            _subtree_jobs = None
+
+        indices = dict((id(node), index) for index, (node, _) in enumerate(subtrees))
+        options.subtrees = _WrittenSubtrees(
+            indices, pool.imap(_write_subtree, range(len(subtrees))), options.reduced
+        )
+        try:
+            for line in self.iter_lines(options=options):
+                yield line
+        except BaseException:
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            options.subtrees = None
+            pool.join()
+
+    def _parallel_subtrees(self, workers):
+        """Split the hierarchy into subtrees of similar sizes to write in parallel
+
+        Prims are written whole unless they hold more than their share of the prims in
+        the stage, in which case their children are split up instead. Variant sets and
+        variants are always written whole.
+
+        Returns:
+            list: The prim and the indentation of each subtree, in the order they're
+                written
+
+        """
+        sizes = {}
+        stack = [(child, False) for child in self.children]
+        while stack:
+            node, counted = stack.pop()
+            if counted:
+                sizes[id(node)] = 1 + sum(sizes[id(child)] for child in node.children)
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children)
+
+        total = sum(sizes[id(child)] for child in self.children)
+        share = max(total // (workers * SUBTREES_PER_WORKER), 1)
+
+        subtrees = []
+        stack = [(child, self.level) for child in reversed(self.children)]
+        while stack:
+            node, indent = stack.pop()
+            if (sizes[id(node)] > share and node.children
+                    and not isinstance(node, (VariantSet, Variant))):
+                stack.extend((child, indent + 1) for child in reversed(node.children))
+            else:
+                subtrees.append((node, indent))
+        return subtrees
+
+    def iter_lines(self, indent=0, options=None):
+        for line in super(Stage, self).iter_lines(indent, options=options):
+            yield line
+
+        yield '#usda 1.0\n'
+        yield '(\n'
         self.level += 1
 
-        lines.append('{}"Written by AUD v{}"\n'.format(self.indent(), __version__))
+        yield '{}"Written by AUD v{}"\n'.format(self.indent(options=options), __version__)
 
-        for property in self.properties:
-            lines.extend(property.lines(self.level))
+        for property in self.iter_properties():
+            for line in property.iter_lines(self.level, options=options):
+                yield line
 
         self.level -= 1
-        lines.append(')\n\n')
+        yield ')\n' if options is not None and options.compact else ')\n\n'
 
         for child in self.children:
-            lines.extend(child.lines(self.level))
+            for line in _iter_child_lines(child, self.level, options):
+                yield line
+
+    def write_specs(self, writer, path=(), options=None):
+        fields = [('comment', writer.value('string', 'Written by AUD v{}'.format(__version__)))]
+        fields.extend(prop.crate_field(writer) for prop in self.iter_properties()
+                      if prop.was_set)
+
+        if self.children:
+            fields.append(('primChildren', writer.token_vector(
+                [child.name for child in self.children]
+            )))
 
-        return lines
+        writer.add_spec(path, SPEC_PSEUDO_ROOT, fields)
+
+        for child in self.children:
+            _stand_in(child, options).write_specs(writer, path, options=options)
 
     def set_frame_range(self, start, end):
         self.set_property('startTimeCode', start)
@@ -273,12 +2495,36 @@ class Stage(AbstractData):
     def set_up_axis(self, axis="Y"):
         self.set_property('upAxis', axis.upper())
 
+    def set_precision(self, precision):
+        """Set how floating point attribute values are written out
+
+        Attributes can override this with their own precision.
+
+        Args:
+            precision: One of
+                None or 'double' to write every digit of the value (the default)
+                'float32' to write float and half types with the fewest digits that
+                    read back as the same float32 value, which suits data like
+                    point3f[] that was never more precise than that. Double types
+                    are still written in full
+                An int to write all floating point types with that many
+                    significant digits
+
+        """
+        self.precision = check_precision(precision)
+
 
 class Prim(AbstractData):
     """The basic USD object in the hierarchy"""
+    __slots__ = (
+        'is_class', 'is_over', '_references', '_payloads', '_inherits', '_variants',
+        '_api_schemas', '_text'
+    )
     as_type = None
 
     def __init__(self, name, is_class=False, is_over=False, as_type=None):
+        # The text kept by incremental saves, with what it depends on
+        self._text = None
         super(Prim, self).__init__()
         self.name = name
         self.is_class = is_class
@@ -286,13 +2532,133 @@ class Prim(AbstractData):
 
         self.as_type = as_type or self.as_type
 
-        self.references = []
-        self.inherits = []
-        self.variants = []
+        self._references = None
+        self._payloads = None
+        self._inherits = None
+        self._variants = None
+        self._api_schemas = None
+
+    @property
+    def references(self):
+        """The reference lists of this prim, as a live list"""
+        return _CompositionList(self, '_references')
+
+    @references.setter
+    def references(self, iterables):
+        _CompositionList(self, '_references')[:] = iterables
+
+    @property
+    def payloads(self):
+        """The payload lists of this prim, as a live list"""
+        return _CompositionList(self, '_payloads')
+
+    @payloads.setter
+    def payloads(self, iterables):
+        _CompositionList(self, '_payloads')[:] = iterables
+
+    @property
+    def inherits(self):
+        """The inherit lists of this prim, as a live list"""
+        return _CompositionList(self, '_inherits')
+
+    @inherits.setter
+    def inherits(self, iterables):
+        _CompositionList(self, '_inherits')[:] = iterables
+
+    @property
+    def variants(self):
+        """The variant set lists of this prim, as a live list"""
+        return _CompositionList(self, '_variants')
+
+    @variants.setter
+    def variants(self, iterables):
+        _CompositionList(self, '_variants')[:] = iterables
+
+    @property
+    def api_schemas(self):
+        """The lists of API schemas applied to this prim, as a live list"""
+        return _CompositionList(self, '_api_schemas')
+
+    @api_schemas.setter
+    def api_schemas(self, iterables):
+        _CompositionList(self, '_api_schemas')[:] = iterables
+
+    def add_list(self, iterable):
+        """Add a references, payload, inherits, variantSets or apiSchemas list with its mode
+
+        Args:
+            iterable (Iterable): The list, named after the metadata it sets
+
+        """
+        slot = _LIST_SLOTS.get(iterable.name)
+        if slot is None:
+            raise ValueError("{} is not a list that prims can hold".format(iterable.name))
+
+        lists = getattr(self, slot) or []
+        lists.append(iterable)
+        setattr(self, slot, lists)
+        self.mark_dirty()
+        return iterable
+
+    def iter_lines(self, indent=0, options=None):
+        for line in super(Prim, self).iter_lines(indent=indent, options=options):
+            yield line
+
+        if _hooks:
+            start = _clock()
+            if options is not None and options.incremental:
+                lines = [self._kept_text(options)]
+            else:
+                lines = list(self._iter_own_lines(options))
+            _emit_span('prim.lines', start, {'type': self.as_type})
+            for line in lines:
+                yield line
+        elif options is not None and options.incremental:
+            yield self._kept_text(options)
+        else:
+            for line in self._iter_own_lines(options):
+                yield line
 
-    def lines(self, indent=0):
-        lines = super(Prim, self).lines(indent=indent)
+        compact = options is not None and options.compact
+        self.level += 1
+        for child in self.children:
+            for line in _iter_child_lines(child, self.level, options):
+                yield line
+
+        self.level -= 1
 
+        yield '{}{}}}\n'.format('' if compact else '\n', self.indent(options=options))
+
+    def _kept_text(self, options):
+        """Return the text of this prim up to its children
+
+        The text kept by the last incremental save is reused if nothing has changed since.
+        """
+        key = (self.path(), self.level, options.text_key)
+        if self._text is not None and self._text[0] == key:
+            _, text, reduced = self._text
+            options.reduced.update(reduced)
+            if _hooks:
+                _emit_count('prim.text_reused')
+            return text
+
+        # The samples reduced by the prim's own attributes are kept with its text
+        outer = options.reduced
+        options.reduced = {}
+        try:
+            text = ''.join(self._iter_own_lines(options))
+        finally:
+            reduced, options.reduced = options.reduced, outer
+
+        global _keeping_text
+        _keeping_text = True
+
+        outer.update(reduced)
+        self._text = (key, text, reduced)
+        return text
+
+    def _iter_own_lines(self, options):
+        """Yield the lines of this prim up to its children"""
         tokens = []
         if self.is_class:
             tokens.append('class')
@@ -306,29 +2672,84 @@ class Prim(AbstractData):
 
         tokens.append('"{}"'.format(self.name))
 
-        lines.append('\n{}{} (\n'.format(self.indent(), ' '.join(tokens)))
-        self.level += 1
+        compact = options is not None and options.compact
+        metadata = itertools.chain(self.variants, self.references, self.payloads,
+                                   self.inherits, self.api_schemas, self.iter_properties())
+
+        if compact and not (self.variants or self.references or self.payloads or
+                            self.inherits or self.api_schemas or self._properties):
+            yield '{} {{\n'.format(' '.join(tokens))
+        else:
+            yield '{}{}{} (\n'.format(
+                '' if compact else '\n', self.indent(options=options), ' '.join(tokens)
+            )
+            self.level += 1
 
-        for prop in (self.variants + self.references + self.inherits + self.properties):
-            lines.extend(prop.lines(indent=self.level))
-            lines.append("\n")
+            for prop in metadata:
+                for line in _separated(prop.iter_lines(indent=self.level, options=options),
+                                       compact):
+                    yield line
 
-        self.level -= 1
-        lines.append('{0})\n{0}{{\n'.format(self.indent()))
+            self.level -= 1
+            yield '{0})\n{0}{{\n'.format(self.indent(options=options))
 
         self.level += 1
-        for attr in self.attributes:
-            lines.extend(attr.lines(indent=self.level))
-            lines.append("\n")
+        for attr in self.iter_attributes():
+            for line in _separated(attr.iter_lines(indent=self.level, options=options),
+                                   compact):
+                yield line
+        self.level -= 1
 
-        for child in self.children:
-            lines.extend(child.lines(indent=self.level))
+    def write_specs(self, writer, path=(), options=None):
+        path = path + (self.name,)
 
-        self.level -= 1
+        if self.is_class:
+            specifier = 'class'
+        elif self.is_over:
+            specifier = 'over'
+        else:
+            specifier = 'def'
+
+        fields = [('specifier', writer.specifier(specifier))]
+        if self.as_type:
+            fields.append(('typeName', writer.value('token', self.as_type)))
+
+        fields.extend(prop.crate_field(writer) for prop in self.iter_properties()
+                      if prop.was_set)
+
+        # Lists of the same kind are merged into a single list op, one list per mode. As
+        # when usda is read, an explicit list replaces the others and the others replace
+        # an explicit list
+        lists = _ordered_dict()
+        for iterable in itertools.chain(self.variants, self.references, self.payloads,
+                                        self.inherits, self.api_schemas):
+            modes = lists.setdefault(iterable.name, {})
+            if iterable.mode is None:
+                modes.clear()
+            else:
+                modes.pop(None, None)
+            modes.setdefault(iterable.mode, []).extend(iterable)
+        fields.extend(writer.list_op(name, items) for name, items in lists.items())
 
-        lines.append('\n{}}}\n'.format(self.indent()))
+        attributes = [attr for attr in self.iter_attributes() if attr.was_set]
+        if attributes:
+            fields.append(('properties', writer.token_vector([attr.name for attr in attributes])))
 
-        return lines
+        prims = [child.name for child in self.children if not isinstance(child, VariantSet)]
+        if prims:
+            fields.append(('primChildren', writer.token_vector(prims)))
+
+        variant_sets = [child.name for child in self.children if isinstance(child, VariantSet)]
+        if variant_sets:
+            fields.append(('variantSetChildren', writer.token_vector(variant_sets)))
+
+        writer.add_spec(path, SPEC_PRIM, fields)
+
+        for attr in attributes:
+            attr.write_specs(writer, path, options=options)
+
+        for child in self.children:
+            _stand_in(child, options).write_specs(writer, path, options=options)
 
     def add_reference(self, ref, mode=None):
         if mode not in Iterable.modes:
@@ -339,12 +2760,42 @@ class Prim(AbstractData):
                 break
         else:
             iterable = Iterable(name='reference', mode=mode)
-            self.references.append(iterable)
+            if self._references is None:
+                self._references = []
+            self._references.append(iterable)
 
         if not isinstance(ref, IterObject):
             ref = IterObject(ref, is_file=True)
 
         iterable.append(ref)
+        self.mark_dirty()
+
+    def add_payload(self, payload, mode=None):
+        """Add a payload, a reference that consumers can choose not to load
+
+        Args:
+            payload: The file of the payload, or an IterObject with the file and the
+                path of the prim in it
+            mode (str): The list mode of the payload, e.g. prepend
+
+        """
+        if mode not in Iterable.modes:
+            raise ValueError("{} is not a valid mode".format(mode))
+
+        for iterable in self.payloads:
+            if iterable.mode == mode:
+                break
+        else:
+            iterable = Iterable(name='payload', mode=mode)
+            if self._payloads is None:
+                self._payloads = []
+            self._payloads.append(iterable)
+
+        if not isinstance(payload, IterObject):
+            payload = IterObject(payload, is_file=True)
+
+        iterable.append(payload)
+        self.mark_dirty()
 
     def add_inherit(self, inherits, mode=None):
         if mode not in Iterable.modes:
@@ -355,12 +2806,15 @@ class Prim(AbstractData):
                 break
         else:
             iterable = Iterable(name='inherits', mode=mode)
-            self.references.append(iterable)
+            if self._references is None:
+                self._references = []
+            self._references.append(iterable)
 
         if not isinstance(inherits, IterObject):
             inherits = IterObject(inherits, is_file=False)
 
         iterable.append(inherits)
+        self.mark_dirty()
 
     def add_variant(self, variant, mode=None):
         if mode not in Iterable.modes:
@@ -371,12 +2825,39 @@ class Prim(AbstractData):
                 break
         else:
             iterable = Iterable(name='variantSets', mode=mode)
-            self.variants.append(iterable)
+            if self._variants is None:
+                self._variants = []
+            self._variants.append(iterable)
 
         if not isinstance(variant, IterObject):
             variant = IterObject(variant)
 
         iterable.append(variant)
+        self.mark_dirty()
+
+    def add_api_schema(self, schema, mode='prepend'):
+        """Apply an API schema to this prim, like MaterialBindingAPI
+
+        Args:
+            schema (str): The name of the schema, with the instance name of multiple
+                apply schemas, e.g. CollectionAPI:lights
+            mode (str): The list mode of the schema. USD prepends applied schemas
+
+        """
+        if mode not in Iterable.modes:
+            raise ValueError("{} is not a valid mode".format(mode))
+
+        for iterable in self.api_schemas:
+            if iterable.mode == mode:
+                break
+        else:
+            iterable = Iterable(name='apiSchemas', mode=mode)
+            if self._api_schemas is None:
+                self._api_schemas = []
+            self._api_schemas.append(iterable)
+
+        iterable.append(IterObject(schema))
+        self.mark_dirty()
 
     def set_xform_order(self, order='trs'):
         ops = []
@@ -395,6 +2876,7 @@ class Prim(AbstractData):
 
 class Property(AbstractData):
     """A property for a USD Prim that appears between the parenthesis"""
+    __slots__ = ('values',)
 
     def __init__(self, name, value=None, values=None):
         super(Property, self).__init__()
@@ -402,10 +2884,11 @@ class Property(AbstractData):
         self.values = values
         self.value = value
 
-    def lines(self, indent=0):
-        lines = super(Property, self).lines(indent=indent)
+    def iter_lines(self, indent=0, options=None):
+        for line in super(Property, self).iter_lines(indent=indent, options=options):
+            yield line
         if not self.was_set:
-            return lines
+            return
 
         tokens = []
         if self.as_type:
@@ -415,44 +2898,220 @@ class Property(AbstractData):
         if self.keyframes:
             tokens.append('{')
         else:
-            tokens.append(self.formatted_value())
+            tokens.append(self.formatted_value(options=options))
 
         tokens = [str(t) for t in tokens]
 
         tokens = ' '.join([t for t in tokens if t])
 
-        lines.append("{}{}\n".format(self.indent(), tokens))
+        yield "{}{}\n".format(self.indent(options=options), tokens)
 
         if not self.keyframes:
-            return lines
+            return
 
         self.level += 1
-        for frame, value in self.keyframes:
-            lines.append("{}{}:{},\n".format(
-                self.indent(), frame, self.formatted_value(frame=frame)
-            ))
+        for frame, value in self.keyframes.items():
+            yield "{}{}:{},\n".format(
+                self.indent(options=options), frame,
+                self.format_value(value, options=options)
+            )
         self.level -= 1
-        lines.append("{}}}\n".format(self.indent(), ))
+        yield "{}}}\n".format(self.indent(options=options))
+
+
+    def crate_field(self, writer):
+        """Write the value of this property as a metadata field in a usdc file
+
+        Returns:
+            tuple: The name of the field and its ValueRep
+
+        """
+        as_type = self.as_type or METADATA_TYPES.get(self.name) or infer_type(self.value)
+        return self.name, writer.value(as_type, self.value)
 
 
 class Attribute(AbstractData):
     """Data attributes that provide actual information about a prim between its {}"""
+    __slots__ = ('is_uniform', '_docstring', 'allowed_tokens', 'precision')
+    __doc__ = _DocString(__doc__)
 
     def __init__(self, name, value=None, is_uniform=False,
                  as_type=None, docstring=None,
                  allowedTokens=None, **kwargs):
         super(Attribute, self).__init__()
-        self.__doc__ = self.docstring = docstring
+        self._docstring = docstring
         self.is_uniform = is_uniform
         self.value = value
         self.name = name
         self.as_type = as_type
-        self.allowed_tokens = self.allowedTokens = allowedTokens
+        self.allowed_tokens = allowedTokens
+        self.precision = None
+
+    @property
+    def docstring(self):
+        """The documentation of the attribute. Those of the generated schemas are only
+        read from their docs file when they're requested
+        """
+        docstring = self._docstring
+        if isinstance(docstring, _SchemaDoc):
+            return docstring.text()
+        return docstring
+
+    @docstring.setter
+    def docstring(self, docstring):
+        self._docstring = docstring
+
+    @property
+    def allowedTokens(self):
+        return self.allowed_tokens
+
+    def set_precision(self, precision):
+        """Set how this attribute's floating point values are written out
+
+        This overrides the precision of the stage. See Stage.set_precision
+        """
+        self.precision = check_precision(precision)
+        self.mark_dirty()
+
+    def _precision(self, options=None):
+        if self.precision is not None:
+            return self.precision
+        return super(Attribute, self)._precision(options)
 
-    def lines(self, indent=0):
-        lines = super(Attribute, self).lines(indent=indent)
+    def set_value(self, value):
+        """Set the value of the attribute
+
+        Buffers (array.array, memoryview, bytes or NumPy arrays) are kept as they are
+        rather than copied into Python objects, and are grouped by the width of the
+        attribute's type when written out, e.g. 3 floats per element for point3f[].
+        """
+        self._check_buffer(value)
+        super(Attribute, self).set_value(value)
+
+    def set_keyframe(self, frame, value):
+        self._check_buffer(value)
+        super(Attribute, self).set_keyframe(frame, value)
+
+    def _check_samples(self, samples):
+        width = type_width(self.as_type)
+        if width is None or not is_buffer(samples.values):
+            return
+
+        per_frame = samples.width or 1
+        if per_frame % width if is_array_type(self.as_type) else per_frame != width:
+            raise ValueError("{} has {} values per frame which cannot be read as {}".format(
+                self.name, per_frame, self.as_type
+            ))
+
+    def _check_buffer(self, value):
+        width = type_width(self.as_type)
+        if width is None:
+            return
+
+        length = buffer_length(value, self.as_type)
+        if length is None:
+            return
+
+        if length % width if is_array_type(self.as_type) else length != width:
+            raise ValueError("{} has {} values which cannot be read as {}".format(
+                self.name, length, self.as_type
+            ))
+
+    def reduced_keyframes(self, tolerance=0.0):
+        """Return the time samples needed to reproduce this attribute's animation
+
+        Samples that are part of a constant run, or that lie on the line between their
+        neighbours within tolerance, are dropped. Types that USD holds rather than
+        interpolates, like ints, bools, tokens and quaternions, only drop repeated values.
+        The first and last samples are always kept.
+
+        Args:
+            tolerance (float): How far a dropped sample may be from the reduced animation
+
+        Returns:
+            list: The (frame, value) pairs to keep, in frame order
+
+        """
+        keyframes = self.keyframes
+        if isinstance(keyframes, TimeSamples):
+            items = list(keyframes.items())
+        else:
+            items = sorted(keyframes.items(), key=lambda item: item[0])
+
+        as_type = self.as_type or ''
+        interpolate = type_code(as_type) in ('e', 'f', 'd') and not as_type.startswith('quat')
+        kept = reduce_samples(
+            [frame for frame, _ in items],
+            [value for _, value in items],
+            tolerance=tolerance,
+            interpolate=interpolate
+        )
+        return [items[index] for index in kept]
+
+    def _keyframe_items(self, options=None):
+        """Return the time samples to write, reduced if the save options ask for it"""
+        if options is None or options.reduce_tolerance is None:
+            return self.keyframes.items()
+
+        items = self.reduced_keyframes(options.reduce_tolerance)
+
+        path = self.name
+        if self.parent is not None:
+            path = '{}.{}'.format(self.parent.path(), self.name)
+        options.reduced[path] = len(self.keyframes) - len(items)
+
+        return items
+
+    def write_specs(self, writer, path=(), options=None):
+        path = path + ('.' + self.name,)
+
+        if self.as_type == 'rel':
+            targets = self.value
+            if not isinstance(targets, (list, tuple)):
+                targets = [] if targets is None else [targets]
+            targets = [
+                target.path() if isinstance(target, AbstractData) else
+                target.object_name if isinstance(target, IterObject) else target
+                for target in targets
+            ]
+            # Relationships are always uniform, which usda leaves implied
+            fields = [
+                ('variability', writer.variability(uniform=True)),
+                ('targetPaths', writer.path_list_op(targets)),
+            ]
+            fields.extend(prop.crate_field(writer) for prop in self.iter_properties()
+                          if prop.was_set)
+            writer.add_spec(path, SPEC_RELATIONSHIP, fields)
+            return
+
+        start = _clock() if _hooks else None
+        as_type = self.as_type or infer_type(self.value)
+        fields = [('typeName', writer.value('token', as_type))]
+        if self.is_uniform:
+            fields.append(('variability', writer.variability(uniform=True)))
+
+        if self.keyframes:
+            fields.append(('timeSamples', writer.time_samples(
+                as_type, self._keyframe_items(options)
+            )))
+        elif self.value is not None:
+            fields.append(('default', writer.value(as_type, self.value)))
+
+        fields.extend(prop.crate_field(writer) for prop in self.iter_properties()
+                      if prop.was_set)
+        writer.add_spec(path, SPEC_ATTRIBUTE, fields)
+
+        if start is not None:
+            _emit_span('attribute.pack', start, {
+                'type': as_type, 'elements': _element_count(self.value, as_type),
+                'samples': len(self.keyframes)
+            })
+
+    def iter_lines(self, indent=0, options=None):
+        for line in super(Attribute, self).iter_lines(indent=indent, options=options):
+            yield line
         if not self.was_set:
-            return lines
+            return
 
         tokens = []
         if self.is_uniform:
@@ -466,43 +3125,44 @@ class Attribute(AbstractData):
         tokens.append('=')
         if self.keyframes:
             tokens.append('{\n')
-        else:
-            tokens.append(self.formatted_value())
         tokens = [str(t) for t in tokens]
 
-        lines.append('{}{}'.format(self.indent(), ' '.join(tokens)))
+        # The value is yielded on its own so a large array is never copied into the
+        # declaration string
+        yield '{}{}'.format(self.indent(options=options), ' '.join(tokens))
         if self.keyframes:
             self.level += 1
-            for frame in self.keyframes:
-                lines.append('{}{}: {},\n'.format(
-                    self.indent(),
+            for frame, value in self._keyframe_items(options):
+                yield '{}{}: {},\n'.format(
+                    self.indent(options=options),
                     frame,
-                    self.formatted_value(frame=frame)
-                ))
+                    self.format_value(value, options=options)
+                )
 
             self.level -= 1
-            lines.append('{}}}\n'.format(self.indent()))
-
+            yield '{}}}\n'.format(self.indent(options=options))
+        else:
+            yield ' '
+            yield str(self.formatted_value(options=options))
 
-        if not self.properties:
-            return lines
+        if not self._properties:
+            return
 
-        lines.append(" (\n")
+        yield " (\n"
         self.level += 1
 
-        for prop in self.properties:
-            lines.extend(prop.lines(indent=self.level))
+        for prop in self.iter_properties():
+            for line in prop.iter_lines(indent=self.level, options=options):
+                yield line
 
         self.level -= 1
-        lines.append('{})'.format(self.indent()))
-
-        return lines
+        yield '{})'.format(self.indent(options=options))
 
 
 class Iterable(list):
     """Represents a USD list"""
     mode = None
-    modes = (None, 'add', 'prepend', 'del')
+    modes = (None, 'add', 'prepend', 'append', 'del')
 
     def __init__(self, name, mode=None):
         super(Iterable, self).__init__()
@@ -512,15 +3172,19 @@ class Iterable(list):
         self.mode = mode
         self.level = 0
 
-    def indent(self, level=None):
-        """Returns the indentation string"""
+    def indent(self, level=None, options=None):
+        """Returns the indentation string, which is empty when writing compact output"""
+        if options is not None and options.compact:
+            return ''
         if level is None:
             level = self.level
         return indentation(level)
 
     def lines(self, indent=0):
+        return list(self.iter_lines(indent=indent))
+
+    def iter_lines(self, indent=0, options=None):
         self.level = indent
-        lines = []
 
         tokens = []
         if self.mode:
@@ -528,22 +3192,25 @@ class Iterable(list):
 
         tokens.extend([self.name, '='])
 
-        lines.append('{0}{1} [\n{2}{3}\n{0}]'.format(
-            self.indent(),
+        if options is not None and options.compact:
+            yield '{} [{}]'.format(' '.join(tokens), ','.join(str(i) for i in self if i))
+            return
+
+        yield '{0}{1} [\n{2}{3}\n{0}]'.format(
+            self.indent(options=options),
             ' '.join(tokens),
             indentation(self.level + 1),
-            '{},\n'.format(indentation(self.level + 1).join(str(i) for i in self if i))
-        ))
-
-        return lines
+            '{},\n'.format(',\n{}'.format(indentation(self.level + 1)).join(
+                str(i) for i in self if i
+            ))
+        )
 
 
 class IterObject(object):
     """Represents an object inside a USD list and can format to various formats"""
+    __slots__ = ('value', 'object_name', 'is_file')
     reference = False
     location = None
-    object_name = None
-    is_file = False
 
     def __init__(self, value=None, object_name=None, is_file=False):
         super(IterObject, self).__init__()
@@ -578,38 +3245,64 @@ class IterObject(object):
 
 class VariantSet(Prim):
     """Create a Variant Set inside a prim"""
+    __slots__ = ()
 
-    def lines(self, indent=0):
-        lines = AbstractData.lines(self, indent=indent)
+    def write_specs(self, writer, path=(), options=None):
+        writer.add_spec(path + ('{{{}=}}'.format(self.name),), SPEC_VARIANT_SET, [
+            ('variantChildren', writer.token_vector([child.name for child in self.children]))
+        ])
+
+        # Variants are named by their selection on the prim that holds the set
+        for child in self.children:
+            _stand_in(child, options).write_specs(writer, path, options=options)
+
+    def iter_lines(self, indent=0, options=None):
+        for line in AbstractData.iter_lines(self, indent=indent, options=options):
+            yield line
 
-        lines.append('{}variantSet "{}" = {{\n'.format(self.indent(), self.name))
+        yield '{}variantSet "{}" = {{\n'.format(self.indent(options=options), self.name)
         self.level += 1
 
         for child in self.children:
-            lines.extend(child.lines(indent=self.level))
-            lines.append('\n')
+            for line in _iter_child_lines(child, self.level, options):
+                yield line
+            if options is None or not options.compact:
+                yield '\n'
 
         self.level -= 1
-        lines.append('{0}}}\n'.format(self.indent()))
-
-        return lines
+        yield '{0}}}\n'.format(self.indent(options=options))
 
 
 class Variant(Prim):
     """Create a Variant inside a Variant Set"""
+    __slots__ = ()
 
-    def lines(self, indent=0):
-        lines = AbstractData.lines(self, indent=indent)
+    def write_specs(self, writer, path=(), options=None):
+        path = path + ('{{{}={}}}'.format(self.parent.name, self.name),)
+
+        fields = [('specifier', writer.specifier('over'))]
+        if self.children:
+            fields.append(('primChildren', writer.token_vector(
+                [child.name for child in self.children]
+            )))
+        writer.add_spec(path, SPEC_VARIANT, fields)
+
+        for child in self.children:
+            _stand_in(child, options).write_specs(writer, path, options=options)
+
+    def iter_lines(self, indent=0, options=None):
+        for line in AbstractData.iter_lines(self, indent=indent, options=options):
+            yield line
 
-        lines.append('{}"{}" {{\n'.format(self.indent(), self.name))
+        yield '{}"{}" {{\n'.format(self.indent(options=options), self.name)
 
         self.level += 1
 
         for child in self.children:
-            lines.extend(child.lines(indent=self.level))
-            lines.append('\n')
+            for line in _iter_child_lines(child, self.level, options):
+                yield line
+            if options is None or not options.compact:
+                yield '\n'
 
         self.level -= 1
-        lines.append('{0}}}\n'.format(self.indent()))
-
-        return lines
+        yield '{0}}}\n'.format(self.indent(options=options))
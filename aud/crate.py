@@ -0,0 +1,1343 @@
+"""
+Reading and writing of binary crate (usdc) files.
+
+A crate file stores a layer as a set of tables: the tokens and strings it uses, its
+fields (a name and a value), the sets of fields that make up each spec, the paths of
+the specs, and the specs themselves. Values are written out as they're added, ahead of
+the tables, and are referred to by a ValueRep. That is a 64 bit integer holding the
+type of the value and either its offset in the file or, for small values, the value
+itself.
+
+This writes version 0.8.0 of the format, or 0.9.0 when timecode values are used, so the
+files can be read by any recent version of USD.
+
+Files are read through a memory map. Only the tables are read when a file is opened,
+and values are read from the map as they're needed, so opening even a very large file
+only touches the pages that hold its tables.
+"""
+import array
+import collections
+import itertools
+import mmap
+import operator
+import os
+import re
+import struct
+import sys
+
+from .formatting import FLOAT_CODES, as_buffer, is_buffer, numpy
+from .timesamples import TimeSamples
+
+IDENTIFIER = b'PXR-USDC'
+VERSION = (0, 8, 0)
+# The version that added timecode values
+TIMECODE_VERSION = (0, 9, 0)
+# The oldest version that can be read, which is the first to compress its tables
+MIN_READ_VERSION = (0, 4, 0)
+
+# Versions that changed how arrays are stored
+_ARRAY_SHAPE_REMOVED_VERSION = (0, 5, 0)
+_COMPRESSED_FLOATS_VERSION = (0, 6, 0)
+_ARRAY_SIZE64_VERSION = (0, 7, 0)
+
+_BOOTSTRAP_SIZE = 88
+
+# The bits of a ValueRep
+_ARRAY_BIT = 1 << 63
+_INLINED_BIT = 1 << 62
+_COMPRESSED_BIT = 1 << 61
+_PAYLOAD_MASK = (1 << 48) - 1
+
+# Arrays of integers with at least this many values are compressed
+MIN_COMPRESSED_ARRAY_SIZE = 16
+
+# LZ4 can only take this many bytes at once, so larger buffers are split into chunks
+_LZ4_MAX_INPUT_SIZE = 0x7E000000
+
+# The terminator of each field set
+_END_OF_FIELD_SET = 0xFFFFFFFF
+
+# Spec types
+SPEC_ATTRIBUTE = 1
+SPEC_PRIM = 6
+SPEC_PSEUDO_ROOT = 7
+SPEC_RELATIONSHIP = 8
+SPEC_VARIANT = 10
+SPEC_VARIANT_SET = 11
+
+# Value types that aren't named by a USD type
+TYPE_STRING = 10
+TYPE_TOKEN = 11
+TYPE_TOKEN_LIST_OP = 32
+TYPE_STRING_LIST_OP = 33
+TYPE_PATH_LIST_OP = 34
+TYPE_REFERENCE_LIST_OP = 35
+TYPE_PATH_VECTOR = 40
+TYPE_TOKEN_VECTOR = 41
+TYPE_SPECIFIER = 42
+TYPE_PERMISSION = 43
+TYPE_VARIABILITY = 44
+TYPE_TIME_SAMPLES = 46
+TYPE_DOUBLE_VECTOR = 48
+TYPE_STRING_VECTOR = 50
+TYPE_PAYLOAD_LIST_OP = 55
+TYPE_TIMECODE = 56
+
+SPECIFIERS = {'def': 0, 'over': 1, 'class': 2}
+
+# The value type, struct format and number of components of each USD type name.
+# Text types have no struct format, since they're stored as an index into a table
+VALUE_TYPES = {
+    'bool': (1, '?', 1),
+    'uchar': (2, 'B', 1),
+    'int': (3, 'i', 1),
+    'uint': (4, 'I', 1),
+    'int64': (5, 'q', 1),
+    'uint64': (6, 'Q', 1),
+    'half': (7, 'e', 1),
+    'float': (8, 'f', 1),
+    'double': (9, 'd', 1),
+    'string': (10, None, 1),
+    'token': (11, None, 1),
+    'asset': (12, None, 1),
+    'matrix2d': (13, 'd', 4),
+    'matrix3d': (14, 'd', 9),
+    'matrix4d': (15, 'd', 16),
+    'frame4d': (15, 'd', 16),
+    'quatd': (16, 'd', 4),
+    'quatf': (17, 'f', 4),
+    'quath': (18, 'e', 4),
+    'timecode': (TYPE_TIMECODE, 'd', 1),
+}
+
+for _size, _first in ((2, 19), (3, 23), (4, 27)):
+    for _offset, (_scalar, _code) in enumerate(
+            (('double', 'd'), ('float', 'f'), ('half', 'e'), ('int', 'i'))):
+        VALUE_TYPES['{}{}'.format(_scalar, _size)] = (_first + _offset, _code, _size)
+
+# The plain type names are added before the roles that share their value type, so they
+# are the names that values are read back as
+_TYPES_BY_ENUM = {}
+for _name, _value_type in VALUE_TYPES.items():
+    _TYPES_BY_ENUM.setdefault(_value_type[0], (_name,) + _value_type[1:])
+
+for _role in ('point3', 'normal3', 'vector3', 'color3', 'color4', 'texCoord2', 'texCoord3'):
+    for _suffix, _scalar in (('d', 'double'), ('f', 'float'), ('h', 'half')):
+        VALUE_TYPES[_role + _suffix] = VALUE_TYPES['{}{}'.format(_scalar, _role[-1])]
+
+# Values that fit in 32 bits are stored in the ValueRep itself, with doubles stored as
+# floats and 64 bit integers as 32 bit ones when that doesn't lose anything
+_INLINED_CODES = {'d': 'f', 'q': 'i', 'Q': 'I'}
+
+# The types of the metadata fields that aud knows how to write
+METADATA_TYPES = {
+    'active': 'bool',
+    'hidden': 'bool',
+    'instanceable': 'bool',
+    'comment': 'string',
+    'documentation': 'string',
+    'defaultPrim': 'token',
+    'interpolation': 'token',
+    'kind': 'token',
+    'upAxis': 'token',
+    'elementSize': 'int',
+    'startTimeCode': 'double',
+    'endTimeCode': 'double',
+    'timeCodesPerSecond': 'double',
+    'framesPerSecond': 'double',
+    'metersPerUnit': 'double',
+}
+
+# The fields written for each kind of list in a prim's metadata
+LIST_OP_FIELDS = {
+    'reference': 'references',
+    'references': 'references',
+    'payload': 'payload',
+    'inherits': 'inheritPaths',
+    'variantSets': 'variantSetNames',
+    'apiSchemas': 'apiSchemas',
+}
+
+# The header bits of a list op, and the order that its lists are written in
+_LIST_OP_EXPLICIT = 1 << 0
+_LIST_OP_MODES = (
+    (None, 1 << 1),
+    ('add', 1 << 2),
+    ('prepend', 1 << 5),
+    ('append', 1 << 6),
+    ('del', 1 << 3),
+)
+# Ordered lists are never written, but follow the others when they are read
+_LIST_OP_ORDERED = ('ordered', 1 << 4)
+
+_VARIANT_SELECTION = re.compile(r'[^{]+|{[^}]*}')
+
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+# The four 2 bit codes of encoded integers that are packed into each byte
+_BYTE_CODES = [tuple((byte >> shift) & 3 for shift in (0, 2, 4, 6)) for byte in range(256)]
+
+
+def _running_total(values):
+    total = 0
+    for value in values:
+        total += value
+        yield total
+
+
+_accumulate = getattr(itertools, 'accumulate', _running_total)
+
+
+def infer_type(value):
+    """Return the USD type name for a Python value that wasn't given one"""
+    if isinstance(value, (list, tuple)) and value:
+        return '{}[]'.format(infer_type(value[0]))
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, int):
+        return 'int'
+    if isinstance(value, float):
+        return 'double'
+    return 'string'
+
+
+def parse_path(path):
+    """Split a path string into its elements
+
+    Prim names are kept as they are, variant selections as {set=variant}, and a
+    property name is prefixed with a '.'
+
+    Returns:
+        tuple: The elements, which are empty for the root path
+
+    """
+    prim, dot, prop = path.partition('.')
+    elements = []
+    for name in prim.split('/'):
+        elements.extend(_VARIANT_SELECTION.findall(name))
+    if dot:
+        elements.append('.' + prop)
+    return tuple(elements)
+
+
+def format_path(elements):
+    """Join the elements of a path, as returned by parse_path, into a path string"""
+    if not elements:
+        return '/'
+
+    parts = []
+    after_variant = False
+    for element in elements:
+        if element.startswith(('{', '.')) or after_variant:
+            parts.append(element)
+        else:
+            parts.extend(('/', element))
+        after_variant = element.startswith('{')
+    return ''.join(parts)
+
+
+def _lz4_literals(data):
+    """Wrap data as an LZ4 block made of a single run of literals"""
+    length = len(data)
+    if length < 15:
+        return struct.pack('B', length << 4) + bytes(data)
+
+    extra = length - 15
+    return b'\xf0' + b'\xff' * (extra // 255) + struct.pack('B', extra % 255) + bytes(data)
+
+
+def fast_compression(data):
+    """Frame data the way TfFastCompression does, as one or more LZ4 blocks
+
+    The blocks store the data as literals rather than searching it for matches, which
+    would be far too slow in Python, and any LZ4 decoder reads them back as they are.
+    Integers are still packed tightly by encode_ints before they get here.
+    """
+    if len(data) <= _LZ4_MAX_INPUT_SIZE:
+        return b'\x00' + _lz4_literals(data)
+
+    chunks = [
+        _lz4_literals(data[start:start + _LZ4_MAX_INPUT_SIZE])
+        for start in range(0, len(data), _LZ4_MAX_INPUT_SIZE)
+    ]
+    framed = [struct.pack('B', len(chunks))]
+    for chunk in chunks:
+        framed.append(struct.pack('<i', len(chunk)))
+        framed.append(chunk)
+    return b''.join(framed)
+
+
+def _lz4_block(data):
+    """Decode an LZ4 block
+
+    Blocks written by USD also hold matches, which copy bytes from earlier in the output,
+    so every sequence is decoded rather than assuming literals like fast_compression
+    writes.
+    """
+    data = bytearray(data)
+    end = len(data)
+    out = bytearray()
+    position = 0
+    while position < end:
+        token = data[position]
+        position += 1
+
+        length = token >> 4
+        if length == 15:
+            while True:
+                extra = data[position]
+                position += 1
+                length += extra
+                if extra != 255:
+                    break
+        out += data[position:position + length]
+        position += length
+
+        # The last sequence of a block only has literals
+        if position >= end:
+            break
+
+        distance = data[position] | data[position + 1] << 8
+        position += 2
+
+        length = token & 15
+        if length == 15:
+            while True:
+                extra = data[position]
+                position += 1
+                length += extra
+                if extra != 255:
+                    break
+        length += 4
+
+        start = len(out) - distance
+        if distance >= length:
+            out += out[start:start + length]
+        else:
+            # The match overlaps the bytes it produces, repeating the last distance bytes
+            repeated = out[start:]
+            out += (repeated * (length // distance + 1))[:length]
+
+    return bytes(out)
+
+
+def fast_decompression(data):
+    """Undo the framing and LZ4 compression of TfFastCompression"""
+    chunks = struct.unpack_from('B', data)[0]
+    if not chunks:
+        return _lz4_block(data[1:])
+
+    position = 1
+    blocks = []
+    for _ in range(chunks):
+        size = struct.unpack_from('<i', data, position)[0]
+        position += 4
+        blocks.append(_lz4_block(data[position:position + size]))
+        position += size
+    return b''.join(blocks)
+
+
+def encode_ints(values, wide=False):
+    """Encode integers the way USD's integer compression does, before the LZ4 step
+
+    Each integer is stored as the difference from the one before it. The most common
+    difference is written once at the start, followed by a 2 bit code for every integer
+    saying whether it's that common difference, or a small, medium or large one that
+    follows after all the codes.
+
+    Args:
+        values (list): The integers, signed or unsigned
+        wide (bool): Whether they're 64 bit rather than 32 bit integers
+
+    Returns:
+        bytes: The encoded integers
+
+    """
+    if not len(values):
+        return b''
+
+    if hasattr(values, 'tolist'):
+        values = values.tolist()
+
+    bits = 64 if wide else 32
+    deltas = list(map(operator.sub, values, itertools.chain([0], values)))
+
+    # Differences wrap around like the fixed size integers they're computed from in USD
+    limit = 1 << (bits - 1)
+    if min(deltas) < -limit or max(deltas) >= limit:
+        mask = (1 << bits) - 1
+        deltas = [((delta + limit) & mask) - limit for delta in deltas]
+
+    counts = collections.Counter(deltas)
+    # Ties go to the larger difference, as they do in USD
+    common = max(zip(counts.values(), counts))[1]
+
+    small, medium, large = ('h', 'i', 'q') if wide else ('b', 'h', 'i')
+    small_limit = 1 << (struct.calcsize(small) * 8 - 1)
+    medium_limit = 1 << (struct.calcsize(medium) * 8 - 1)
+    codes = [
+        0 if delta == common else
+        1 if -small_limit <= delta < small_limit else
+        2 if -medium_limit <= delta < medium_limit else 3
+        for delta in deltas
+    ]
+
+    # Four codes are packed into each byte, starting from the lowest bits
+    codes.extend([0] * (-len(codes) % 4))
+    packed_codes = bytearray(map(
+        lambda a, b, c, d: a | b << 2 | c << 4 | d << 6,
+        codes[0::4], codes[1::4], codes[2::4], codes[3::4]
+    ))
+
+    formats = ('', small, medium, large)
+    ints = struct.pack(
+        '<' + ''.join([formats[code] for code in codes]),
+        *[delta for delta in deltas if delta != common]
+    )
+
+    return struct.pack('<' + large, common) + bytes(packed_codes) + ints
+
+
+def decode_ints(data, count, wide=False, signed=True):
+    """Decode integers encoded by encode_ints, or by USD's integer compression
+
+    Args:
+        data (bytes): The encoded integers, after the LZ4 step has been undone
+        count (int): The number of integers
+        wide (bool): Whether they're 64 bit rather than 32 bit integers
+        signed (bool): Whether they're signed
+
+    Returns:
+        list: The integers
+
+    """
+    if not count:
+        return []
+
+    small, medium, large = ('h', 'i', 'q') if wide else ('b', 'h', 'i')
+    common = struct.unpack_from('<' + large, data)[0]
+    start = struct.calcsize(large)
+    end = start + (count * 2 + 7) // 8
+
+    codes = list(itertools.chain.from_iterable(
+        map(_BYTE_CODES.__getitem__, bytearray(data[start:end]))
+    ))[:count]
+
+    formats = ('', small, medium, large)
+    stored = iter(struct.unpack_from(
+        '<' + ''.join([formats[code] for code in codes]), data, end
+    ))
+    values = list(_accumulate([next(stored) if code else common for code in codes]))
+
+    # The sums wrap around like the fixed size integers they're computed with in USD
+    bits = 64 if wide else 32
+    mask = (1 << bits) - 1
+    if signed:
+        limit = 1 << (bits - 1)
+        if min(values) < -limit or max(values) >= limit:
+            values = [((value + limit) & mask) - limit for value in values]
+    elif min(values) < 0 or max(values) > mask:
+        values = [value & mask for value in values]
+
+    return values
+
+
+def compress_ints(values, wide=False):
+    """Encode and compress integers, as stored for compressed arrays and tables"""
+    return fast_compression(encode_ints(values, wide=wide))
+
+
+def _flatten(value):
+    """Return the numbers of a value, which may be nested in lists or tuples, as a list"""
+    if not isinstance(value, (list, tuple)):
+        return [value]
+
+    flat = []
+    for item in value:
+        if isinstance(item, (list, tuple)):
+            flat.extend(_flatten(item))
+        else:
+            flat.append(item)
+    return flat
+
+
+def _scalars(value, as_type):
+    """Return the flat scalars of a value, without copying it if it's a buffer"""
+    if is_buffer(value):
+        return as_buffer(value, as_type)
+    return _flatten(value)
+
+
+def _pack(code, scalars):
+    """Return flat scalars as the little endian bytes of a struct format"""
+    if numpy is not None and isinstance(scalars, numpy.ndarray):
+        return numpy.ascontiguousarray(scalars, dtype='<' + code).tobytes()
+
+    if getattr(scalars, 'typecode', getattr(scalars, 'format', None)) == code and not _BIG_ENDIAN:
+        return scalars.tobytes()
+
+    if code in ('?', 'e'):
+        return struct.pack('<{}{}'.format(len(scalars), code), *scalars)
+
+    packed = array.array(code, scalars)
+    if _BIG_ENDIAN:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _real_last(flat):
+    """Reorder quaternions from (real, i, j, k), as they're written in usda, to how
+    USD stores them in memory, with the real part last"""
+    flat = list(flat)
+    for start in range(0, len(flat), 4):
+        flat[start:start + 4] = flat[start + 1:start + 4] + flat[start:start + 1]
+    return flat
+
+
+def _real_first(flat):
+    """Reorder quaternions from how USD stores them to (real, i, j, k)"""
+    flat = list(flat)
+    for start in range(0, len(flat), 4):
+        flat[start:start + 4] = flat[start + 3:start + 4] + flat[start:start + 3]
+    return flat
+
+
+class CrateWriter(object):
+    """Writes the specs of a layer to a binary crate file
+
+    Values are written to the file as they're added, and the tables that describe the
+    specs are written when the writer is closed.
+
+    Args:
+        fileobj: A seekable file object opened for writing bytes
+    """
+
+    def __init__(self, fileobj):
+        super(CrateWriter, self).__init__()
+        self.fileobj = fileobj
+        self.version = VERSION
+        self._start = fileobj.tell()
+        self._position = 0
+
+        # The empty token comes first, since a token index is negated to mark a property
+        # in the paths table, and no path element can be empty
+        self._tokens = ['']
+        self._token_indices = {'': 0}
+        self._strings = []
+        self._string_indices = {}
+        self._paths = {}
+        self._fields = []
+        self._field_indices = {}
+        self._field_sets = []
+        self._field_set_indices = {}
+        self._specs = []
+
+        # The bootstrap header is written again once the table of contents is known
+        self._write(self._bootstrap(0))
+
+    def _write(self, data):
+        """Write data to the file, returning the offset it was written at"""
+        offset = self._position
+        self.fileobj.write(data)
+        self._position += len(data)
+        return offset
+
+    def _bootstrap(self, toc_offset):
+        version = bytearray(8)
+        version[:3] = self.version
+        return IDENTIFIER + bytes(version) + struct.pack('<q8q', toc_offset, *[0] * 8)
+
+    @staticmethod
+    def _rep(type_enum, payload, is_array=False, inlined=False, compressed=False):
+        rep = (type_enum << 48) | (payload & _PAYLOAD_MASK)
+        if is_array:
+            rep |= _ARRAY_BIT
+        if inlined:
+            rep |= _INLINED_BIT
+        if compressed:
+            rep |= _COMPRESSED_BIT
+        return rep
+
+    def token(self, text):
+        """Return the index of a token, adding it to the table if it's new"""
+        index = self._token_indices.get(text)
+        if index is None:
+            index = self._token_indices[text] = len(self._tokens)
+            self._tokens.append(text)
+        return index
+
+    def string(self, text):
+        """Return the index of a string, adding it to the table if it's new"""
+        index = self._string_indices.get(text)
+        if index is None:
+            index = self._string_indices[text] = len(self._strings)
+            self._strings.append(self.token(text))
+        return index
+
+    def path(self, path):
+        """Return the index of a path, adding it to the table if it's new
+
+        Args:
+            path: A path string, a tuple of path elements, or None for the empty path
+
+        """
+        if isinstance(path, str):
+            path = parse_path(path)
+
+        index = self._paths.get(path)
+        if index is None:
+            index = self._paths[path] = len(self._paths)
+        return index
+
+    def value(self, as_type, value):
+        """Write a value of a USD type, returning its ValueRep
+
+        Args:
+            as_type (str): The USD type name, e.g. point3f[]
+            value: The value as it would be given to an attribute
+
+        """
+        is_array = as_type.endswith('[]')
+        name = as_type[:-2] if is_array else as_type
+        if name not in VALUE_TYPES:
+            raise ValueError("{} values cannot be written to a usdc file".format(as_type))
+
+        type_enum, code, width = VALUE_TYPES[name]
+        if type_enum == TYPE_TIMECODE:
+            self.version = max(self.version, TIMECODE_VERSION)
+
+        if code is None:
+            return self._text_value(name, type_enum, value, is_array)
+
+        scalars = _scalars(value, as_type)
+        if name.startswith('quat'):
+            scalars = _real_last(scalars)
+
+        if not is_array:
+            if len(scalars) != width:
+                raise ValueError("{!r} cannot be written as {}".format(value, as_type))
+
+            data = _pack(code, scalars)
+            # Values that fit in 32 bits are always stored in the ValueRep itself
+            if width == 1 and len(data) <= 4:
+                payload = struct.unpack('<I', data.ljust(4, b'\x00'))[0]
+                return self._rep(type_enum, payload, inlined=True)
+            return self._rep(type_enum, self._write(data))
+
+        if len(scalars) % width:
+            raise ValueError("{} values cannot be grouped into {} elements of {}".format(
+                len(scalars), as_type, width
+            ))
+
+        count = len(scalars) // width
+        if not count:
+            return self._rep(type_enum, 0, is_array=True)
+
+        if width == 1 and code in ('i', 'I', 'q', 'Q') and count >= MIN_COMPRESSED_ARRAY_SIZE:
+            compressed = compress_ints(scalars, wide=code in ('q', 'Q'))
+            offset = self._write(struct.pack('<QQ', count, len(compressed)) + compressed)
+            return self._rep(type_enum, offset, is_array=True, compressed=True)
+
+        offset = self._write(struct.pack('<Q', count) + _pack(code, scalars))
+        return self._rep(type_enum, offset, is_array=True)
+
+    def _text_value(self, name, type_enum, value, is_array):
+        if not is_array:
+            index = self.string if name == 'string' else self.token
+            return self._rep(type_enum, index(value), inlined=True)
+
+        if not value:
+            return self._rep(type_enum, 0, is_array=True)
+
+        # Unlike single asset paths, the elements of asset arrays are stored as strings
+        index = self.token if name == 'token' else self.string
+
+        indices = _pack('I', [index(text) for text in value])
+        offset = self._write(struct.pack('<Q', len(value)) + indices)
+        return self._rep(type_enum, offset, is_array=True)
+
+    def token_vector(self, tokens):
+        """Write a list of tokens, like the names of a prim's children"""
+        indices = _pack('I', [self.token(text) for text in tokens])
+        offset = self._write(struct.pack('<Q', len(tokens)) + indices)
+        return self._rep(TYPE_TOKEN_VECTOR, offset)
+
+    def specifier(self, specifier):
+        """Return the ValueRep of a prim specifier, one of def, over or class"""
+        return self._rep(TYPE_SPECIFIER, SPECIFIERS[specifier], inlined=True)
+
+    def variability(self, uniform):
+        """Return the ValueRep of an attribute's variability"""
+        return self._rep(TYPE_VARIABILITY, int(bool(uniform)), inlined=True)
+
+    def time_samples(self, as_type, items):
+        """Write the time samples of an attribute
+
+        Args:
+            as_type (str): The USD type name of the values
+            items: The (frame, value) pairs in frame order
+
+        """
+        frames = []
+        reps = []
+        for frame, value in items:
+            frames.append(float(frame))
+            reps.append(self.value(as_type, value))
+
+        times = self._write(struct.pack('<Q', len(frames)) + _pack('d', frames))
+
+        # Each part of the samples starts with the distance to the next, which lets
+        # readers skip over values written in between. Here they follow on directly
+        header = struct.pack('<qQqQ', 8, self._rep(TYPE_DOUBLE_VECTOR, times), 8, len(reps))
+        offset = self._write(header + _pack('Q', reps))
+        return self._rep(TYPE_TIME_SAMPLES, offset)
+
+    def list_op(self, name, items):
+        """Write the items of a list in a prim's metadata, like its references
+
+        Args:
+            name (str): The name of the list, e.g. reference, inherits or variantSets
+            items (dict): The IterObjects of the list for each list mode
+
+        Returns:
+            tuple: The name of the field and its ValueRep
+
+        """
+        field = LIST_OP_FIELDS.get(name)
+        if field is None:
+            raise ValueError("{} lists cannot be written to a usdc file".format(name))
+
+        if field == 'references':
+            type_enum, pack = TYPE_REFERENCE_LIST_OP, self._pack_reference
+        elif field == 'payload':
+            type_enum, pack = TYPE_PAYLOAD_LIST_OP, self._pack_payload
+        elif field == 'inheritPaths':
+            type_enum, pack = TYPE_PATH_LIST_OP, self._pack_path
+        elif field == 'apiSchemas':
+            type_enum, pack = TYPE_TOKEN_LIST_OP, self._pack_token
+        else:
+            type_enum, pack = TYPE_STRING_LIST_OP, self._pack_string
+
+        header = 0
+        lists = []
+        for mode, bit in _LIST_OP_MODES:
+            objects = [obj for obj in items.get(mode, ()) if obj.formatted()]
+            if not objects:
+                continue
+
+            header |= bit
+            if mode is None:
+                header |= _LIST_OP_EXPLICIT
+            lists.append(struct.pack('<Q', len(objects)))
+            lists.extend(pack(obj) for obj in objects)
+
+        offset = self._write(struct.pack('B', header) + b''.join(lists))
+        return field, self._rep(type_enum, offset)
+
+    def path_list_op(self, paths):
+        """Write an explicit list of paths, like the targets of a relationship"""
+        offset = self._write(
+            struct.pack('<BQ', _LIST_OP_EXPLICIT | _LIST_OP_MODES[0][1], len(paths)) +
+            _pack('I', [self.path(path) for path in paths])
+        )
+        return self._rep(TYPE_PATH_LIST_OP, offset)
+
+    def _pack_reference(self, obj):
+        asset = obj.value if obj.is_file else ''
+        path = obj.object_name or None
+        # The asset path, prim path, layer offset and scale, and an empty custom data
+        return struct.pack('<IIddQ', self.string(asset or ''), self.path(path), 0.0, 1.0, 0)
+
+    def _pack_payload(self, obj):
+        asset = obj.value if obj.is_file else ''
+        # The asset path, prim path, and layer offset and scale
+        return struct.pack('<IIdd', self.string(asset or ''), self.path(obj.object_name or None),
+                           0.0, 1.0)
+
+    def _pack_path(self, obj):
+        return struct.pack('<I', self.path(obj.object_name or obj.value))
+
+    def _pack_string(self, obj):
+        return struct.pack('<I', self.string(obj.value))
+
+    def _pack_token(self, obj):
+        return struct.pack('<I', self.token(obj.value))
+
+    def add_spec(self, path, spec_type, fields):
+        """Add a spec to the layer
+
+        Args:
+            path (tuple): The elements of the path of the spec
+            spec_type (int): One of the SPEC_* types
+            fields (list): The (name, ValueRep) pairs of the spec's fields
+
+        """
+        indices = []
+        for name, rep in fields:
+            field = (self.token(name), rep)
+            index = self._field_indices.get(field)
+            if index is None:
+                index = self._field_indices[field] = len(self._fields)
+                self._fields.append(field)
+            indices.append(index)
+
+        indices = tuple(indices)
+        field_set = self._field_set_indices.get(indices)
+        if field_set is None:
+            field_set = self._field_set_indices[indices] = len(self._field_sets)
+            self._field_sets.extend(indices)
+            self._field_sets.append(_END_OF_FIELD_SET)
+
+        self._specs.append((self.path(path), field_set, spec_type))
+
+    def _path_tree(self):
+        """Return the paths in depth first order, with the element token and jump of each
+
+        Readers rebuild the paths from this. A jump says where the next path is relative
+        to its parent: -1 for just a child, 0 for just a sibling, -2 for neither, and
+        otherwise the distance to its sibling, with its child following directly.
+        """
+        # Every parent has to be in the table to rebuild the paths below it
+        for path in list(self._paths):
+            if path is not None:
+                for end in range(len(path)):
+                    self.path(path[:end])
+
+        children = collections.OrderedDict()
+        for path in self._paths:
+            if path:
+                children.setdefault(path[:-1], []).append(path)
+
+        order = []
+        stack = [()]
+        while stack:
+            path = stack.pop()
+            order.append(path)
+            stack.extend(reversed(children.get(path, ())))
+
+        positions = dict((path, index) for index, path in enumerate(order))
+        sizes = [1] * len(order)
+        for index in range(len(order) - 1, 0, -1):
+            sizes[positions[order[index][:-1]]] += sizes[index]
+
+        last_children = set(paths[-1] for paths in children.values())
+
+        elements = []
+        jumps = []
+        for index, path in enumerate(order):
+            if not path:
+                elements.append(0)
+            elif path[-1].startswith('.'):
+                elements.append(-self.token(path[-1][1:]))
+            else:
+                elements.append(self.token(path[-1]))
+
+            has_child = path in children
+            has_sibling = bool(path) and path not in last_children
+            if has_child and has_sibling:
+                jumps.append(sizes[index])
+            elif has_child:
+                jumps.append(-1)
+            elif has_sibling:
+                jumps.append(0)
+            else:
+                jumps.append(-2)
+
+        return [self._paths[path] for path in order], elements, jumps
+
+    def _compressed(self, values, wide=False):
+        compressed = compress_ints(values, wide=wide)
+        return struct.pack('<Q', len(compressed)) + compressed
+
+    def _paths_section(self):
+        indices, elements, jumps = self._path_tree()
+        return b''.join([
+            struct.pack('<QQ', len(self._paths), len(indices)),
+            self._compressed(indices),
+            self._compressed(elements),
+            self._compressed(jumps),
+        ])
+
+    def _tokens_section(self):
+        data = b''.join(token.encode('utf-8') + b'\x00' for token in self._tokens)
+        compressed = fast_compression(data)
+        return struct.pack('<QQQ', len(self._tokens), len(data), len(compressed)) + compressed
+
+    def _strings_section(self):
+        return struct.pack('<Q', len(self._strings)) + _pack('I', self._strings)
+
+    def _fields_section(self):
+        reps = fast_compression(_pack('Q', [rep for _, rep in self._fields]))
+        return b''.join([
+            struct.pack('<Q', len(self._fields)),
+            self._compressed([token for token, _ in self._fields]),
+            struct.pack('<Q', len(reps)),
+            reps,
+        ])
+
+    def _field_sets_section(self):
+        return struct.pack('<Q', len(self._field_sets)) + self._compressed(self._field_sets)
+
+    def _specs_section(self):
+        paths, field_sets, spec_types = zip(*self._specs) if self._specs else ((), (), ())
+        return b''.join([
+            struct.pack('<Q', len(self._specs)),
+            self._compressed(paths),
+            self._compressed(field_sets),
+            self._compressed(spec_types),
+        ])
+
+    def close(self):
+        """Write the tables and the table of contents, and finish the file"""
+        # The paths add the tokens of their elements, so they're built first
+        paths = self._paths_section()
+        sections = []
+        for name, data in (
+                ('TOKENS', self._tokens_section()),
+                ('STRINGS', self._strings_section()),
+                ('FIELDS', self._fields_section()),
+                ('FIELDSETS', self._field_sets_section()),
+                ('PATHS', paths),
+                ('SPECS', self._specs_section())):
+            sections.append((name, self._write(data), len(data)))
+
+        toc = struct.pack('<Q', len(sections)) + b''.join(
+            struct.pack('<16sqq', name.encode('ascii'), start, size)
+            for name, start, size in sections
+        )
+        toc_offset = self._write(toc)
+
+        end = self.fileobj.tell()
+        self.fileobj.seek(self._start)
+        self.fileobj.write(self._bootstrap(toc_offset))
+        self.fileobj.seek(end)
+
+
+class LazyValue(object):
+    """A value in a file that is only read when it's first needed
+
+    Args:
+        reader: The reader of the file, a CrateReader or a LazyUsdaReader
+        rep: Where the value is in the file, e.g. the ValueRep of a crate value
+    """
+    __slots__ = ('reader', 'rep')
+
+    def __init__(self, reader, rep):
+        super(LazyValue, self).__init__()
+        self.reader = reader
+        self.rep = rep
+
+    def load(self):
+        """Read the value from the file"""
+        return self.reader.value(self.rep)
+
+
+class CrateReader(object):
+    """Reads the specs of a layer from a binary crate file
+
+    The file is memory mapped, and only its tables are read up front. Values are read
+    from the map when they're asked for, and the map stays open for as long as the
+    reader, or a LazyValue from it, is alive.
+
+    Args:
+        location (str): The path of the usdc file
+
+    Attributes:
+        version (tuple): The version of the file format
+        tokens (list): The tokens table
+        strings (list): The strings table
+        paths (list): The elements of each path in the paths table
+        specs (OrderedDict): The spec type and the fields of each spec, keyed by the
+            elements of its path. The fields are an OrderedDict of ValueReps
+    """
+
+    def __init__(self, location):
+        super(CrateReader, self).__init__()
+        with open(location, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _BOOTSTRAP_SIZE:
+                raise ValueError("{} is not a usdc file".format(location))
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._data[:len(IDENTIFIER)] != IDENTIFIER:
+            raise ValueError("{} is not a usdc file".format(location))
+
+        self.version = struct.unpack_from('3B', self._data, 8)
+        if self.version < MIN_READ_VERSION:
+            raise ValueError("{} uses version {} of the usdc format, and only {} or later "
+                             "can be read".format(location, self.version, MIN_READ_VERSION))
+
+        sections = {}
+        position = self._read('q', 16)
+        for _ in range(self._read('Q', position)):
+            name, start, size = struct.unpack_from('<16sqq', self._data, position + 8)
+            sections[name.rstrip(b'\x00').decode('ascii')] = start
+            position += 32
+
+        self.tokens = self._read_tokens(sections['TOKENS'])
+        self.strings = self._read_strings(sections['STRINGS'])
+        self.paths = self._read_paths(sections['PATHS'])
+        self.specs = self._read_specs(sections['FIELDS'], sections['FIELDSETS'],
+                                      sections['SPECS'])
+
+        self._value_readers = {
+            TYPE_TOKEN_VECTOR: self._token_vector,
+            TYPE_STRING_VECTOR: self._string_vector,
+            TYPE_PATH_VECTOR: self._path_vector,
+            TYPE_DOUBLE_VECTOR: self._double_vector,
+            TYPE_SPECIFIER: self._inlined_int,
+            TYPE_PERMISSION: self._inlined_int,
+            TYPE_VARIABILITY: self._inlined_int,
+            TYPE_TIME_SAMPLES: self._time_samples,
+            TYPE_TOKEN_LIST_OP: self._list_op,
+            TYPE_STRING_LIST_OP: self._list_op,
+            TYPE_PATH_LIST_OP: self._list_op,
+            TYPE_REFERENCE_LIST_OP: self._list_op,
+            TYPE_PAYLOAD_LIST_OP: self._list_op,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Unmap the file. Values that haven't been read yet can no longer be read"""
+        self._data.close()
+
+    def _read(self, code, offset):
+        return struct.unpack_from('<' + code, self._data, offset)[0]
+
+    def _compressed_ints(self, offset, count, wide=False, signed=True):
+        """Read compressed integers, returning them and the offset after them"""
+        size = self._read('Q', offset)
+        offset += 8
+        data = fast_decompression(self._data[offset:offset + size])
+        return decode_ints(data, count, wide=wide, signed=signed), offset + size
+
+    def _buffer(self, code, offset, count):
+        """Read little endian scalars of a struct format, as an array when possible"""
+        data = self._data[offset:offset + count * struct.calcsize(code)]
+        # The array module has no bools or half floats
+        if code in ('?', 'e'):
+            return list(struct.unpack('<{}{}'.format(count, code), data))
+
+        values = array.array(code)
+        values.frombytes(data)
+        if _BIG_ENDIAN:
+            values.byteswap()
+        return values
+
+    def _read_tokens(self, offset):
+        count, size, compressed = struct.unpack_from('<QQQ', self._data, offset)
+        data = fast_decompression(self._data[offset + 24:offset + 24 + compressed])
+        return [token.decode('utf-8') for token in data[:size].split(b'\x00')[:count]]
+
+    def _read_strings(self, offset):
+        indices = self._buffer('I', offset + 8, self._read('Q', offset))
+        return [self.tokens[index] for index in indices]
+
+    def _read_paths(self, offset):
+        count, encoded = struct.unpack_from('<QQ', self._data, offset)
+        offset += 16
+        indices, offset = self._compressed_ints(offset, encoded)
+        elements, offset = self._compressed_ints(offset, encoded)
+        jumps, offset = self._compressed_ints(offset, encoded)
+
+        # Each path is followed by its first child, and a path with both a child and a
+        # sibling says how far away the sibling is. See CrateWriter._path_tree
+        paths = [None] * count
+        stack = [(0, None)] if encoded else []
+        while stack:
+            index, parent = stack.pop()
+            while True:
+                if parent is None:
+                    path = ()
+                else:
+                    token = elements[index]
+                    element = self.tokens[abs(token)]
+                    path = parent + ('.' + element if token < 0 else element,)
+                paths[indices[index]] = path
+
+                jump = jumps[index]
+                if jump > 0 or jump == -1:
+                    if jump > 0:
+                        stack.append((index + jump, parent))
+                    parent = path
+                elif jump != 0:
+                    break
+                index += 1
+
+        return paths
+
+    def _read_specs(self, fields_offset, field_sets_offset, specs_offset):
+        count = self._read('Q', fields_offset)
+        names, offset = self._compressed_ints(fields_offset + 8, count, signed=False)
+        size = self._read('Q', offset)
+        reps = fast_decompression(self._data[offset + 8:offset + 8 + size])
+        reps = struct.unpack_from('<{}Q'.format(count), reps)
+        fields = [(self.tokens[name], rep) for name, rep in zip(names, reps)]
+
+        field_sets, _ = self._compressed_ints(
+            field_sets_offset + 8, self._read('Q', field_sets_offset), signed=False
+        )
+
+        count = self._read('Q', specs_offset)
+        paths, offset = self._compressed_ints(specs_offset + 8, count, signed=False)
+        starts, offset = self._compressed_ints(offset, count, signed=False)
+        spec_types, _ = self._compressed_ints(offset, count, signed=False)
+
+        specs = collections.OrderedDict()
+        for path, start, spec_type in zip(paths, starts, spec_types):
+            end = field_sets.index(_END_OF_FIELD_SET, start)
+            specs[self.paths[path]] = spec_type, collections.OrderedDict(
+                fields[index] for index in field_sets[start:end]
+            )
+        return specs
+
+    def readable(self, rep):
+        """Return True if aud can read values of the type of a ValueRep"""
+        type_enum = (rep >> 48) & 0xFF
+        return type_enum in _TYPES_BY_ENUM or (
+            not rep & _ARRAY_BIT and type_enum in self._value_readers
+        )
+
+    def lazy(self, rep):
+        """Return the value of a ValueRep, or a LazyValue if it isn't stored in the rep"""
+        if rep & _INLINED_BIT:
+            return self.value(rep)
+        return LazyValue(self, rep)
+
+    def value(self, rep):
+        """Read the value of a ValueRep
+
+        Numeric arrays are returned as flat arrays of their scalars, and other values as
+        they would be given to an attribute.
+
+        Raises:
+            ValueError: If aud can't read values of the rep's type
+
+        """
+        type_enum = (rep >> 48) & 0xFF
+        payload = rep & _PAYLOAD_MASK
+        if not self.readable(rep):
+            raise ValueError("Values of type {} cannot be read from a usdc file".format(
+                type_enum
+            ))
+
+        if rep & _ARRAY_BIT:
+            return self._array(type_enum, payload, bool(rep & _COMPRESSED_BIT))
+        if type_enum in _TYPES_BY_ENUM:
+            return self._scalar(type_enum, payload, bool(rep & _INLINED_BIT))
+        return self._value_readers[type_enum](type_enum, payload)
+
+    def path_string(self, index):
+        """Return the path at an index of the paths table as a string"""
+        path = self.paths[index]
+        if path is not None:
+            return format_path(path)
+
+    def _scalar(self, type_enum, payload, inlined):
+        name, code, width = _TYPES_BY_ENUM[type_enum]
+        if code is None:
+            # Single asset paths are stored as tokens, unlike the elements of asset arrays
+            return self.strings[payload] if type_enum == TYPE_STRING else self.tokens[payload]
+
+        if not inlined:
+            return self._shaped(name, code, struct.unpack_from(
+                '<{}{}'.format(width, code), self._data, payload
+            ))
+
+        data = struct.pack('<Q', payload)
+        if width == 1:
+            return struct.unpack_from('<' + _INLINED_CODES.get(code, code), data)[0]
+
+        # Vectors of small integers are inlined with a byte per component, and matrices
+        # with only the diagonal of small integers are inlined as their diagonal
+        if name.startswith(('matrix', 'frame')):
+            size = int(width ** 0.5)
+            diagonal = struct.unpack_from('<{}b'.format(size), data)
+            flat = [diagonal[row] if row == column else 0
+                    for row in range(size) for column in range(size)]
+        else:
+            flat = struct.unpack_from('<{}b'.format(width), data)
+
+        if code in FLOAT_CODES:
+            flat = [float(value) for value in flat]
+        return self._shaped(name, code, flat)
+
+    @staticmethod
+    def _shaped(name, code, flat):
+        """Shape the scalars of a single value the way aud writes them"""
+        if len(flat) == 1:
+            return flat[0]
+        if name.startswith('quat'):
+            return tuple(_real_first(flat))
+        if name.startswith(('matrix', 'frame')):
+            size = int(len(flat) ** 0.5)
+            return tuple(tuple(flat[start:start + size]) for start in range(0, len(flat), size))
+        return tuple(flat)
+
+    def _array_size(self, offset):
+        """Read the size of an array, returning it and the offset of its data"""
+        if self.version < _ARRAY_SHAPE_REMOVED_VERSION:
+            offset += 4
+        if self.version < _ARRAY_SIZE64_VERSION:
+            return self._read('I', offset), offset + 4
+        return self._read('Q', offset), offset + 8
+
+    def _array(self, type_enum, offset, compressed):
+        name, code, width = _TYPES_BY_ENUM[type_enum]
+        # Empty arrays aren't written to the file at all
+        if not offset:
+            return []
+
+        count, offset = self._array_size(offset)
+        if code is None:
+            table = self.tokens if type_enum == TYPE_TOKEN else self.strings
+            return [table[index] for index in self._buffer('I', offset, count)]
+
+        if compressed and count >= MIN_COMPRESSED_ARRAY_SIZE:
+            flat = self._compressed_array(code, offset, count)
+        else:
+            flat = self._buffer(code, offset, count * width)
+
+        if name.startswith('quat'):
+            flat = _real_first(flat)
+            return flat if code == 'e' else array.array(code, flat)
+        if name.startswith(('matrix', 'frame')):
+            return [
+                self._shaped(name, code, flat[start:start + width])
+                for start in range(0, len(flat), width)
+            ]
+        return flat
+
+    def _compressed_array(self, code, offset, count):
+        if code not in FLOAT_CODES:
+            values = self._compressed_ints(
+                offset, count, wide=code in ('q', 'Q'), signed=code in ('i', 'q')
+            )[0]
+            return array.array(code, values)
+
+        if self.version < _COMPRESSED_FLOATS_VERSION:
+            return self._buffer(code, offset, count)
+
+        # Floats are either all whole numbers, stored as compressed ints, or are few
+        # enough to be stored as a lookup table and compressed indices into it
+        method = struct.unpack_from('c', self._data, offset)[0]
+        if method == b'i':
+            values = self._compressed_ints(offset + 1, count)[0]
+        elif method == b't':
+            size = self._read('I', offset + 1)
+            table = self._buffer(code, offset + 5, size)
+            indices = self._compressed_ints(
+                offset + 5 + size * struct.calcsize(code), count, signed=False
+            )[0]
+            values = [table[index] for index in indices]
+        else:
+            raise ValueError("Unknown compression {!r} for a float array".format(method))
+
+        if code == 'e':
+            return [float(value) for value in values]
+        return array.array(code, values)
+
+    def _indices(self, offset):
+        return self._buffer('I', offset + 8, self._read('Q', offset))
+
+    def _token_vector(self, type_enum, offset):
+        return [self.tokens[index] for index in self._indices(offset)]
+
+    def _string_vector(self, type_enum, offset):
+        return [self.strings[index] for index in self._indices(offset)]
+
+    def _path_vector(self, type_enum, offset):
+        return [self.path_string(index) for index in self._indices(offset)]
+
+    def _double_vector(self, type_enum, offset):
+        return self._buffer('d', offset + 8, self._read('Q', offset))
+
+    def _inlined_int(self, type_enum, payload):
+        return payload
+
+    def _time_samples(self, type_enum, offset):
+        # Each part starts with the distance to the next, from the start of the distance
+        offset += self._read('q', offset)
+        frames = self.value(self._read('Q', offset))
+        offset += 8
+        offset += self._read('q', offset)
+
+        count = self._read('Q', offset)
+        reps = struct.unpack_from('<{}Q'.format(count), self._data, offset + 8)
+        return TimeSamples(frames, [self.value(rep) for rep in reps])
+
+    def _list_op(self, type_enum, offset):
+        """Read a list op as an OrderedDict of its items for each list mode
+
+        The explicit items are under None, as they are for an Iterable
+        """
+        header = self._read('B', offset)
+        offset += 1
+
+        lists = collections.OrderedDict()
+        for mode, bit in _LIST_OP_MODES + (_LIST_OP_ORDERED,):
+            if not header & bit:
+                continue
+
+            count = self._read('Q', offset)
+            offset += 8
+            if type_enum == TYPE_REFERENCE_LIST_OP:
+                lists[mode], offset = self._references(offset, count)
+                continue
+            if type_enum == TYPE_PAYLOAD_LIST_OP:
+                lists[mode], offset = self._payloads(offset, count)
+                continue
+
+            indices = self._buffer('I', offset, count)
+            offset += count * 4
+            if type_enum == TYPE_TOKEN_LIST_OP:
+                lists[mode] = [self.tokens[index] for index in indices]
+            elif type_enum == TYPE_STRING_LIST_OP:
+                lists[mode] = [self.strings[index] for index in indices]
+            else:
+                lists[mode] = [self.path_string(index) for index in indices]
+
+        return lists
+
+    def _references(self, offset, count):
+        """Read references as (asset path, prim path) pairs
+
+        Returns:
+            tuple: The references and the offset after them
+
+        """
+        references = []
+        for _ in range(count):
+            asset, path, _, _, entries = struct.unpack_from('<IIddQ', self._data, offset)
+            offset += 32
+
+            # The custom data of a reference can't be kept, but has to be skipped. Each
+            # entry is a key followed by the distance to its ValueRep
+            for _ in range(entries):
+                offset += 4
+                offset += self._read('q', offset) + 8
+
+            references.append((self.strings[asset], self.path_string(path)))
+
+        return references, offset
+
+    def _payloads(self, offset, count):
+        """Read payloads as (asset path, prim path) pairs
+
+        Returns:
+            tuple: The payloads and the offset after them
+
+        """
+        # Payloads only have a layer offset from version 0.8.0
+        size = 24 if self.version >= (0, 8, 0) else 8
+        payloads = []
+        for _ in range(count):
+            asset, path = struct.unpack_from('<II', self._data, offset)
+            offset += size
+            payloads.append((self.strings[asset], self.path_string(path)))
+
+        return payloads, offset
@@ -0,0 +1,383 @@
+"""
+Type directed formatting of attribute values into usda text.
+
+Array attributes such as points and normals make up the bulk of most files, so rather
+than sending every element through the generic formatted_value path, values whose
+as_type is known are flattened and formatted in bulk here.
+
+NumPy is used when it is importable, but is never required.
+"""
+import array
+import itertools
+import operator
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+PY2 = sys.version_info.major == 2
+
+# Number of groups formatted per template when joining large arrays
+FORMAT_BLOCK_SIZE = 4096
+
+NUMBER_TYPES = frozenset([int, float, bool] + ([long] if PY2 else []))  # noqa: F821
+
+# Precision policies for floating point values. A precision can also be a number of
+# significant digits
+FLOAT32 = 'float32'
+DOUBLE = 'double'
+
+# The struct formats of the floating point scalars
+FLOAT_CODES = ('e', 'f', 'd')
+
+# The number of components in each of the USD value types that can be formatted in bulk
+TYPE_WIDTHS = {
+    'bool': 1,
+    'uchar': 1,
+    'int': 1,
+    'uint': 1,
+    'int64': 1,
+    'uint64': 1,
+    'half': 1,
+    'float': 1,
+    'double': 1,
+    'timecode': 1,
+}
+
+for _size in (2, 3, 4):
+    for _scalar in ('int', 'half', 'float', 'double'):
+        TYPE_WIDTHS['{}{}'.format(_scalar, _size)] = _size
+
+for _suffix in ('h', 'f', 'd'):
+    for _role in ('point3', 'normal3', 'vector3', 'color3', 'color4', 'texCoord2', 'texCoord3'):
+        TYPE_WIDTHS['{}{}'.format(_role, _suffix)] = int(_role[-1])
+    TYPE_WIDTHS['quat{}'.format(_suffix)] = 4
+
+# The struct format used to read raw bytes for each scalar type
+TYPE_CODES = {
+    'bool': '?',
+    'uchar': 'B',
+    'int': 'i',
+    'uint': 'I',
+    'int64': 'q',
+    'uint64': 'Q',
+    'half': 'e',
+    'float': 'f',
+    'double': 'd',
+    'timecode': 'd',
+}
+
+
+def type_width(as_type):
+    """Return the number of components for a USD type, or None if it isn't numeric
+
+    Args:
+        as_type (str): The USD type name, with or without the trailing []
+
+    """
+    if not as_type:
+        return
+    return TYPE_WIDTHS.get(as_type.replace('[]', ''))
+
+
+def type_code(as_type):
+    """Return the struct format of the scalars that make up a USD type, if it has one
+
+    Args:
+        as_type (str): The USD type name, e.g. point3f[] gives 'f' and int3 gives 'i'
+
+    """
+    name = (as_type or '').replace('[]', '')
+    if name not in TYPE_WIDTHS:
+        return
+
+    if name in TYPE_CODES:
+        return TYPE_CODES[name]
+
+    for scalar in ('int', 'half', 'float', 'double'):
+        if name.startswith(scalar):
+            return TYPE_CODES[scalar]
+
+    return {'h': 'e', 'f': 'f', 'd': 'd'}[name[-1]]
+
+
+def check_precision(precision):
+    """Make sure a precision policy is one that the formatter understands
+
+    Args:
+        precision: None or DOUBLE to write floats in full, FLOAT32 to write float and half
+            types with the fewest digits that read back as the same float32 value, or an
+            int to write every floating point type with that many significant digits
+
+    Returns:
+        The precision
+
+    """
+    if precision in (None, FLOAT32, DOUBLE):
+        return precision
+
+    if isinstance(precision, int) and not isinstance(precision, bool) and precision > 0:
+        return precision
+
+    raise ValueError("{!r} is not a valid float precision".format(precision))
+
+
+def is_rounded(as_type, precision):
+    """Return True if the precision changes how values of the USD type are written"""
+    if precision in (None, DOUBLE):
+        return False
+
+    code = type_code(as_type)
+    if precision == FLOAT32:
+        return code in ('e', 'f')
+
+    return code in FLOAT_CODES
+
+
+def _format_each(fmt, values):
+    """Format every number with the same format, using a single template"""
+    if not len(values):
+        return []
+    return (','.join([fmt] * len(values)) % tuple(values)).split(',')
+
+
+def float32_strings(values):
+    """Format numbers with the fewest digits that read back as the same float32 values
+
+    Most float32 values need 7 or 8 significant digits and all of them fit in 9, so each
+    length is tried in turn on the values that didn't read back correctly before.
+    Trailing zeros are dropped, so values like 0.5 stay short.
+
+    Args:
+        values (list): The numbers to format
+
+    Returns:
+        list: The formatted numbers
+
+    """
+    values = array.array('f', values)
+    texts = _format_each('%.7g', values)
+    read_back = array.array('f', map(float, texts))
+
+    pending = range(len(values))
+    checked = values
+    for digits in (8, 9):
+        pending = list(itertools.compress(pending, map(operator.ne, read_back, checked)))
+        if not pending:
+            break
+
+        checked = [values[i] for i in pending]
+        retry = _format_each('%.{}g'.format(digits), checked)
+        for index, text in zip(pending, retry):
+            texts[index] = text
+        read_back = array.array('f', map(float, retry))
+
+    return texts
+
+
+def format_numbers(flat, as_type, precision):
+    """Format flat numbers of a USD type under a precision policy
+
+    Returns:
+        list|None: The formatted numbers or None if the precision doesn't apply
+
+    """
+    if not is_rounded(as_type, precision):
+        return
+
+    if precision == FLOAT32:
+        return float32_strings(flat)
+
+    return _format_each('%.{}g'.format(precision), flat)
+
+
+def is_array_type(as_type):
+    """Return True if the USD type name describes an array"""
+    return bool(as_type) and as_type.endswith('[]')
+
+
+def is_plain(value, width):
+    """Return True if value is a list of plain numbers, or of tuples of width numbers
+
+    Anything else is left to the generic formatter, since strings, nested sequences or
+    number subclasses format differently inside a tuple.
+    """
+    if not isinstance(value, (list, tuple)):
+        return False
+
+    if width == 1:
+        return set(map(type, value)) <= NUMBER_TYPES
+
+    return (
+        bool(value)
+        and set(map(type, value)) == {tuple}
+        and set(map(len, value)) == {width}
+        and set(map(type, itertools.chain.from_iterable(value))) <= NUMBER_TYPES
+    )
+
+
+def is_buffer(value):
+    """Return True if the value is flat numeric data rather than a list of Python objects"""
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        return True
+
+    if isinstance(value, (array.array, bytearray, memoryview)):
+        return True
+
+    # Python 2 strings are bytes, and must still be treated as strings
+    return not PY2 and isinstance(value, bytes)
+
+
+def as_buffer(value, as_type):
+    """Return a flat view of a buffer value without copying its data
+
+    NumPy arrays, array.array and typed memoryviews keep their own element type, and
+    are only flattened. Raw bytes have no type of their own, so they are read as the
+    scalars that make up as_type, e.g. float32 for point3f[].
+
+    Returns:
+        The flat buffer or None if the value is not a buffer
+
+    """
+    if not is_buffer(value):
+        return
+
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        return value.reshape(-1)
+
+    if isinstance(value, array.array):
+        return value
+
+    view = memoryview(value)
+    fmt = view.format
+    if fmt in ('B', 'b', 'c'):
+        fmt = type_code(as_type)
+        # memoryview cannot cast to half floats, so those need a NumPy float16 array
+        if fmt in (None, 'e'):
+            raise TypeError("Cannot read raw bytes as {}".format(as_type))
+
+    if view.ndim != 1 or view.format != fmt:
+        view = view.cast('B').cast(fmt)
+
+    return view
+
+
+def buffer_length(value, as_type):
+    """Return the number of scalars held by a buffer value, or None if it isn't one"""
+    buf = as_buffer(value, as_type)
+    if buf is None:
+        return
+
+    return len(buf)
+
+
+def flatten(value, as_type=None):
+    """Read a buffer (array.array, memoryview, bytes or NumPy array) as flat Python numbers
+
+    Returns:
+        list|None: The flat numbers or None if the value is not a buffer
+
+    """
+    buf = as_buffer(value, as_type)
+    if buf is None:
+        return
+
+    return buf.tolist()
+
+
+def join_flat(flat, width, array=True, sep=', ', formatted=False):
+    """Format a flat sequence of numbers as a USD array or tuple
+
+    Args:
+        flat (list): The flat numbers
+        width (int): How many numbers make up each element
+        array (bool): Whether to wrap the result as an array. Otherwise width must
+            be greater than 1 and the flat numbers form a single tuple
+        sep (str): The separator between elements
+        formatted (bool): Whether the numbers have already been formatted as strings
+
+    """
+    if sep == ', ' and not formatted:
+        # The builtin repr of a list of numbers or of tuples is already valid usda,
+        # and produces it entirely in C
+        if width > 1:
+            flat = list(zip(*[iter(flat)] * width))
+        if not array:
+            return repr(flat[0])
+        return repr(list(flat))
+
+    if width == 1:
+        body = sep.join(map(str, flat))
+    else:
+        group = '({})'.format(sep.join(['%s'] * width))
+        step = FORMAT_BLOCK_SIZE * width
+        chunks = []
+        for start in range(0, len(flat), step):
+            chunk = tuple(flat[start:start + step])
+            chunks.append(sep.join([group] * (len(chunk) // width)) % chunk)
+        body = sep.join(chunks)
+
+    if not array:
+        return body
+
+    return '[{}]'.format(body)
+
+
+def format_typed(value, as_type, sep=', ', precision=None):
+    """Format a value using the fast path for its USD type
+
+    Args:
+        value: A list of numbers or tuples, or a buffer of numbers
+        as_type (str): The USD type name of the value
+        sep (str): The separator between elements
+        precision: The precision policy for floating point values. See check_precision
+
+    Returns:
+        str|None: The formatted value or None if the generic formatter should be used
+
+    """
+    width = type_width(as_type)
+    if width is None:
+        return
+
+    rounded = is_rounded(as_type, precision)
+    is_array = is_array_type(as_type)
+    if not is_array and width == 1:
+        # Scalars are formatted fine as they are, unless they need rounding
+        if rounded and type(value) in NUMBER_TYPES and not isinstance(value, bool):
+            return format_numbers([value], as_type, precision)[0]
+        return
+
+    if isinstance(value, (list, tuple)):
+        if not is_plain(value, width if is_array else 1):
+            return
+
+        if not is_array and len(value) != width:
+            return
+
+        if sep == ', ' and not rounded:
+            # The builtin repr is already valid usda and is produced entirely in C
+            return repr(list(value)) if is_array else repr(tuple(value))
+
+        flat = value
+        if is_array and width > 1:
+            flat = list(itertools.chain.from_iterable(value))
+    else:
+        flat = flatten(value, as_type)
+        if flat is None:
+            return
+
+    if not is_array and len(flat) != width:
+        return
+
+    if len(flat) % width:
+        raise ValueError("{} values cannot be grouped into {} elements of {}".format(
+            len(flat), as_type, width
+        ))
+
+    if rounded:
+        flat = format_numbers(flat, as_type, precision)
+
+    return join_flat(flat, width, array=is_array, sep=sep, formatted=rounded)
@@ -1 +1,139 @@
 __usd_version__ = "19.01"
+
+# The generated module that defines each schema class
+SCHEMA_MODULES = {
+    'APISchemaBase': 'audCore',
+    'Backdrop': 'audUI',
+    'BasisCurves': 'audGeom',
+    'BlendShape': 'audSkel',
+    'BlindDataObject': 'audKatana',
+    'Boundable': 'audGeom',
+    'Camera': 'audGeom',
+    'Capsule': 'audGeom',
+    'ClipsAPI': 'audCore',
+    'CollectionAPI': 'audCore',
+    'Cone': 'audGeom',
+    'ConnectableAPI': 'audShade',
+    'Cube': 'audGeom',
+    'Curves': 'audGeom',
+    'Cylinder': 'audGeom',
+    'CylinderLight': 'audLux',
+    'DiskLight': 'audLux',
+    'DistantLight': 'audLux',
+    'DomeLight': 'audLux',
+    'Field3DAsset': 'audVol',
+    'FieldAsset': 'audVol',
+    'FieldBase': 'audVol',
+    'GeomModelAPI': 'audGeom',
+    'GeomSubset': 'audGeom',
+    'GeometryLight': 'audLux',
+    'Gprim': 'audGeom',
+    'Imageable': 'audGeom',
+    'Light': 'audLux',
+    'LightFilter': 'audLux',
+    'LightPortal': 'audLux',
+    'ListAPI': 'audLux',
+    'LookAPI': 'audKatana',
+    'Material': 'audShade',
+    'MaterialBindingAPI': 'audShade',
+    'Mesh': 'audGeom',
+    'ModelAPI': 'audCore',
+    'MotionAPI': 'audGeom',
+    'NodeGraph': 'audShade',
+    'NodeGraphNodeAPI': 'audUI',
+    'NurbsCurves': 'audGeom',
+    'NurbsPatch': 'audGeom',
+    'OpenVDBAsset': 'audVol',
+    'PackedJointAnimation': 'audSkel',
+    'PointBased': 'audGeom',
+    'PointInstancer': 'audGeom',
+    'Points': 'audGeom',
+    'PrimvarsAPI': 'audGeom',
+    'PxrAovLight': 'audRi',
+    'PxrBarnLightFilter': 'audRi',
+    'PxrCookieLightFilter': 'audRi',
+    'PxrEnvDayLight': 'audRi',
+    'PxrIntMultLightFilter': 'audRi',
+    'PxrRampLightFilter': 'audRi',
+    'PxrRodLightFilter': 'audRi',
+    'RectLight': 'audLux',
+    'RiLightAPI': 'audRi',
+    'RiLightFilterAPI': 'audRi',
+    'RiLightPortalAPI': 'audRi',
+    'RiMaterialAPI': 'audRi',
+    'RiSplineAPI': 'audRi',
+    'RiTextureAPI': 'audRi',
+    'RisBxdf': 'audRi',
+    'RisIntegrator': 'audRi',
+    'RisObject': 'audRi',
+    'RisOslPattern': 'audRi',
+    'RisPattern': 'audRi',
+    'SceneGraphPrimAPI': 'audUI',
+    'Scope': 'audGeom',
+    'Shader': 'audShade',
+    'ShadowAPI': 'audLux',
+    'ShapingAPI': 'audLux',
+    'SkelAnimation': 'audSkel',
+    'SkelBindingAPI': 'audSkel',
+    'SkelRoot': 'audSkel',
+    'Skeleton': 'audSkel',
+    'Sphere': 'audGeom',
+    'SphereLight': 'audLux',
+    'StatementsAPI': 'audRi',
+    'Volume': 'audVol',
+    'Xform': 'audGeom',
+    'Xformable': 'audGeom',
+}
+
+# The schema class of each prim type
+SCHEMA_TYPES = {
+    'Backdrop': 'Backdrop',
+    'BasisCurves': 'BasisCurves',
+    'BlendShape': 'BlendShape',
+    'BlindDataObject': 'BlindDataObject',
+    'Camera': 'Camera',
+    'Capsule': 'Capsule',
+    'Cone': 'Cone',
+    'Cube': 'Cube',
+    'Cylinder': 'Cylinder',
+    'CylinderLight': 'CylinderLight',
+    'DiskLight': 'DiskLight',
+    'DistantLight': 'DistantLight',
+    'DomeLight': 'DomeLight',
+    'Field3DAsset': 'Field3DAsset',
+    'GeomSubset': 'GeomSubset',
+    'GeometryLight': 'GeometryLight',
+    'LightFilter': 'LightFilter',
+    'LightPortal': 'LightPortal',
+    'Material': 'Material',
+    'Mesh': 'Mesh',
+    'NodeGraph': 'NodeGraph',
+    'NurbsCurves': 'NurbsCurves',
+    'NurbsPatch': 'NurbsPatch',
+    'OpenVDBAsset': 'OpenVDBAsset',
+    'PackedJointAnimation': 'PackedJointAnimation',
+    'PointInstancer': 'PointInstancer',
+    'Points': 'Points',
+    'PxrAovLight': 'PxrAovLight',
+    'PxrBarnLightFilter': 'PxrBarnLightFilter',
+    'PxrCookieLightFilter': 'PxrCookieLightFilter',
+    'PxrEnvDayLight': 'PxrEnvDayLight',
+    'PxrIntMultLightFilter': 'PxrIntMultLightFilter',
+    'PxrRampLightFilter': 'PxrRampLightFilter',
+    'PxrRodLightFilter': 'PxrRodLightFilter',
+    'RectLight': 'RectLight',
+    'RisBxdf': 'RisBxdf',
+    'RisIntegrator': 'RisIntegrator',
+    'RisObject': 'RisObject',
+    'RisOslPattern': 'RisOslPattern',
+    'RisPattern': 'RisPattern',
+    'Scope': 'Scope',
+    'Shader': 'Shader',
+    'SkelAnimation': 'SkelAnimation',
+    'SkelRoot': 'SkelRoot',
+    'Skeleton': 'Skeleton',
+    'Sphere': 'Sphere',
+    'SphereLight': 'SphereLight',
+    'Volume': 'Volume',
+    'Xform': 'Xform',
+}
@@ -0,0 +1,241 @@
+"""
+Columnar storage for time samples.
+
+Setting keyframes one at a time keeps a dictionary entry and a Python value for every
+frame of every attribute. TimeSamples instead holds all the frames of an attribute in
+one sorted buffer and all of its values in another, and behaves like the read-only
+mapping of frame to value that the rest of aud expects.
+"""
+import array
+import bisect
+
+from .formatting import NUMBER_TYPES, as_buffer, is_buffer, numpy
+
+
+def _is_sorted(frames):
+    if numpy is not None and isinstance(frames, numpy.ndarray):
+        return bool((numpy.diff(frames) > 0).all())
+
+    return all(a < b for a, b in zip(frames, frames[1:]))
+
+
+def _take(values, order):
+    """Reorder a sequence or buffer by a list of indices"""
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return values[order]
+
+    if isinstance(values, array.array):
+        return array.array(values.typecode, [values[i] for i in order])
+
+    return [values[i] for i in order]
+
+
+def _frame(frame):
+    """Return whole frames as ints so they write out the same as set_keyframe would"""
+    return int(frame) if float(frame).is_integer() else frame
+
+
+class TimeSamples(object):
+    """Time samples of an attribute stored as a column of frames and a column of values
+
+    Args:
+        frames: A 1-D sequence or buffer of frames
+        values: Either a sequence with one value per frame, or a buffer holding the same
+            number of values for every frame (N x k, or flat with N * k entries)
+        as_type (str): The USD type of the values, used to read raw bytes
+    """
+    __slots__ = ('frames', 'values', 'width')
+
+    def __init__(self, frames, values, as_type=None):
+        super(TimeSamples, self).__init__()
+        if not is_buffer(frames):
+            frames = array.array('d', frames)
+        elif numpy is None or not isinstance(frames, numpy.ndarray):
+            frames = as_buffer(frames, 'double[]')
+
+        count = len(frames)
+        width = None
+        if is_buffer(values):
+            flat = as_buffer(values, as_type)
+            if len(flat) != count:
+                if not count or len(flat) % count:
+                    raise ValueError("{} values cannot be split across {} frames".format(
+                        len(flat), count
+                    ))
+                width = len(flat) // count
+            values = flat
+        elif len(values) != count:
+            raise ValueError("Got {} values for {} frames".format(len(values), count))
+
+        if not _is_sorted(frames):
+            order = sorted(range(count), key=frames.__getitem__)
+            frames = _take(frames, order)
+            if width:
+                order = [i * width + j for i in order for j in range(width)]
+            values = _take(values, order)
+
+            if not _is_sorted(frames):
+                raise ValueError("Time samples cannot have the same frame more than once")
+
+        self.frames = frames
+        self.values = values
+        self.width = width
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __bool__(self):
+        return len(self.frames) > 0
+
+    __nonzero__ = __bool__
+
+    def __iter__(self):
+        for frame in self.frames:
+            yield _frame(frame)
+
+    def __contains__(self, frame):
+        return self._index(frame) is not None
+
+    def __getitem__(self, frame):
+        index = self._index(frame)
+        if index is None:
+            raise KeyError(frame)
+        return self.value_at(index)
+
+    def _index(self, frame):
+        index = bisect.bisect_left(self.frames, frame)
+        if index < len(self.frames) and self.frames[index] == frame:
+            return index
+
+    def value_at(self, index):
+        """Return the value of the sample at the given index"""
+        if self.width is None:
+            return self.values[index]
+
+        start = index * self.width
+        return self.values[start:start + self.width]
+
+    def items(self):
+        """Iterate over the frames and values in frame order, straight from the columns"""
+        for index, frame in enumerate(self.frames):
+            yield _frame(frame), self.value_at(index)
+
+    def set(self, frame, value):
+        """Set the value at a single frame, keeping the samples sorted
+
+        The values are unpacked into one Python object per sample, since a single value
+        can't be added to a buffer with a fixed number of values per frame.
+        """
+        if self.width is not None or not isinstance(self.values, list):
+            self.values = [self.value_at(i) for i in range(len(self))]
+            self.width = None
+        if not isinstance(self.frames, array.array):
+            self.frames = array.array('d', self.frames)
+
+        index = self._index(frame)
+        if index is not None:
+            self.values[index] = value
+            return
+
+        index = bisect.bisect_left(self.frames, frame)
+        self.frames.insert(index, frame)
+        self.values.insert(index, value)
+
+
+def _numbers(value):
+    """Return a value as a flat tuple of numbers, or None if it isn't numeric"""
+    if is_buffer(value):
+        try:
+            return tuple(as_buffer(value, None).tolist())
+        except TypeError:
+            return
+
+    if isinstance(value, (list, tuple)):
+        flat = []
+        for item in value:
+            item = _numbers(item)
+            if item is None:
+                return
+            flat.extend(item)
+        return tuple(flat)
+
+    if isinstance(value, bool) or not isinstance(value, tuple(NUMBER_TYPES)):
+        return
+
+    return (value,)
+
+
+def reduce_samples(frames, values, tolerance=0.0, interpolate=True):
+    """Find the time samples that are needed to reproduce an animation
+
+    Samples are dropped when they can be recovered from the samples that are kept,
+    within tolerance for every component. With interpolate, that is when they lie on
+    the straight line between their neighbours, which also covers constant runs, and
+    otherwise (for held types like ints and tokens) when they repeat the value before
+    them. The first and last samples are always kept.
+
+    This uses a single pass, keeping the range of slopes from the last kept sample that
+    stays within tolerance of every sample skipped so far.
+
+    Args:
+        frames (list): The frames in ascending order
+        values (list): The value at each frame
+        tolerance (float): How far a dropped sample may be from the reduced animation
+        interpolate (bool): Whether the values are linearly interpolated between samples
+
+    Returns:
+        list: The indices of the samples to keep
+    """
+    count = len(frames)
+    if count <= 2:
+        return list(range(count))
+
+    vectors = [_numbers(value) for value in values]
+    kept = [0]
+
+    if not interpolate or any(v is None for v in vectors):
+        for index in range(1, count - 1):
+            previous, current = vectors[kept[-1]], vectors[index]
+            if previous is None or current is None or len(previous) != len(current):
+                same = values[kept[-1]] == values[index]
+            else:
+                same = all(abs(a - b) <= tolerance for a, b in zip(previous, current))
+            if not same:
+                kept.append(index)
+
+        kept.append(count - 1)
+        return kept
+
+    infinity = float('inf')
+    anchor = 0
+    low = high = None
+    for end in range(2, count):
+        middle = end - 1
+        start_frame, start = frames[anchor], vectors[anchor]
+
+        # Narrow the allowed slopes so the line stays within tolerance of the middle
+        span = float(frames[middle] - start_frame)
+        if len(vectors[middle]) != len(start):
+            low = None
+        else:
+            if low is None:
+                low = [-infinity] * len(start)
+                high = [infinity] * len(start)
+            for i, (a, b) in enumerate(zip(start, vectors[middle])):
+                low[i] = max(low[i], (b - tolerance - a) / span)
+                high[i] = min(high[i], (b + tolerance - a) / span)
+
+        # The middle sample can go if the line out to the end sample stays in range
+        span = float(frames[end] - start_frame)
+        if low is not None and len(vectors[end]) == len(start) and all(
+            lo <= (b - a) / span <= hi
+            for lo, hi, a, b in zip(low, high, start, vectors[end])
+        ):
+            continue
+
+        kept.append(middle)
+        anchor = middle
+        low = high = None
+
+    kept.append(count - 1)
+    return kept
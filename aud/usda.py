@@ -0,0 +1,1041 @@
+"""
+Reading of usda text files.
+
+The file is memory mapped and read in a single pass by a tokenizer that scans the map
+with one regular expression, so the text is never decoded or copied in full. A recursive
+descent parser builds the stage from the tokens as they're read.
+
+Numeric arrays like points and normals make up the bulk of most files. Rather than
+tokenizing them a number at a time, an array or tuple that holds nothing but numbers is
+matched as a single token, and all of its numbers are converted in one go into a flat
+array.array, which is the same form that attributes keep buffers in.
+
+Files can also be read lazily, with LazyUsdaReader. A structural scan that only looks
+for prims and the braces around them indexes where each prim is in the text, and the
+attributes of a prim are only parsed from the map the first time they're used.
+"""
+import array
+import io
+import mmap
+import re
+import warnings
+
+from .base import (
+    Attribute, IterObject, Iterable, Prim, Stage, Variant, VariantSet, _ordered_dict,
+    schema_class
+)
+from .crate import IDENTIFIER, LazyValue
+from .formatting import FLOAT_CODES, type_code
+from .timesamples import TimeSamples
+
+# The header that every usda file starts with
+HEADER = b'#usda'
+
+# A token and the whitespace and comments in front of it. Character classes are spelled
+# out, since they're matched faster than \d and \s. Arrays and tuples that hold
+# nothing but numbers are matched whole, as a single numbers token, and so are time
+# samples that hold nothing but numbers. The end of the text is matched without a kind
+_TOKEN = re.compile(br'''
+    (?:\s+|\#[^\n]*)*
+    (?:
+        (?P<numbers>\[[-+0-9.,()eEinfa \t\r\n]*\]
+            |\([-+.,eEinfa \t\r\n]*[0-9][-+0-9.,eEinfa \t\r\n]*\))
+      | (?P<samples>\{[-+0-9.,()\[\]eEinfa \t\r\n]*:[-+0-9.,:()\[\]eEinfa \t\r\n]*\})
+      | (?P<string>"""(?:[^"\\]|\\.|"(?!""))*"""|\'\'\'(?:[^'\\]|\\.|'(?!''))*\'\'\'
+            |"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+      | (?P<asset>@@@.*?@@@|@[^@\n]*@)
+      | (?P<path><[^>\n]*>)
+      | (?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?(?![\w.])|-inf\b)
+      | (?P<name>[A-Za-z_][\w:.]*(?:\[\])?)
+      | (?P<punctuation>[()\[\]{}=,;:])
+      | (?P<error>.)
+      | \Z
+    )
+''', re.X | re.S)
+
+# What the structural scan of a lazy read looks for: the headers of prims and variant
+# sets, and the braces and parentheses that delimit statements. Everything in between,
+# including strings, comments and values made of numbers, is skipped within the same
+# match, so the scan only ever sees the few tokens it needs
+_STRUCTURE = re.compile(br'''
+    (?:
+        [^"'\#@<\[{}()A-Za-z_]+
+      | (?!(?:def|over|class)[ \t]+(?:[A-Za-z_][\w:]*[ \t]+)?"|variantSet[ \t]+")
+        [A-Za-z_][\w:.]*
+      | """(?:[^"\\]|\\.|"(?!""))*"""|\'\'\'(?:[^'\\]|\\.|'(?!''))*\'\'\'
+      | "(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'
+      | \#[^\n]*|@@@.*?@@@|@[^@\n]*@|<[^>\n]*>
+      | \[[-+0-9.,()eEinfa \t\r\n]*\]|\([-+.,eEinfa \t\r\n]*[0-9][-+0-9.,eEinfa \t\r\n]*\)
+      | \{[-+0-9.,()\[\]eEinfa \t\r\n]*:[-+0-9.,:()\[\]eEinfa \t\r\n]*\}
+      | [\[@<"']
+    )*
+    (?:
+        (?P<prim>(?:def|over|class)[ \t]+(?:[A-Za-z_][\w:]*[ \t]+)?"[^"\n]*")
+      | (?P<set>variantSet[ \t]+"[^"\n]*")
+      | (?P<open>[{(])
+      | (?P<close>[})])
+      | \Z
+    )
+''', re.X | re.S)
+
+# A frame and its value in a samples token, which holds time samples that are all numbers
+_SAMPLE = re.compile(br'''
+    ([-+\d.eE]+)\s*:\s*
+    (\[[^\]]*\]|\((?:[^()]|\([^()]*\))*\)|[^,\s]+)
+''', re.X)
+
+# The parts of a numbers token, for when it's read as nested lists and tuples
+_NUMBER_PARTS = re.compile(br'[\[\]()]|[^\s,\[\]()]+')
+_SEPARATORS = bytes(bytearray(32 if c == ord(',') else c for c in range(256)))
+
+_ESCAPE = re.compile(r'\\(.)', re.S)
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '0': '\0'}
+
+_SPECIFIERS = (b'def', b'over', b'class')
+_VARIABILITY = (b'uniform', b'varying', b'config')
+
+# List op keywords and the modes that Iterable uses for them
+_LIST_MODES = {b'add': 'add', b'prepend': 'prepend', b'append': 'append', b'delete': 'del'}
+_REORDER = b'reorder'
+
+# Metadata of prims that aud keeps as Iterables, and the kind of items they hold
+_LIST_FIELDS = {
+    'references': 'reference',
+    'reference': 'reference',
+    'payload': 'reference',
+    'inherits': 'path',
+    'variantSets': 'name',
+    'apiSchemas': 'name',
+}
+
+# Metadata that aud has no model for, and that can't be kept as a property. Like
+# everything else that's left out when reading, it's warned about
+_SKIPPED_FIELDS = frozenset(['subLayers'])
+
+# Property suffixes that aud has no model for, and what the warnings call them
+_UNSUPPORTED_SUFFIXES = (('.connect', 'attribute connections'), ('.spline', 'splines'))
+
+# How many of the paths that something was left out of are listed in a warning
+_WARNED_PATHS = 3
+
+_TIME_SAMPLES = '.timeSamples'
+# Names that are read as values. inf and nan are also valid property names, so they're
+# tokenized as names
+_NAMED_VALUES = {
+    'true': True, 'false': False, 'True': True, 'False': False,
+    'inf': float('inf'), 'nan': float('nan'),
+}
+
+# The punctuation that opens a group and the punctuation that closes it
+_GROUPS = {b'(': b')', b'[': b']', b'{': b'}'}
+
+# Returned for values that are blocked with None, since None is also a valid value
+_BLOCKED = object()
+
+
+def _error(data, location, message, position):
+    """Return a ValueError for a position in the text, with its line number"""
+    line = data[:position].count(b'\n') + 1
+    return ValueError("{} at line {} of {}".format(message, line, location))
+
+
+class UnsupportedDataWarning(UserWarning):
+    """Warns about what was left out of a stage because aud has no model for it, like
+    dictionary metadata and attribute connections
+    """
+
+
+def _spec_path(obj):
+    """Return the path of a prim or variant the way USD writes it, for warnings"""
+    if isinstance(obj, Variant):
+        return '{}{{{}={}}}'.format(obj.parent.parent.path(), obj.parent.name, obj.name)
+    return obj.path()
+
+
+def _warn_dropped(dropped, location):
+    """Warn once about each kind of thing that was left out of a stage that was read
+
+    Args:
+        dropped (dict): The paths that something was left out of, by what it was
+        location (str): Where the text came from
+
+    """
+    for what, paths in dropped.items():
+        listed = ', '.join('<{}>'.format(path) for path in paths[:_WARNED_PATHS])
+        if len(paths) > _WARNED_PATHS:
+            listed += ' and {} more'.format(len(paths) - _WARNED_PATHS)
+        warnings.warn("Left out {} that aud has no model for at {} when reading {}".format(
+            what, listed, location
+        ), UnsupportedDataWarning, stacklevel=3)
+
+
+def _unescape(text):
+    """Return the value of a quoted string"""
+    quote = 3 if text[:3] in ('"""', "'''") else 1
+    text = text[quote:-quote]
+    if '\\' in text:
+        text = _ESCAPE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), text)
+    return text
+
+
+def _number(text):
+    """Return the int or float that a number token holds"""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+# How single numbers are read for each struct format, when it matters
+_SCALARS = {'e': float, 'f': float, 'd': float}
+
+
+def _read_numbers(text, code):
+    """Read the text of a number, or of an array or tuple of them, as a value of a type
+
+    Args:
+        text (bytes): The text
+        code (str): The struct format of the type's scalars, or None to keep the numbers
+            as ints and floats as they're written
+
+    """
+    first = text[:1]
+    if first not in (b'[', b'('):
+        return _number(text) if code is None else _SCALARS.get(code, _number)(text)
+
+    if code is None or code == '?':
+        return _nested_numbers(text)
+
+    words = text.translate(_SEPARATORS, b'()[]').split()
+    convert = float if code in FLOAT_CODES else int
+    if first == b'(':
+        return tuple(map(convert, words))
+
+    # Half floats can't be held by an array.array
+    if code == 'e':
+        return list(map(float, words))
+    return array.array(code, map(convert, words))
+
+
+def _nested_numbers(text):
+    """Return the lists and tuples of numbers that a numbers token holds"""
+    stack = [[]]
+    for part in _NUMBER_PARTS.findall(text):
+        if part in (b'[', b'('):
+            stack.append([])
+        elif part == b']':
+            values = stack.pop()
+            stack[-1].append(values)
+        elif part == b')':
+            values = stack.pop()
+            stack[-1].append(tuple(values))
+        else:
+            stack[-1].append(_number(part))
+    return stack[0][0]
+
+
+class UsdaReader(object):
+    """Reads a stage from usda text
+
+    Args:
+        data: The text as bytes or a memory map
+        location (str): Where the text came from, used in error messages
+        start (int): The offset in the text to start reading from
+        end (int): The offset in the text to stop reading at. Defaults to the end
+        dropped (dict): Where to note what was left out. See below
+
+    Attributes:
+        dropped (dict): The paths of the prims and properties that something was left
+            out of because aud has no model for it, by what it was. read warns about
+            them with UnsupportedDataWarning once it's done
+
+    """
+
+    def __init__(self, data, location='<usda>', start=0, end=None, dropped=None):
+        super(UsdaReader, self).__init__()
+        self.data = data
+        self.location = location
+        self.dropped = _ordered_dict() if dropped is None else dropped
+        self.end = len(data) if end is None else end
+        self.kind = None
+        self.token = b''
+        self._matches = _TOKEN.finditer(data, start, self.end)
+        self._match = None
+
+    def drop(self, what, obj, name=None):
+        """Note that something was left out of an object, to be warned about
+
+        Args:
+            what (str): What was left out, e.g. 'customData' metadata
+            obj: The stage, prim, variant or attribute that it was left out of
+            name (str): The name of the property it was left out of, when there's no
+                attribute for it
+
+        """
+        path = self.path_of(obj)
+        if name is not None:
+            path = '{}.{}'.format(path, name)
+        self.dropped.setdefault(what, []).append(path)
+
+    def path_of(self, obj):
+        """Return the path of an object that's being read"""
+        if isinstance(obj, Attribute):
+            return '{}.{}'.format(self.path_of(obj.parent), obj.name)
+        return _spec_path(obj)
+
+    def error(self, message):
+        """Return a ValueError for the current token, with its line number"""
+        return _error(self.data, self.location, message, self.position())
+
+    def position(self):
+        """Return the offset of the current token in the text"""
+        return self._match.start(self.kind) if self.kind else self.end
+
+    def advance(self):
+        """Move on to the next token"""
+        match = self._match = next(self._matches, None)
+        kind = self.kind = match and match.lastgroup
+        self.token = match.group(kind) if kind else b''
+        if kind == 'error':
+            del match
+            raise self.error("Unexpected character {!r}".format(self.token))
+
+    def close(self):
+        """Let go of the tokenizer, which holds on to the text it reads"""
+        self._matches = None
+        self._match = None
+
+    def accept(self, token):
+        """Move past the current token if it is the given one
+
+        Strings, asset paths and paths keep their delimiters, so they're never mistaken
+        for punctuation or keywords.
+        """
+        if self.token != token:
+            return False
+        self.advance()
+        return True
+
+    def expect(self, token):
+        if not self.accept(token):
+            raise self.error("Expected {} but found {!r}".format(
+                token.decode('ascii'), self.token.decode('utf-8', 'replace')
+            ))
+
+    def name(self):
+        """Return the current token as a name and move past it"""
+        if self.kind != 'name':
+            raise self.error("Expected a name but found {!r}".format(
+                self.token.decode('utf-8', 'replace')
+            ))
+        text = self.token.decode('utf-8')
+        self.advance()
+        return text
+
+    def string(self):
+        """Return the current token as a string and move past it"""
+        if self.kind != 'string':
+            raise self.error("Expected a string but found {!r}".format(
+                self.token.decode('utf-8', 'replace')
+            ))
+        text = _unescape(self.token.decode('utf-8'))
+        self.advance()
+        return text
+
+    def read(self):
+        """Read the whole text into a new stage
+
+        Returns:
+            Stage: The stage
+
+        """
+        if self.data[:len(HEADER)] != HEADER:
+            raise ValueError("{} is not a usda file".format(self.location))
+
+        stage = Stage()
+        # The header is read as a comment
+        self.advance()
+        if self.accept(b'('):
+            self.metadata(stage)
+
+        while self.kind is not None:
+            self.prim(stage)
+
+        _warn_dropped(self.dropped, self.location)
+        return stage
+
+    def metadata(self, obj):
+        """Read the metadata between parentheses into properties of an object
+
+        References, inherits, variant sets and API schemas of prims are read as
+        Iterables. The documentation string is skipped, and values that aud can't
+        represent, like dictionaries and list ops of other fields, are noted in dropped.
+        """
+        while not self.accept(b')'):
+            if self.accept(b';'):
+                continue
+
+            if self.kind == 'string':
+                # The documentation of the object, or the comment of a stage
+                self.advance()
+                continue
+
+            mode = _LIST_MODES.get(self.token, False) if self.kind == 'name' else False
+            reorder = self.token == _REORDER and self.kind == 'name'
+            if mode or reorder:
+                self.advance()
+            else:
+                mode = None
+
+            key = self.name()
+            self.expect(b'=')
+
+            item_kind = _LIST_FIELDS.get(key)
+            if item_kind is not None and isinstance(obj, Prim) and not reorder:
+                # Lists that are explicitly emptied aren't modelled by aud
+                iterable = self.list_value(key, mode, item_kind, obj)
+                if iterable:
+                    obj.add_list(iterable)
+                continue
+
+            value = self.value()
+            if mode is not None or reorder:
+                prefix = _REORDER.decode('ascii') if reorder else mode
+                self.drop("'{} {}' metadata".format(prefix, key), obj)
+            elif value is _BLOCKED:
+                self.drop("blocked '{}' metadata".format(key), obj)
+            elif isinstance(value, dict) or key in _SKIPPED_FIELDS:
+                self.drop("'{}' metadata".format(key), obj)
+            else:
+                obj.set_property(key, value)
+
+    def list_value(self, key, mode, item_kind, prim):
+        """Read a single item or a list of them into an Iterable for a prim"""
+        iterable = Iterable(key, mode=mode)
+        if self.accept(b'['):
+            while not self.accept(b']'):
+                iterable.append(self.list_item(item_kind, prim))
+                self.accept(b',')
+        elif not self.accept(b'None'):
+            iterable.append(self.list_item(item_kind, prim))
+        return iterable
+
+    def list_item(self, item_kind, prim):
+        if item_kind == 'name':
+            return IterObject(self.value())
+
+        if item_kind == 'path':
+            return IterObject(object_name=self.value())
+
+        asset = None
+        if self.kind == 'asset':
+            asset = self.value()
+        object_name = None
+        if self.kind == 'path':
+            object_name = self.value()
+        if asset is None and object_name is None:
+            raise self.error("Expected a reference")
+
+        if self.accept(b'('):
+            self.skip_group(b')')
+            self.drop('layer offsets and custom data of references', prim)
+
+        return IterObject(asset, object_name=object_name, is_file=asset is not None)
+
+    def skip_group(self, close):
+        """Skip tokens up to and including the one that closes a group
+
+        Returns:
+            int: The offset of the end of the group in the text
+
+        """
+        depth = 1
+        closing = [close]
+        while depth:
+            if self.kind is None:
+                raise self.error("Expected {}".format(close.decode('ascii')))
+            if self.kind == 'punctuation':
+                if self.token in _GROUPS:
+                    closing.append(_GROUPS[self.token])
+                    depth += 1
+                elif self.token == closing[-1]:
+                    closing.pop()
+                    depth -= 1
+            end = self._match.end()
+            self.advance()
+        return end
+
+    def skip_value(self):
+        """Move past a value without reading it
+
+        Returns:
+            int: The offset of the end of the value in the text
+
+        """
+        if self.kind is None:
+            raise self.error("Expected a value")
+
+        token = self.token
+        is_group = self.kind == 'punctuation' and token in _GROUPS
+        end = self._match.end()
+        self.advance()
+        if is_group:
+            end = self.skip_group(_GROUPS[token])
+        return end
+
+    def prim(self, parent):
+        """Read a prim statement and everything inside it"""
+        prim = self.prim_header(parent)
+        self.expect(b'{')
+        self.body(prim)
+        return prim
+
+    def prim_header(self, parent):
+        """Read the specifier, type, name and metadata of a prim and add it to a parent"""
+        specifier = self.token
+        if specifier not in _SPECIFIERS or self.kind != 'name':
+            raise self.error("Expected def, over or class but found {!r}".format(
+                specifier.decode('utf-8', 'replace')
+            ))
+        self.advance()
+
+        as_type = None
+        if self.kind == 'name':
+            as_type = self.name()
+        name = self.string()
+
+        prim = schema_class(as_type)(
+            name,
+            is_class=specifier == b'class',
+            is_over=specifier == b'over',
+            as_type=as_type
+        )
+        parent.add_child(prim)
+
+        if self.accept(b'('):
+            self.metadata(prim)
+        return prim
+
+    def body(self, prim):
+        """Read the statements between the braces of a prim or variant"""
+        while not self.accept(b'}'):
+            if self.kind is None:
+                raise self.error("Expected }")
+            self.statement(prim)
+
+    def statement(self, prim):
+        """Read a statement in the body of a prim or variant"""
+        if self.kind == 'name' and self.token in _SPECIFIERS:
+            self.prim(prim)
+        elif self.accept(b'variantSet'):
+            self.variant_set(prim)
+        elif self.accept(_REORDER):
+            # The order of children and properties is the order they're written in
+            self.name()
+            self.expect(b'=')
+            self.value()
+        elif not self.accept(b';'):
+            self.prop(prim)
+
+    def variant_set(self, prim):
+        variant_set = prim.add_child(VariantSet(self.string()))
+        self.expect(b'=')
+        self.expect(b'{')
+        while not self.accept(b'}'):
+            variant = variant_set.add_child(Variant(self.string()))
+            if self.accept(b'('):
+                self.metadata(variant)
+            self.expect(b'{')
+            self.body(variant)
+
+    def prop(self, prim):
+        """Read an attribute or relationship statement"""
+        mode = None
+        if self.kind == 'name' and self.token in _LIST_MODES:
+            mode = self.token
+            self.advance()
+        self.accept(b'custom')
+
+        is_uniform = False
+        if self.kind == 'name' and self.token in _VARIABILITY:
+            is_uniform = self.token == b'uniform'
+            self.advance()
+
+        as_type = self.name()
+        name = self.name()
+        if as_type == 'rel':
+            return self.relationship(prim, name, mode)
+
+        suffix = None
+        unsupported = None
+        if name.endswith(_TIME_SAMPLES):
+            name = name[:-len(_TIME_SAMPLES)]
+            suffix = _TIME_SAMPLES
+        for candidate, what in _UNSUPPORTED_SUFFIXES:
+            if name.endswith(candidate):
+                name = name[:-len(candidate)]
+                suffix = candidate
+                unsupported = what
+
+        attr = None
+        if self.accept(b'='):
+            if unsupported is not None:
+                self.value()
+                self.drop(unsupported, prim, name)
+            elif suffix == _TIME_SAMPLES:
+                attr = self.attribute(prim, name, as_type, is_uniform)
+                self.time_samples(attr)
+            else:
+                value = self.typed_value(as_type)
+                if isinstance(value, dict):
+                    self.drop('dictionary attributes', prim, name)
+                elif value is not _BLOCKED:
+                    attr = self.attribute(prim, name, as_type, is_uniform)
+                    attr.set_value(value)
+
+        if self.accept(b'('):
+            if attr is None:
+                # Declarations without a value aren't written out by aud, so neither is
+                # their metadata
+                self.skip_group(b')')
+            else:
+                self.metadata(attr)
+
+    def attribute(self, prim, name, as_type, is_uniform):
+        """Return the attribute of a prim with a name, adding it if it isn't there yet"""
+        attr = prim.get_attribute(name)
+        if attr is None:
+            attr = prim.add_attribute(Attribute(name, as_type=as_type, is_uniform=is_uniform))
+        attr.was_set = True
+        return attr
+
+    def relationship(self, prim, name, mode):
+        if not self.accept(b'='):
+            if self.accept(b'('):
+                self.skip_group(b')')
+            return
+
+        value = self.value()
+        targets = value if isinstance(value, list) else [value]
+        targets = [IterObject(object_name=target) for target in targets
+                   if target is not _BLOCKED]
+
+        attr = None
+        if targets and mode != b'delete':
+            attr = self.attribute(prim, name, 'rel', False)
+            attr.set_value(targets[0] if len(targets) == 1 else targets)
+
+        if self.accept(b'('):
+            if attr is None:
+                self.skip_group(b')')
+            else:
+                self.metadata(attr)
+
+    def time_samples(self, attr):
+        """Read the time samples of an attribute between braces"""
+        attr.set_keyframes(*self.samples(attr.as_type))
+
+    def samples(self, as_type):
+        """Read time samples between braces as a list of frames and a list of values"""
+        code = type_code(as_type)
+        frames = []
+        values = []
+
+        if self.kind == 'samples':
+            try:
+                for frame, value in _SAMPLE.findall(self.token):
+                    frames.append(_number(frame))
+                    values.append(_read_numbers(value, code))
+            except (ValueError, OverflowError):
+                raise self.error("Invalid number for {}".format(as_type))
+            self.advance()
+        else:
+            self.expect(b'{')
+            while not self.accept(b'}'):
+                if self.kind != 'number':
+                    raise self.error("Expected a time code")
+                frames.append(_number(self.token))
+                self.advance()
+                self.expect(b':')
+
+                value = self.typed_value(as_type, code)
+                values.append(None if value is _BLOCKED else value)
+                self.accept(b',')
+
+        return frames, values
+
+    def typed_value(self, as_type, code=None):
+        """Read a value of a USD type, converting arrays and tuples of numbers in bulk
+
+        Args:
+            as_type (str): The USD type name of the value
+            code (str): The struct format of the type, if it's already known
+
+        """
+        if self.kind not in ('numbers', 'number'):
+            return self.value()
+
+        token = self.token
+        self.advance()
+        try:
+            return _read_numbers(token, code or type_code(as_type))
+        except (ValueError, OverflowError):
+            raise self.error("Invalid number for {}".format(as_type))
+
+    def value(self):
+        """Read any value, returning dictionaries as dicts and value blocks as _BLOCKED"""
+        kind = self.kind
+        token = self.token
+        if kind is None:
+            raise self.error("Expected a value")
+
+        if kind == 'string':
+            return self.string()
+
+        if kind in ('asset', 'path'):
+            quote = 3 if kind == 'asset' and token.startswith(b'@@@') else 1
+            self.advance()
+            return token[quote:-quote].decode('utf-8')
+
+        if kind == 'number':
+            self.advance()
+            return _number(token)
+
+        if kind == 'numbers':
+            self.advance()
+            return _nested_numbers(token)
+
+        if kind == 'name':
+            text = self.name()
+            if text == 'None':
+                return _BLOCKED
+            return _NAMED_VALUES.get(text, text)
+
+        self.advance()
+        if token == b'[':
+            values = []
+            while not self.accept(b']'):
+                values.append(self.value())
+                self.accept(b',')
+            return values
+
+        if token == b'(':
+            values = []
+            while not self.accept(b')'):
+                values.append(self.value())
+                self.accept(b',')
+            return tuple(values)
+
+        if token == b'{':
+            return self.dictionary()
+
+        raise self.error("Unexpected {!r}".format(token.decode('utf-8')))
+
+    def dictionary(self):
+        """Read the entries of a dictionary after its opening brace"""
+        values = {}
+        while not self.accept(b'}'):
+            if self.accept(b';') or self.accept(b','):
+                continue
+            self.name()
+            key = self.string() if self.kind == 'string' else self.name()
+            self.expect(b'=')
+            values[key] = self.value()
+        return values
+
+
+class _Scope(object):
+    """A prim, variant set or variant found by the structural scan of a lazy read
+
+    Args:
+        obj (Prim): The object that was created for it
+        start (int): The offset of its statement in the text
+        body (int): The offset of the start of its body, after the opening brace
+        depth (int): How many parentheses are open at its braces
+    """
+    __slots__ = ('obj', 'start', 'body', 'depth', 'holes')
+
+    def __init__(self, obj, start, body, depth):
+        super(_Scope, self).__init__()
+        self.obj = obj
+        self.start = start
+        self.body = body
+        self.depth = depth
+        # The byte ranges of the prims and variant sets in its body
+        self.holes = []
+
+
+class _PropertyReader(UsdaReader):
+    """Reads the attributes in part of the body of a prim for a LazyUsdaReader
+
+    Arrays and time samples are skipped over and left in the text as LazyValues. The
+    attributes are added to a dict rather than to the prim, so the path of the prim is
+    given for what's dropped.
+    """
+
+    def __init__(self, owner, start, end, path, dropped):
+        super(_PropertyReader, self).__init__(owner.data, owner.location, start, end,
+                                              dropped=dropped)
+        self.owner = owner
+        self.path = path
+
+    def path_of(self, obj):
+        if isinstance(obj, Attribute):
+            return '{}.{}'.format(self.path, obj.name)
+        return self.path
+
+    def read_into(self, attributes):
+        """Read the statements into a dict of attributes keyed by name"""
+        self.advance()
+        while self.kind is not None:
+            self.statement(attributes)
+
+    def attribute(self, attributes, name, as_type, is_uniform):
+        attr = attributes.get(name)
+        if attr is None:
+            attr = attributes[name] = Attribute(name, as_type=as_type, is_uniform=is_uniform)
+        attr.was_set = True
+        return attr
+
+    def time_samples(self, attr):
+        start = self.position()
+        end = self.skip_value()
+        attr.value = None
+        attr._keyframes = LazyValue(self.owner, ('samples', start, end, attr.as_type))
+
+    def typed_value(self, as_type, code=None):
+        if self.token[:1] == b'[' and self.kind in ('numbers', 'punctuation'):
+            start = self.position()
+            end = self.skip_value()
+            return LazyValue(self.owner, ('value', start, end, as_type))
+        return super(_PropertyReader, self).typed_value(as_type, code)
+
+
+class LazyUsdaReader(object):
+    """Reads a stage from usda text, leaving the attributes of its prims in the text
+
+    A structural scan finds where every prim, variant set and variant starts and ends,
+    without tokenizing the statements in between. Prims are created with their metadata
+    as they're found, and the statements in their bodies are kept as byte ranges. The
+    attributes of a prim are only read from those ranges the first time they're used,
+    and their arrays and time samples only the first time those are.
+
+    Args:
+        data: The text as bytes or a memory map, which stays open for as long as the
+            reader, or a LazyValue from it, is alive
+        location (str): Where the text came from, used in error messages
+
+    Attributes:
+        ranges (dict): The byte range of the text of each prim, keyed by its path
+        dropped (dict): What was left out of the metadata of the prims, as in UsdaReader.
+            What's left out of their attributes is warned about when they're read
+
+    """
+
+    def __init__(self, data, location='<usda>'):
+        super(LazyUsdaReader, self).__init__()
+        self.data = data
+        self.location = location
+        self.ranges = {}
+        self.dropped = _ordered_dict()
+
+    def read(self):
+        """Read the structure of the text into a new stage
+
+        Returns:
+            Stage: The stage
+
+        """
+        if self.data[:len(HEADER)] != HEADER:
+            raise ValueError("{} is not a usda file".format(self.location))
+
+        stage = Stage()
+        reader = UsdaReader(self.data, self.location, dropped=self.dropped)
+        reader.advance()
+        if reader.accept(b'('):
+            reader.metadata(stage)
+        start = reader.position()
+        reader.close()
+
+        self.scan(stage, start)
+        _warn_dropped(self.dropped, self.location)
+        return stage
+
+    def scan(self, stage, start):
+        """Find the prims, variant sets and variants in the text and create them"""
+        root = _Scope(stage, start, start, 0)
+        # The scope of every brace that's open, or None for braces around values
+        braces = []
+        # The start of a statement that's waiting for the brace that opens its body
+        pending = None
+        pending_kind = None
+        depth = 0
+
+        for match in _STRUCTURE.finditer(self.data, start):
+            kind = match.lastgroup
+            if kind is None:
+                continue
+
+            top = braces[-1] if braces else root
+            is_statement = top is not None and depth == top.depth
+
+            if kind == 'open':
+                if match.group(kind) == b'(':
+                    depth += 1
+                    continue
+
+                if pending is None and is_statement and isinstance(top.obj, VariantSet):
+                    # A variant, whose name follows the variant before it
+                    pending = top.holes[-1][1] if top.holes else top.body
+                    pending_kind = 'variant'
+
+                if pending is not None and is_statement:
+                    braces.append(self.open_scope(
+                        top, pending_kind, pending, match.start(kind), depth
+                    ))
+                    pending = None
+                else:
+                    braces.append(None)
+
+            elif kind == 'close':
+                if match.group(kind) == b')':
+                    depth -= 1
+                    continue
+                if not braces:
+                    raise _error(self.data, self.location, "Unexpected }", match.start(kind))
+
+                scope = braces.pop()
+                if scope is not None:
+                    if pending is not None:
+                        raise _error(self.data, self.location, "Expected {", pending)
+                    self.close_scope(scope, braces[-1] if braces else root,
+                                     match.start(kind), match.end())
+
+            elif pending is None and is_statement:
+                pending = match.start(kind)
+                pending_kind = kind
+
+        if braces or pending is not None:
+            raise _error(self.data, self.location, "Expected }", len(self.data))
+
+    def open_scope(self, parent, kind, start, brace, depth):
+        """Create the object of a statement from the text in front of its body"""
+        reader = UsdaReader(self.data, self.location, start, brace, dropped=self.dropped)
+        reader.advance()
+        if kind == 'prim':
+            obj = reader.prim_header(parent.obj)
+        elif kind == 'set':
+            reader.expect(b'variantSet')
+            obj = parent.obj.add_child(VariantSet(reader.string()))
+            reader.expect(b'=')
+        else:
+            obj = parent.obj.add_child(Variant(reader.string()))
+            if reader.accept(b'('):
+                reader.metadata(obj)
+
+        if reader.kind is not None:
+            raise reader.error("Expected {")
+        reader.close()
+        return _Scope(obj, start, brace + 1, depth)
+
+    def close_scope(self, scope, parent, close, end):
+        """Leave the attributes of a prim or variant in the text once its body is found"""
+        obj = scope.obj
+        parent.holes.append((scope.start, end))
+        if isinstance(obj, VariantSet):
+            return
+
+        segments = []
+        position = scope.body
+        for hole_start, hole_end in scope.holes:
+            if hole_start > position:
+                segments.append((position, hole_start))
+            position = hole_end
+        if close > position:
+            segments.append((position, close))
+
+        if segments:
+            obj._attributes = LazyValue(self, ('attributes', tuple(segments),
+                                               _spec_path(obj)))
+        if not isinstance(obj, Variant):
+            self.ranges[obj.path()] = (scope.start, end)
+
+    def value(self, rep):
+        """Read the attributes of a prim, or the value of an attribute, from the text
+
+        Args:
+            rep (tuple): What to read and where it is, as kept in a LazyValue
+
+        """
+        if rep[0] == 'attributes':
+            _, segments, path = rep
+            attributes = _ordered_dict()
+            dropped = _ordered_dict()
+            for start, end in segments:
+                _PropertyReader(self, start, end, path, dropped).read_into(attributes)
+            _warn_dropped(dropped, self.location)
+            return attributes
+
+        kind, start, end, as_type = rep
+        reader = UsdaReader(self.data, self.location, start, end)
+        reader.advance()
+        if kind == 'samples':
+            frames, values = reader.samples(as_type)
+            return TimeSamples(frames, values, as_type=as_type)
+        return reader.typed_value(as_type)
+
+
+def read_usda(location, lazy=False):
+    """Read a usda file into a new stage
+
+    Args:
+        location (str): The usda file to read
+        lazy (bool): Only index where the prims are in the file, and parse their
+            attributes the first time they're used. See LazyUsdaReader
+
+    Returns:
+        Stage: The stage
+
+    """
+    with io.open(location, 'rb') as f:
+        if not f.read(1):
+            raise ValueError("{} is not a usda file".format(location))
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if lazy:
+        # The map is closed once the stage no longer needs anything from it
+        return LazyUsdaReader(data, location).read()
+
+    reader = UsdaReader(data, location)
+    try:
+        return reader.read()
+    finally:
+        reader.close()
+        data.close()
+
+
+def open_stage(location, lazy=False):
+    """Open a usd file as a new stage
+
+    Binary usdc files are read with Stage.read_crate, whatever their extension, and
+    anything else is read as usda text.
+
+    Args:
+        location (str): The file to open
+        lazy (bool): Read usda files lazily, parsing the attributes of each prim the
+            first time they're used. Arrays in usdc files are always read lazily
+
+    Returns:
+        Stage: The stage
+
+    """
+    with io.open(location, 'rb') as f:
+        identifier = f.read(len(IDENTIFIER))
+
+    if identifier == IDENTIFIER:
+        return Stage.read_crate(location)
+    return read_usda(location, lazy=lazy)
+
+
+# The name that it was first published under, which shadows the builtin open
+open = open_stage
@@ -0,0 +1,349 @@
+"""
+Writing of usdz packages.
+
+A usdz package is a zip archive whose entries are stored without compression, with the
+data of every entry starting on a 64 byte boundary, so that layers and textures can be
+memory mapped straight out of the package. The first entry is the root layer.
+
+Packages have to hold every file that their layers refer to by a relative path, so the
+assets of the layers, and of the layers that those refer to in turn, are found and
+packaged with them.
+
+Zip archives record the size and checksum of each entry in the header in front of its
+data. Files are streamed into the package a block at a time and the header is filled in
+once the entry is written, so nothing is ever held in memory in full.
+"""
+import os
+import struct
+import time
+import warnings
+import zlib
+from contextlib import contextmanager
+
+# The alignment of the data of every entry, as required by the usdz specification
+ALIGNMENT = 64
+
+# The extensions of the layers that can be the root layer of a package
+LAYER_EXTENSIONS = ('.usda', '.usdc', '.usd')
+
+# Number of bytes copied at a time when streaming files into a package
+COPY_BUFFER_SIZE = 1 << 20
+
+_LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+_CENTRAL_HEADER = struct.Struct('<IHHHHHHIIIHHHHHII')
+_END_OF_CENTRAL_DIRECTORY = struct.Struct('<IHHHHIIH')
+
+_LOCAL_HEADER_SIGNATURE = 0x04034b50
+_CENTRAL_HEADER_SIGNATURE = 0x02014b50
+_END_OF_CENTRAL_DIRECTORY_SIGNATURE = 0x06054b50
+
+# The extra field that pads a local header, with the ID that USD uses for it
+_PADDING_ID = 0x1986
+_PADDING_HEADER_SIZE = 4
+
+# Stored entries only need version 1.0 of the zip format
+_ZIP_VERSION = 10
+_UTF8_FLAG = 1 << 11
+
+# Entries have 32 bit sizes and offsets, since usdz packages don't use zip64
+_MAX_SIZE = 0xFFFFFFFF
+
+
+def _dos_time(timestamp):
+    """Return the date and time that a zip header stores for a timestamp"""
+    t = time.localtime(timestamp)
+    year = max(t.tm_year, 1980)
+    return (
+        (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2),
+        ((year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday,
+    )
+
+
+def _is_relative(path):
+    """Return whether an asset path is a relative file path, rather than an absolute path
+    or a URI that's resolved without the package
+    """
+    return bool(path) and not os.path.isabs(path) and ':' not in path
+
+
+def archive_name(path):
+    """Return the name of an asset path inside a package, or None if it can't be in one
+
+    Only relative paths that stay inside the directory of the root layer can be
+    packaged, since the layers refer to them by the same path inside the package.
+    """
+    if not path or os.path.isabs(path) or ':' in path:
+        return
+
+    name = os.path.normpath(path).replace(os.sep, '/')
+    if name == '..' or name.startswith('../'):
+        return
+    return name
+
+
+def layer_asset_paths(location):
+    """Return the asset paths used by a layer on disk. See Stage.asset_paths"""
+    # Imported here since reading stages needs the modules that import this one
+    from .usda import UnsupportedDataWarning, open_stage
+
+    with warnings.catch_warnings():
+        # Only the asset paths are needed, not everything the layer holds
+        warnings.simplefilter('ignore', UnsupportedDataWarning)
+        return open_stage(location, lazy=True).asset_paths()
+
+
+def package_assets(asset_paths, directory, base, packaged=()):
+    """Find the files of the assets that a layer uses, and of the assets that those use
+
+    Layers that are found are read to find the assets that they use in turn.
+
+    Args:
+        asset_paths: The asset paths that the layer uses
+        directory (str): The directory of the layer, that its relative paths are
+            resolved from
+        base (str): The directory of the root layer of the package
+        packaged: The names of the files that are already in the package
+
+    Returns:
+        list: The name in the package and the location on disk of each file to add
+
+    Raises:
+        ValueError: If a relative asset path is outside base, or its file doesn't exist,
+            since the package would be written with a path that doesn't resolve
+
+    """
+    names = set(packaged)
+    files = []
+    pending = [(path, directory) for path in asset_paths]
+    while pending:
+        path, directory = pending.pop(0)
+        if not _is_relative(path):
+            continue
+
+        location = os.path.normpath(os.path.join(directory, path))
+        name = archive_name(os.path.relpath(location, base))
+        if name is None:
+            raise ValueError("{} is used by a layer in {} but is outside of {}, so it "
+                             "can't be packaged".format(path, directory, base))
+        if name in names:
+            continue
+        if not os.path.isfile(location):
+            raise ValueError("{} is used by a layer in {} but doesn't exist".format(
+                path, directory
+            ))
+
+        names.add(name)
+        files.append((name, location))
+        if os.path.splitext(location)[1] in LAYER_EXTENSIONS:
+            assets_directory = os.path.dirname(location)
+            pending.extend((asset, assets_directory) for asset in layer_asset_paths(location))
+
+    return files
+
+
+class UsdzWriter(object):
+    """Writes entries to a usdz package
+
+    Args:
+        fileobj: A seekable file object opened for reading and writing bytes. Entries
+            are read back after they're written to compute their checksums
+    """
+
+    def __init__(self, fileobj):
+        super(UsdzWriter, self).__init__()
+        self.fileobj = fileobj
+        self.names = []
+        self._entries = []
+        self._start = fileobj.tell()
+
+    def _header(self, name, timestamp, crc=0, size=0, offset=None):
+        """Return the local header of an entry, padded so its data is aligned"""
+        encoded = name.encode('utf-8')
+        flags = 0 if len(encoded) == len(name) else _UTF8_FLAG
+        clock, date = _dos_time(timestamp)
+
+        if offset is None:
+            offset = self.fileobj.tell()
+        padding = -(offset - self._start + _LOCAL_HEADER.size + len(encoded)) % ALIGNMENT
+        if padding and padding < _PADDING_HEADER_SIZE:
+            padding += ALIGNMENT
+
+        extra = b''
+        if padding:
+            extra = struct.pack('<HH', _PADDING_ID, padding - _PADDING_HEADER_SIZE)
+            extra += b'\x00' * (padding - _PADDING_HEADER_SIZE)
+
+        fields = (flags, 0, clock, date, crc, size, size, len(encoded), len(extra))
+        header = _LOCAL_HEADER.pack(_LOCAL_HEADER_SIGNATURE, _ZIP_VERSION, *fields)
+        return header + encoded + extra, fields
+
+    @contextmanager
+    def open_entry(self, name, timestamp=None):
+        """Write an entry by writing its data straight into the package
+
+        The file object of the package is returned, positioned at the start of the
+        entry's data. It can be seeked within the entry, as the crate writer does, as
+        long as it's left at the end of the data.
+
+        Args:
+            name (str): The name of the entry in the package
+            timestamp (float): The modification time of the entry. Defaults to now
+
+        """
+        if name in self.names:
+            raise ValueError("{} is already in the package".format(name))
+        if timestamp is None:
+            timestamp = time.time()
+
+        offset = self.fileobj.tell()
+        header, _ = self._header(name, timestamp)
+        self.fileobj.write(header)
+        data_start = self.fileobj.tell()
+
+        yield self.fileobj
+
+        end = self.fileobj.tell()
+        size = end - data_start
+        if size > _MAX_SIZE or end - self._start > _MAX_SIZE:
+            raise ValueError("usdz packages cannot hold more than 4 GiB")
+
+        # The checksum is computed from the data as it ended up in the file, since the
+        # writer may have gone back and changed some of it
+        crc = 0
+        buffer = bytearray(min(COPY_BUFFER_SIZE, size) or 1)
+        view = memoryview(buffer)
+        self.fileobj.seek(data_start)
+        remaining = size
+        while remaining:
+            read = self.fileobj.readinto(view[:min(remaining, len(buffer))])
+            if not read:
+                raise IOError("The package ended before the entry {}".format(name))
+            crc = zlib.crc32(view[:read], crc)
+            remaining -= read
+
+        self._finish_entry(name, timestamp, offset, crc & 0xFFFFFFFF, size)
+        self.fileobj.seek(end)
+
+    def add_file(self, name, path):
+        """Stream a file on disk into the package, a block at a time
+
+        Args:
+            name (str): The name of the entry in the package
+            path (str): The file to add
+
+        """
+        if name in self.names:
+            raise ValueError("{} is already in the package".format(name))
+
+        offset = self.fileobj.tell()
+        timestamp = os.path.getmtime(path)
+        header, _ = self._header(name, timestamp)
+        self.fileobj.write(header)
+
+        crc = 0
+        size = 0
+        buffer = bytearray(COPY_BUFFER_SIZE)
+        view = memoryview(buffer)
+        with open(path, 'rb') as f:
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                crc = zlib.crc32(view[:read], crc)
+                self.fileobj.write(view[:read])
+                size += read
+
+        if size > _MAX_SIZE or self.fileobj.tell() - self._start > _MAX_SIZE:
+            raise ValueError("usdz packages cannot hold more than 4 GiB")
+
+        end = self.fileobj.tell()
+        self._finish_entry(name, timestamp, offset, crc & 0xFFFFFFFF, size)
+        self.fileobj.seek(end)
+
+    def add_bytes(self, name, data, timestamp=None):
+        """Add an entry from data in memory"""
+        with self.open_entry(name, timestamp=timestamp) as f:
+            f.write(data)
+
+    def _finish_entry(self, name, timestamp, offset, crc, size):
+        """Fill in the checksum and size of an entry's local header"""
+        header, fields = self._header(name, timestamp, crc=crc, size=size, offset=offset)
+        self.fileobj.seek(offset)
+        self.fileobj.write(header)
+
+        self.names.append(name)
+        self._entries.append((name, offset - self._start, fields))
+
+    def close(self):
+        """Write the central directory, which finishes the package"""
+        directory_start = self.fileobj.tell()
+        for name, offset, fields in self._entries:
+            encoded = name.encode('utf-8')
+            self.fileobj.write(_CENTRAL_HEADER.pack(
+                _CENTRAL_HEADER_SIGNATURE, _ZIP_VERSION, _ZIP_VERSION,
+                # The padding of the local header isn't repeated here
+                *(fields[:-1] + (0, 0, 0, 0, 0, offset))
+            ))
+            self.fileobj.write(encoded)
+
+        directory_size = self.fileobj.tell() - directory_start
+        count = len(self._entries)
+        self.fileobj.write(_END_OF_CENTRAL_DIRECTORY.pack(
+            _END_OF_CENTRAL_DIRECTORY_SIGNATURE, 0, 0, count, count,
+            directory_size, directory_start - self._start, 0
+        ))
+
+
+def create_usdz(location, files, base=None):
+    """Package layers and the assets they use, already on disk, into a usdz file
+
+    The assets that the layers use with relative paths are packaged with them, whether
+    they're in files or not. See package_assets
+
+    Args:
+        location (str): The usdz file to write
+        files (list): The files to package, starting with the root layer
+        base (str): The directory that the names of the files in the package are
+            relative to. Defaults to the directory of the root layer, which is where
+            the layers' relative asset paths are resolved from
+
+    Returns:
+        list: The names of the files in the package
+
+    Raises:
+        ValueError: If a layer uses a relative asset path that can't be packaged
+
+    """
+    if not files:
+        raise ValueError("A usdz package needs at least a root layer")
+
+    root = files[0]
+    if os.path.splitext(root)[1] not in LAYER_EXTENSIONS:
+        raise ValueError("{} is not a layer that can be the root of a package".format(root))
+
+    if base is None:
+        base = os.path.dirname(os.path.abspath(root))
+
+    names = []
+    for path in files:
+        name = archive_name(os.path.relpath(os.path.abspath(path), base))
+        if name is None:
+            raise ValueError("{} is not inside {}".format(path, base))
+        names.append(name)
+
+    files = list(files)
+    for path in list(files):
+        if os.path.splitext(path)[1] not in LAYER_EXTENSIONS:
+            continue
+        for name, asset in package_assets(layer_asset_paths(path), os.path.dirname(path), base,
+                                          packaged=names):
+            names.append(name)
+            files.append(asset)
+
+    with open(location, 'w+b') as f:
+        writer = UsdzWriter(f)
+        for name, path in zip(names, files):
+            writer.add_file(name, path)
+        writer.close()
+
+    return names
@@ -0,0 +1 @@
+"""Benchmarks for aud, run as scripts or, for the suite, with python -m benchmarks.suite"""
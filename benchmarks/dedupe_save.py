@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Measures saving a set dressing stage with its duplicate geometry written once.
+
+The stage scatters a few thousand meshes that are copies of a handful of rocks, each
+with its own transform. It's saved in full and deduplicated, in both formats, and the
+dedupe report is printed with the file sizes.
+"""
+from __future__ import print_function
+
+import array
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aud
+from aud import audGeom
+
+INSTANCE_COUNT = 2000
+SHAPE_COUNT = 10
+POINT_COUNT = 500
+REPEATS = 3
+
+
+def build_stage(count=INSTANCE_COUNT, shapes=SHAPE_COUNT, points=POINT_COUNT):
+    """Return a stage with count meshes that share a few distinct shapes"""
+    rand = random.Random(0)
+    rocks = [
+        (array.array('f', (rand.uniform(-1, 1) for _ in range(points * 3))),
+         array.array('i', range(points)))
+        for _ in range(shapes)
+    ]
+
+    stage = aud.Stage()
+    root = stage.add_child(audGeom.Xform('set'))
+    for index in range(count):
+        mesh = root.add_child(audGeom.Mesh('rock_{}'.format(index)))
+        rock_points, indices = rocks[rand.randrange(shapes)]
+        mesh.set_attribute('points', rock_points, as_type='point3f[]')
+        mesh.set_attribute('faceVertexIndices', indices, as_type='int[]')
+        mesh.set_attribute('xformOp:translate', (
+            rand.uniform(-100, 100), 0, rand.uniform(-100, 100)
+        ), as_type='double3')
+        mesh.set_xform_order('t')
+    return stage
+
+
+def measure(save):
+    """Return the best time to call save and its result"""
+    best = result = None
+    for _ in range(REPEATS):
+        start = time.time()
+        result = save()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    stage = build_stage()
+    directory = tempfile.mkdtemp()
+
+    print('{:<20}{:>10}{:>14}'.format('Save', 'Seconds', 'Bytes'))
+    report = None
+    for ext in ('.usda', '.usdc'):
+        full = os.path.join(directory, 'full' + ext)
+        deduplicated = os.path.join(directory, 'deduplicated' + ext)
+        seconds, _ = measure(lambda: stage.save(full))
+        print('{:<20}{:>10.3f}{:>14}'.format('full' + ext, seconds, os.path.getsize(full)))
+        seconds, report = measure(lambda: stage.save_deduplicated(deduplicated))
+        print('{:<20}{:>10.3f}{:>14}'.format(
+            'deduplicated' + ext, seconds, os.path.getsize(deduplicated)
+        ))
+
+    print()
+    print('{} meshes, {} unique, {:.1f}x dedupe ratio, {} bytes of values saved'.format(
+        report.prims, report.unique, report.ratio, report.bytes_saved
+    ))
+
+    shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Measures the bytes and seconds saved by each float precision policy on a large mesh.
+
+The mesh holds float32 points and normals, like the data exported from a DCC, and is
+saved once with every policy. Writing it in full double precision is the baseline.
+"""
+from __future__ import print_function
+
+import array
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aud
+from aud import audGeom
+
+POINT_COUNT = 200000
+REPEATS = 3
+
+POLICIES = (
+    ('double (baseline)', aud.DOUBLE),
+    ('float32', aud.FLOAT32),
+    ('6 digits', 6),
+    ('4 digits', 4),
+)
+
+
+def build_stage(count=POINT_COUNT):
+    """Return a stage with a single mesh of count random points and normals"""
+    rand = random.Random(0)
+    stage = aud.Stage()
+    mesh = stage.add_child(audGeom.Mesh('mesh'))
+
+    points = array.array('f', (rand.uniform(-100, 100) for _ in range(count * 3)))
+    normals = array.array('f', (rand.uniform(-1, 1) for _ in range(count * 3)))
+
+    mesh.set_attribute('points', points, as_type='point3f[]')
+    mesh.set_attribute('normals', normals, as_type='normal3f[]')
+    mesh.set_attribute('faceVertexIndices', array.array('i', range(count)), as_type='int[]')
+    return stage
+
+
+def measure(stage, precision, location):
+    """Return the best time to save the stage with a precision and the size of the file"""
+    best = None
+    for _ in range(REPEATS):
+        start = time.time()
+        stage.save(location, precision=precision)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best, os.path.getsize(location)
+
+
+def main():
+    stage = build_stage()
+    location = os.path.join(tempfile.mkdtemp(), 'mesh.usda')
+
+    print('{} points\n'.format(POINT_COUNT))
+    print('{:<20}{:>12}{:>10}{:>14}{:>12}'.format(
+        'Precision', 'Bytes', 'Seconds', 'Bytes saved', 'Time saved'
+    ))
+
+    baseline = None
+    for name, precision in POLICIES:
+        seconds, size = measure(stage, precision, location)
+        if baseline is None:
+            baseline = seconds, size
+
+        print('{:<20}{:>12}{:>10.3f}{:>13.1f}%{:>11.1f}%'.format(
+            name, size, seconds,
+            100.0 * (baseline[1] - size) / baseline[1],
+            100.0 * (baseline[0] - seconds) / baseline[0]
+        ))
+
+    os.remove(location)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+Measures the time of importing aud and each of its generated schema modules.
+
+Every import is timed in a new interpreter, since a module is only imported once per
+process, and the best of a number of runs is printed. The schema modules are timed on
+top of importing aud, which no longer imports any of them.
+"""
+from __future__ import print_function
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from aud.generated import SCHEMA_MODULES
+
+REPEATS = 5
+
+# Run in a new interpreter, printing the seconds that importing a module took
+_TIMER = '''
+import sys, time
+sys.path.insert(0, {root!r})
+clock = getattr(time, 'perf_counter', time.time)
+{setup}
+start = clock()
+import {module}
+print(clock() - start)
+'''
+
+
+def import_time(module, setup='', repeats=REPEATS):
+    """Return the best time of importing a module in a new interpreter, or None if it fails
+
+    Args:
+        module (str): The module to import, e.g. aud.audGeom
+        setup (str): Code that runs before the import and isn't timed
+        repeats (int): The number of interpreters to time it in
+
+    """
+    code = _TIMER.format(root=ROOT, setup=setup, module=module)
+    # Let the modules be cached as bytecode, like they are when aud is installed
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+
+    best = None
+    # The first run compiles the modules if they haven't been yet, so it isn't counted
+    for _ in range(repeats + 1):
+        process = subprocess.Popen(
+            [sys.executable, '-c', code], stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env
+        )
+        out, _ = process.communicate()
+        if process.returncode:
+            return
+        elapsed = float(out.decode('utf-8').strip())
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    modules = sorted(set(SCHEMA_MODULES.values()))
+
+    print('{:<20}{:>10}{:>10}'.format('Import', 'Classes', 'ms'))
+    seconds = import_time('aud')
+    print('{:<20}{:>10}{:>10.1f}'.format('aud', '', seconds * 1000))
+
+    for module in modules:
+        classes = sum(1 for name in SCHEMA_MODULES.values() if name == module)
+        seconds = import_time('aud.' + module, setup='import aud')
+        print('{:<20}{:>10}{:>10}'.format(
+            module, classes, 'failed' if seconds is None else '{:.1f}'.format(seconds * 1000)
+        ))
+
+
+if __name__ == '__main__':
+    main()
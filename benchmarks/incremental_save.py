@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Measures how much faster a stage is saved again after a few small changes, when the
+text of its prims is kept by incremental saves.
+
+The stage is a few thousand animated transforms with a mesh each. It's saved in full,
+then a handful of attributes are changed and it's saved again, both from scratch and
+incrementally, and the two files are checked to be identical.
+"""
+from __future__ import print_function
+
+import array
+import filecmp
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aud
+from aud import audGeom
+
+ASSET_COUNT = 2000
+POINT_COUNT = 500
+FRAME_COUNT = 24
+CHANGE_COUNT = 10
+
+
+def build_stage(count=ASSET_COUNT, points=POINT_COUNT, frames=FRAME_COUNT):
+    """Return a stage with count assets, each an animated transform over a mesh"""
+    rand = random.Random(0)
+    stage = aud.Stage()
+    root = stage.add_child(audGeom.Xform('root'))
+    for index in range(count):
+        asset = root.add_child(audGeom.Xform('asset_{}'.format(index)))
+        translate = asset.set_attribute('xformOp:translate', None, as_type='double3')
+        for frame in range(1, frames + 1):
+            translate.set_keyframe(frame, (index, frame * 0.1, rand.uniform(-1, 1)))
+        asset.set_xform_order('t')
+
+        mesh = asset.add_child(audGeom.Mesh('mesh'))
+        mesh.set_attribute('points', array.array(
+            'f', (rand.uniform(-100, 100) for _ in range(points * 3))
+        ), as_type='point3f[]')
+    return stage
+
+
+def timed(function, *args, **kwargs):
+    """Return how long a call takes"""
+    start = time.time()
+    function(*args, **kwargs)
+    return time.time() - start
+
+
+def main():
+    stage = build_stage()
+    directory = tempfile.mkdtemp()
+    full = os.path.join(directory, 'full.usda')
+    incremental = os.path.join(directory, 'incremental.usda')
+
+    first = timed(stage.save, incremental, incremental=True)
+
+    rand = random.Random(1)
+    for index in rand.sample(range(ASSET_COUNT), CHANGE_COUNT):
+        mesh = stage.get_prim_at_path('/root/asset_{}/mesh'.format(index))
+        mesh.set_attribute('doubleSided', True, as_type='bool', is_uniform=True)
+
+    again = timed(stage.save, incremental, incremental=True)
+    scratch = timed(stage.save, full)
+
+    print('{:<24}{:>10}'.format('Save', 'Seconds'))
+    print('{:<24}{:>10.3f}'.format('First incremental', first))
+    print('{:<24}{:>10.3f}'.format('Full after changes', scratch))
+    print('{:<24}{:>10.3f}'.format('Incremental', again))
+    print('Identical: {}'.format(filecmp.cmp(full, incremental, shallow=False)))
+
+    os.remove(full)
+    os.remove(incremental)
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
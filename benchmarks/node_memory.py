@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+"""
+Measures how many bytes each node type costs when authoring large stages.
+
+Every node is created many times and the memory allocated for them is measured with
+tracemalloc, so the numbers include the containers each node allocates.
+
+Each node is measured twice. "Before" uses a copy of the layout that the nodes had before
+they were slotted: an instance dict, and lists and dicts allocated up front whether
+they're used or not. "After" uses aud's classes as they are, so the comparison can be
+re-run whenever the nodes change.
+"""
+from __future__ import print_function
+
+import os
+import sys
+import tracemalloc
+import weakref
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aud
+from aud import audGeom
+
+COUNT = 100000
+
+
+class _LegacyData(object):
+    """The state that AbstractData used to create for every node"""
+
+    def __init__(self):
+        super(_LegacyData, self).__init__()
+        self.level = 0
+        self.children = []
+        self.properties = []
+        self.attributes = []
+        self.was_set = False
+        self.name = None
+        self.value = None
+        self.parent = None
+        self.keyframes = {}
+
+
+class _LegacyPrim(_LegacyData):
+    as_type = None
+
+    def __init__(self, name, is_class=False, is_over=False, as_type=None):
+        super(_LegacyPrim, self).__init__()
+        self.name = name
+        self.is_class = is_class
+        self.is_over = is_over
+        self.as_type = as_type or self.as_type
+        self.references = []
+        self.inherits = []
+        self.variants = []
+
+
+class _LegacyXform(_LegacyPrim):
+    as_type = 'Xform'
+
+
+class _LegacyProperty(_LegacyData):
+
+    def __init__(self, name, value=None, values=None):
+        super(_LegacyProperty, self).__init__()
+        self.name = name
+        self.values = values
+        self.value = value
+
+
+class _LegacyAttribute(_LegacyData):
+
+    def __init__(self, name, value=None, is_uniform=False, as_type=None, docstring=None,
+                 allowedTokens=None):
+        super(_LegacyAttribute, self).__init__()
+        self.__doc__ = self.docstring = docstring
+        self.is_uniform = is_uniform
+        self.value = value
+        self.name = name
+        self.as_type = as_type
+        self.allowed_tokens = self.allowedTokens = allowedTokens
+
+
+class _LegacyIterObject(object):
+
+    def __init__(self, value=None, object_name=None, is_file=False):
+        super(_LegacyIterObject, self).__init__()
+        self.value = value
+        self.object_name = object_name
+        self.is_file = is_file
+
+
+def _legacy_set_attribute(prim, name, value, as_type, is_uniform=False):
+    """Add an attribute the way set_attribute used to, as a set value in a list"""
+    attr = _LegacyAttribute(name, as_type=as_type, is_uniform=is_uniform)
+    prim.attributes.append(attr)
+    attr.parent = weakref.proxy(prim)
+    attr.was_set = True
+    attr.value = value
+    return attr
+
+
+def measure(factory, count=COUNT):
+    """Return the average number of bytes allocated by one call to factory"""
+    nodes = [None] * count
+    tracemalloc.start()
+    for i in range(count):
+        nodes[i] = factory()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return allocated / float(count)
+
+
+def xform_with_transforms():
+    xform = audGeom.Xform('xform')
+    xform.set_attribute('xformOp:translate', (0, 0, 0), as_type='double3')
+    xform.set_attribute('xformOp:rotateXYZ', (0, 0, 0), as_type='double3')
+    xform.set_attribute('xformOp:scale', (1, 1, 1), as_type='double3')
+    xform.set_xform_order()
+    return xform
+
+
+def legacy_xform_with_transforms():
+    xform = _LegacyXform('xform')
+    _legacy_set_attribute(xform, 'xformOp:translate', (0, 0, 0), 'double3')
+    _legacy_set_attribute(xform, 'xformOp:rotateXYZ', (0, 0, 0), 'double3')
+    _legacy_set_attribute(xform, 'xformOp:scale', (1, 1, 1), 'double3')
+    _legacy_set_attribute(xform, 'xformOpOrder',
+                          ['xformOp:translate', 'xformOp:rotateXYZ', 'xformOp:scale'],
+                          'token[]', is_uniform=True)
+    return xform
+
+
+# The name of each node, how it was created before it was slotted and how it is now
+NODES = (
+    ('Prim', lambda: _LegacyPrim('prim'), lambda: aud.Prim('prim')),
+    ('audGeom.Xform', lambda: _LegacyXform('xform'), lambda: audGeom.Xform('xform')),
+    ('Attribute', lambda: _LegacyAttribute('attr', value=1.0, as_type='float'),
+     lambda: aud.Attribute('attr', value=1.0, as_type='float')),
+    ('Property', lambda: _LegacyProperty('kind', value='component'),
+     lambda: aud.Property('kind', value='component')),
+    ('IterObject', lambda: _LegacyIterObject('./asset.usda', is_file=True),
+     lambda: aud.IterObject('./asset.usda', is_file=True)),
+    ('Xform + 4 attributes', legacy_xform_with_transforms, xform_with_transforms),
+)
+
+
+def main():
+    print('Python {}'.format(sys.version.split()[0]))
+    print('{:<24}{:>12}{:>12}{:>10}'.format('Node', 'Before', 'After', 'Saved'))
+    for name, legacy, factory in NODES:
+        before = measure(legacy)
+        after = measure(factory)
+        print('{:<24}{:>12.1f}{:>12.1f}{:>9.0f}%'.format(
+            name, before, after, 100.0 * (before - after) / before
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Measures how writing a usda file scales with the number of worker processes.
+
+The stage is a few hundred assets under a single root, each with a mesh and an animated
+transform, so that the root is split into subtrees that the workers write while the
+main process joins their text in order. Every file is checked to be identical to the
+one written by a single process.
+"""
+from __future__ import print_function
+
+import array
+import filecmp
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aud
+from aud import audGeom
+
+ASSET_COUNT = 400
+POINT_COUNT = 2000
+FRAME_COUNT = 24
+REPEATS = 3
+
+
+def build_stage(count=ASSET_COUNT, points=POINT_COUNT, frames=FRAME_COUNT):
+    """Return a stage with count assets, each an animated transform over a mesh"""
+    rand = random.Random(0)
+    stage = aud.Stage()
+    root = stage.add_child(audGeom.Xform('root'))
+    for index in range(count):
+        asset = root.add_child(audGeom.Xform('asset_{}'.format(index)))
+        translate = asset.set_attribute('xformOp:translate', None, as_type='double3')
+        for frame in range(1, frames + 1):
+            translate.set_keyframe(frame, (index, frame * 0.1, rand.uniform(-1, 1)))
+        asset.set_xform_order('t')
+
+        mesh = asset.add_child(audGeom.Mesh('mesh'))
+        mesh.set_attribute('points', array.array(
+            'f', (rand.uniform(-100, 100) for _ in range(points * 3))
+        ), as_type='point3f[]')
+        mesh.set_attribute('faceVertexIndices', array.array('i', range(points)),
+                           as_type='int[]')
+    return stage
+
+
+def measure(stage, location, workers):
+    """Return the best time to save the stage with a number of workers"""
+    best = None
+    for _ in range(REPEATS):
+        start = time.time()
+        stage.save(location, workers=workers)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    stage = build_stage()
+    directory = tempfile.mkdtemp()
+    reference = os.path.join(directory, 'reference.usda')
+    location = os.path.join(directory, 'parallel.usda')
+
+    counts = [1]
+    while counts[-1] * 2 <= multiprocessing.cpu_count():
+        counts.append(counts[-1] * 2)
+
+    print('{:<10}{:>10}{:>10}{:>12}'.format('Workers', 'Seconds', 'Speedup', 'Identical'))
+    single = measure(stage, reference, 1)
+    for workers in counts:
+        seconds = single if workers == 1 else measure(stage, location, workers)
+        identical = workers == 1 or filecmp.cmp(reference, location, shallow=False)
+        print('{:<10}{:>10.3f}{:>10.2f}{:>12}'.format(
+            workers, seconds, single / seconds, str(identical)
+        ))
+
+    for path in (reference, location):
+        if os.path.exists(path):
+            os.remove(path)
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+"""
+Shows where the time of saving a stage goes, using aud's instrumentation.
+
+The stage from parallel_save.py is saved as usda and usdc with an Aggregator hooked in,
+and the spans that took the most time are printed.
+"""
+from __future__ import print_function
+
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aud
+from parallel_save import build_stage
+
+TOP = 15
+
+
+def main():
+    stage = build_stage(count=100)
+    directory = tempfile.mkdtemp()
+
+    with aud.instrumented() as aggregator:
+        for ext in ('.usda', '.usdc'):
+            stage.save(os.path.join(directory, 'profile' + ext))
+
+    aggregator.print_report(TOP)
+    shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
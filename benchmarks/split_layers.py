@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+Measures saving a stage as a root layer with its assets split out into payload layers.
+
+The stage is the same as in parallel_save.py: a few hundred assets, each an animated
+transform over a mesh. It's saved whole, then with every asset split into its own layer
+and the layers written by an increasing number of worker processes.
+"""
+from __future__ import print_function
+
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from parallel_save import build_stage
+
+REPEATS = 3
+
+
+def measure(save):
+    """Return the best time to call save"""
+    best = None
+    for _ in range(REPEATS):
+        start = time.time()
+        save()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    stage = build_stage()
+    directory = tempfile.mkdtemp()
+    whole = os.path.join(directory, 'whole.usda')
+    location = os.path.join(directory, 'shot.usda')
+
+    counts = [1]
+    while counts[-1] * 2 <= multiprocessing.cpu_count():
+        counts.append(counts[-1] * 2)
+
+    print('{:<16}{:>10}{:>10}{:>14}'.format('Save', 'Seconds', 'Speedup', 'Root bytes'))
+    single = measure(lambda: stage.save(whole))
+    print('{:<16}{:>10.3f}{:>10.2f}{:>14}'.format(
+        'whole', single, 1.0, os.path.getsize(whole)
+    ))
+    for workers in counts:
+        seconds = measure(lambda: stage.save_layers(location, depth=2, workers=workers))
+        print('{:<16}{:>10.3f}{:>10.2f}{:>14}'.format(
+            'split x{}'.format(workers), seconds, single / seconds, os.path.getsize(location)
+        ))
+
+    shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+A reproducible benchmark suite for authoring and saving stages.
+
+Synthetic stages are generated along independent axes (the number of prims, hierarchy
+depth, attributes per prim, array length, keyframes and variants), and each one is
+measured for the wall time, peak memory and output size of authoring it and of saving
+it as usda and usdc. Run it from the root of the repository with
+
+    python -m benchmarks.suite --output results.json
+
+and pass --baseline with an earlier results file to flag the measurements that
+regressed against it.
+"""
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+import aud
+
+from .compare import compare
+from .measure import run_case
+from .stages import AXES, DEFAULTS, QUICK_AXES, QUICK_DEFAULTS, build_stage, iter_cases
+
+
+def environment():
+    """Return where the suite ran, since results are only comparable on the same machine"""
+    return {
+        'aud': aud.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'executable': sys.executable,
+    }
+
+
+def run_suite(quick=False, only=None, repeats=3, log=None):
+    """Run every case of the suite
+
+    Args:
+        quick (bool): Use smaller stages that finish in seconds
+        only (list): The names of the axes to vary, or None for all of them
+        repeats (int): The number of times that each step is timed
+        log: Called with each case name and its results as they finish
+
+    Returns:
+        dict: The environment, the time the suite ran and the results of every case
+
+    """
+    defaults, axes = (QUICK_DEFAULTS, QUICK_AXES) if quick else (DEFAULTS, AXES)
+    directory = tempfile.mkdtemp()
+    cases = []
+    try:
+        for name, params in iter_cases(defaults, axes, only=only):
+            results = run_case(params, directory, repeats=repeats)
+            cases.append({'name': name, 'params': params, 'results': results})
+            if log is not None:
+                log(name, results)
+    finally:
+        shutil.rmtree(directory)
+
+    return {
+        'environment': environment(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'quick': quick,
+        'repeats': repeats,
+        'cases': cases,
+    }
@@ -0,0 +1,78 @@
+"""
+Runs the suite, writes its results as JSON and compares them with a baseline.
+
+The exit code is 1 if any measurement regressed against the baseline.
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import sys
+
+from . import compare, run_suite
+from .compare import SIZE_TOLERANCE, TOLERANCE
+
+
+def _format_bytes(value):
+    return '-' if value is None else '{:.1f}M'.format(value / 1e6)
+
+
+def _log(name, results):
+    author, usda, usdc = results['author'], results['save_usda'], results['save_usdc']
+    print('{:<22}{:>9.3f}{:>9}{:>9}{:>9.3f}{:>9}{:>9}{:>9.3f}{:>9}{:>9}'.format(
+        name,
+        author['seconds'], _format_bytes(author['peak_bytes']),
+        _format_bytes(author['peak_rss']),
+        usda['seconds'], _format_bytes(usda['output_bytes']), _format_bytes(usda['peak_rss']),
+        usdc['seconds'], _format_bytes(usdc['output_bytes']), _format_bytes(usdc['peak_rss']),
+    ))
+    sys.stdout.flush()
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite', description=__doc__)
+    parser.add_argument('--output', help='The JSON file to write the results to')
+    parser.add_argument('--baseline', help='A JSON file of earlier results to compare with')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help='The fraction a time can grow by before it regresses')
+    parser.add_argument('--size-tolerance', type=float, default=SIZE_TOLERANCE,
+                        help='The fraction a memory or file size can grow by')
+    parser.add_argument('--quick', action='store_true', help='Measure smaller stages')
+    parser.add_argument('--axis', action='append', dest='axes',
+                        help='Only vary this axis, can be given more than once')
+    parser.add_argument('--repeats', type=int, default=3,
+                        help='The number of times each step is timed')
+    args = parser.parse_args(args)
+
+    print('{:<22}{:>9}{:>9}{:>9}{:>9}{:>9}{:>9}{:>9}{:>9}{:>9}'.format(
+        'Case', 'Author', 'Memory', 'RSS', 'usda', 'Size', 'RSS', 'usdc', 'Size', 'RSS'
+    ))
+    results = run_suite(quick=args.quick, only=args.axes, repeats=args.repeats, log=_log)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline, tolerance=args.tolerance,
+                          size_tolerance=args.size_tolerance)
+    print()
+    if not regressions:
+        print('No regressions against {}'.format(args.baseline))
+        return 0
+
+    print('{} regressions against {}'.format(len(regressions), args.baseline))
+    for name, metric, old, new in regressions:
+        print('  {:<22}{:<26}{:>14.4g} -> {:<14.4g}{:>+8.1%}'.format(
+            name, metric, old, new, new / old - 1 if old else float('inf')
+        ))
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+Compares results against a stored baseline to find regressions.
+"""
+
+# How much longer a time can be than the baseline before it's a regression
+TOLERANCE = 0.2
+
+# How much bigger memory and file sizes can be, which barely vary between runs
+SIZE_TOLERANCE = 0.02
+
+# Times shorter than this are too noisy to compare
+MIN_SECONDS = 0.01
+
+
+def iter_metrics(case):
+    """Yield the name and value of every measurement of a case, e.g. save_usda.seconds"""
+    for section, values in sorted(case['results'].items()):
+        if isinstance(values, dict):
+            for metric, value in sorted(values.items()):
+                yield '{}.{}'.format(section, metric), value
+        else:
+            yield section, values
+
+
+def compare(results, baseline, tolerance=TOLERANCE, size_tolerance=SIZE_TOLERANCE):
+    """Find the measurements that got worse than the baseline
+
+    Cases and measurements that aren't in both results are skipped, so the baseline
+    doesn't need to be regenerated when cases are added.
+
+    Args:
+        results (dict): The results of run_suite
+        baseline (dict): Results of run_suite that were stored earlier
+        tolerance (float): The fraction that a time can grow by
+        size_tolerance (float): The fraction that a memory or file size can grow by
+
+    Returns:
+        list: The case, metric, baseline value and new value of each regression
+
+    """
+    previous = dict((case['name'], dict(iter_metrics(case))) for case in baseline['cases'])
+
+    regressions = []
+    for case in results['cases']:
+        old_metrics = previous.get(case['name'])
+        if old_metrics is None:
+            continue
+
+        for metric, value in iter_metrics(case):
+            old = old_metrics.get(metric)
+            if old is None or value is None:
+                continue
+            if metric.endswith('seconds'):
+                if max(old, value) < MIN_SECONDS:
+                    continue
+                allowed = tolerance
+            else:
+                allowed = size_tolerance
+            if value > old * (1 + allowed):
+                regressions.append((case['name'], metric, old, value))
+    return regressions
@@ -0,0 +1,158 @@
+"""
+Measures authoring and saving a case, each phase in a process of its own.
+
+Authoring the stage and saving it in each format run in new worker processes, so that
+the peak resident memory of each phase isn't hidden by the phases before it. Saving
+needs the stage to be authored first, so where the high-water mark of a process can be
+reset (on Linux) it's reset once the stage is built, and the peak of a save is the peak
+while saving, with the stage in memory. Elsewhere it's the higher of that and the peak
+of authoring.
+
+The peak is taken from the first run of a phase. Times are the best of a number of
+repeats, and the memory allocated by Python is measured with tracemalloc in a separate
+run, since tracing slows everything down.
+"""
+import gc
+import multiprocessing
+import os
+import sys
+from timeit import default_timer
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from .stages import build_stage
+
+# The formats that each stage is saved in
+FORMATS = ('usda', 'usdc')
+
+# Where Linux reports the high-water mark of a process, and where it's reset
+_STATUS = '/proc/self/status'
+_CLEAR_REFS = '/proc/self/clear_refs'
+
+
+def peak_rss():
+    """Return the peak resident memory of this process in bytes, or None if unknown
+
+    On Linux this is the peak since reset_peak_rss was last called.
+    """
+    try:
+        with open(_STATUS) as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except (IOError, OSError):
+        pass
+
+    if resource is None:
+        return
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes and everything else kilobytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def reset_peak_rss():
+    """Reset the peak resident memory of this process to what it is now
+
+    Returns:
+        bool: Whether it could be reset, which needs Linux
+
+    """
+    try:
+        with open(_CLEAR_REFS, 'w') as f:
+            f.write('5')
+    except (IOError, OSError):
+        return False
+    return True
+
+
+def best_time(function, repeats):
+    """Return the best time of calling a function a number of times, and its last result"""
+    best = result = None
+    for _ in range(repeats):
+        start = default_timer()
+        result = function()
+        elapsed = default_timer() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def traced_peak(function):
+    """Return the peak number of bytes that Python allocated while calling a function
+
+    Returns:
+        tuple: The peak, or None without tracemalloc, and the result of the function
+
+    """
+    if tracemalloc is None:
+        return None, function()
+
+    tracemalloc.start()
+    try:
+        result = function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak, result
+
+
+def _run_phase(phase, params, directory, repeats):
+    """Measure authoring a case, or saving it in a format, in the current process"""
+    if phase == 'author':
+        location = None
+        function = lambda: build_stage(**params)
+    else:
+        location = os.path.join(directory, 'case.{}'.format(phase))
+        stage = build_stage(**params)
+        function = lambda: stage.save(location)
+        gc.collect()
+        reset_peak_rss()
+
+    # The first run is the one whose resident memory is measured
+    start = default_timer()
+    function()
+    seconds = default_timer() - start
+    rss = peak_rss()
+
+    if repeats > 1:
+        seconds = min(seconds, best_time(function, repeats - 1)[0])
+    peak, _ = traced_peak(function)
+
+    results = {'seconds': seconds, 'peak_bytes': peak, 'peak_rss': rss}
+    if location is not None:
+        results['output_bytes'] = os.path.getsize(location)
+        os.remove(location)
+    return results
+
+
+def run_case(params, directory, repeats=3):
+    """Measure a case, running each phase in a new worker process
+
+    Args:
+        params (dict): The parameters of build_stage
+        directory (str): The directory that the stage is saved to
+        repeats (int): The number of times that each step is timed
+
+    Returns:
+        dict: The measurements of authoring the stage and of saving it in each format
+
+    """
+    # Every task gets a worker of its own
+    pool = multiprocessing.Pool(1, maxtasksperchild=1)
+    try:
+        results = {'author': pool.apply(_run_phase, ('author', params, directory, repeats))}
+        for extension in FORMATS:
+            results['save_{}'.format(extension)] = pool.apply(
+                _run_phase, (extension, params, directory, repeats)
+            )
+        return results
+    finally:
+        pool.close()
+        pool.join()
@@ -0,0 +1,124 @@
+"""
+Synthetic stages that vary along independent axes.
+
+Every stage is built from the same seeded random numbers, so a case always builds the
+same stage and writes the same files.
+"""
+import array
+import random
+
+import aud
+from aud import audGeom
+
+# The parameters of the case that every axis is varied from
+DEFAULTS = {
+    'prims': 1000,
+    'depth': 3,
+    'attributes': 4,
+    'array_length': 100,
+    'keyframes': 0,
+    'variants': 0,
+}
+
+# The values that each axis is measured at, with the other axes left at their defaults
+AXES = (
+    ('prims', (250, 4000, 16000)),
+    ('depth', (1, 8, 32)),
+    ('attributes', (0, 16, 64)),
+    ('array_length', (10, 1000, 10000)),
+    ('keyframes', (10, 100)),
+    ('variants', (2, 8)),
+)
+
+# Smaller stages for a quick check, e.g. before every commit
+QUICK_DEFAULTS = dict(DEFAULTS, prims=200)
+QUICK_AXES = (
+    ('prims', (50, 800)),
+    ('depth', (1, 8)),
+    ('attributes', (0, 16)),
+    ('array_length', (10, 1000)),
+    ('keyframes', (10,)),
+    ('variants', (4,)),
+)
+
+
+def iter_cases(defaults=DEFAULTS, axes=AXES, only=None):
+    """Yield the name and parameters of each case, starting with the defaults
+
+    Args:
+        defaults (dict): The parameters that each axis is varied from
+        axes (tuple): The values of each axis, as (name, values) pairs
+        only (list): The names of the axes to vary, or None for all of them
+
+    """
+    yield 'defaults', dict(defaults)
+    for axis, values in axes:
+        if only is not None and axis not in only:
+            continue
+        for value in values:
+            if value == defaults[axis]:
+                continue
+            yield '{}={}'.format(axis, value), dict(defaults, **{axis: value})
+
+
+def build_stage(prims, depth, attributes, array_length, keyframes, variants, seed=0):
+    """Build a stage of meshes nested under transforms
+
+    Args:
+        prims (int): The number of meshes
+        depth (int): The number of transforms that each mesh is nested under
+        attributes (int): The number of extra float attributes on each mesh
+        array_length (int): The number of points of each mesh
+        keyframes (int): The number of time samples of the translation of each mesh, or
+            0 to author it without animation
+        variants (int): The number of variants in a variant set on each mesh, or 0 for
+            no variant set
+        seed (int): The seed of the random numbers
+
+    Returns:
+        aud.Stage: The stage
+
+    """
+    rand = random.Random(seed)
+    stage = aud.Stage()
+    stage.set_frame_range(1, max(keyframes, 1))
+    root = stage.add_child(audGeom.Xform('root'))
+
+    # Meshes are spread over groups of nested transforms, so that the number of prims
+    # grows with the depth but the number of meshes doesn't
+    groups = max(prims // 100, 1)
+    parents = []
+    for group in range(groups):
+        parent = root
+        for level in range(depth):
+            parent = parent.add_child(audGeom.Xform('group_{}_{}'.format(group, level)))
+        parents.append(parent)
+
+    indices = array.array('i', range(array_length))
+    for index in range(prims):
+        mesh = parents[index % groups].add_child(audGeom.Mesh('mesh_{}'.format(index)))
+        mesh.set_attribute('points', array.array(
+            'f', (rand.uniform(-100, 100) for _ in range(array_length * 3))
+        ), as_type='point3f[]')
+        mesh.set_attribute('faceVertexIndices', indices, as_type='int[]')
+
+        for number in range(attributes):
+            mesh.set_attribute('user:value_{}'.format(number), rand.random(), as_type='float')
+
+        translate = mesh.set_attribute('xformOp:translate', None, as_type='double3')
+        if keyframes:
+            for frame in range(1, keyframes + 1):
+                translate.set_keyframe(frame, (index, frame * 0.1, rand.uniform(-1, 1)))
+        else:
+            translate.set_value((index, 0, 0))
+        mesh.set_xform_order('t')
+
+        if variants:
+            mesh.add_variant('look')
+            variant_set = mesh.add_child(aud.VariantSet('look'))
+            for number in range(variants):
+                variant = variant_set.add_child(aud.Variant('look_{}'.format(number)))
+                variant.set_attribute('primvars:displayColor', [(
+                    rand.random(), rand.random(), rand.random()
+                )], as_type='color3f[]')
+    return stage
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Measures how fast usda files are read, in megabytes of text per second.
+
+Two files are read: one made of a few large meshes, where the time goes into converting
+arrays of numbers, and one made of many small transforms with animated attributes, where
+it goes into tokenizing statements and building prims.
+
+Each file is also opened lazily, which only scans it for its prims and leaves their
+attributes to be parsed when they're first used.
+"""
+from __future__ import print_function
+
+import array
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aud
+from aud import audGeom
+
+MESH_COUNT = 4
+POINT_COUNT = 100000
+XFORM_COUNT = 20000
+FRAME_COUNT = 4
+REPEATS = 3
+
+
+def build_meshes(count=MESH_COUNT, points=POINT_COUNT):
+    """Return a stage with count meshes of random points and normals"""
+    rand = random.Random(0)
+    stage = aud.Stage()
+    root = stage.add_child(audGeom.Xform('root'))
+    for index in range(count):
+        mesh = root.add_child(audGeom.Mesh('mesh_{}'.format(index)))
+        mesh.set_attribute('points', array.array(
+            'f', (rand.uniform(-100, 100) for _ in range(points * 3))
+        ), as_type='point3f[]')
+        mesh.set_attribute('normals', array.array(
+            'f', (rand.uniform(-1, 1) for _ in range(points * 3))
+        ), as_type='normal3f[]')
+        mesh.set_attribute('faceVertexIndices', array.array('i', range(points)),
+                           as_type='int[]')
+    return stage
+
+
+def build_hierarchy(count=XFORM_COUNT, frames=FRAME_COUNT):
+    """Return a stage with count transforms, each with an animated translation"""
+    stage = aud.Stage()
+    root = stage.add_child(audGeom.Xform('root'))
+    for index in range(count):
+        xform = root.add_child(audGeom.Xform('xform_{}'.format(index)))
+        xform.set_property('kind', 'component')
+        translate = xform.set_attribute('xformOp:translate', None, as_type='double3')
+        for frame in range(1, frames + 1):
+            translate.set_keyframe(frame, (index, frame, 0.5))
+        xform.set_xform_order('t')
+    return stage
+
+
+def measure(location, lazy=False):
+    """Return the best time to read a file"""
+    best = None
+    for _ in range(REPEATS):
+        start = time.time()
+        aud.open_stage(location, lazy=lazy)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    directory = tempfile.mkdtemp()
+
+    print('{:<12}{:>12}{:>10}{:>10}{:>10}'.format('File', 'Bytes', 'Seconds', 'MB/s', 'Lazy'))
+    for name, stage in (('meshes', build_meshes()), ('hierarchy', build_hierarchy())):
+        location = os.path.join(directory, '{}.usda'.format(name))
+        stage.save(location)
+
+        size = os.path.getsize(location)
+        seconds = measure(location)
+        lazy = measure(location, lazy=True)
+        print('{:<12}{:>12}{:>10.3f}{:>10.1f}{:>10.3f}'.format(
+            name, size, seconds, size / seconds / 1e6, lazy
+        ))
+        os.remove(location)
+
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 import logging
 import weakref
+from array import array
 
 import bpy
 
@@ -122,8 +123,13 @@ class AUDExporter(object):
 
     def write_animation(self):
         scene = self.context.scene
+        frames = array('d', range(scene.frame_start, scene.frame_end+1, 2))
 
-        for frame in range(scene.frame_start, scene.frame_end+1, 2):
+        # Transform samples are gathered into one flat buffer per attribute and set in
+        # bulk at the end, rather than as one keyframe per attribute per frame
+        transforms = {}
+
+        for frame in frames:
             for prim, node in self.animated_objects:
                 ntype = node.type
 
@@ -135,7 +141,11 @@ class AUDExporter(object):
                 elif ntype == 'CAMERA':
                     self.camera(node, frame=frame, prim=prim)
 
-                self.apply_transforms(node, prim=prim, frame=frame)
+                for attr, val in self.transform_values(node):
+                    transforms.setdefault((prim, attr), array('d')).extend(val)
+
+        for (prim, attr), values in transforms.items():
+            prim.get_attribute(attr).set_keyframes(frames, values)
 
 
     def mesh(self, node, frame=None, prim=None):
@@ -146,28 +156,17 @@ class AUDExporter(object):
         depsgraph = self.context.depsgraph
         mesh = node.to_mesh(depsgraph, apply_modifiers=True)
 
-        vertices = mesh.vertices[:]
-        polygons = mesh.polygons[:]
-        loops = mesh.loops[:]
-
-        positions = []
-        normals = []
-
-        for vert in vertices:
-            pos = vert.co
-            norm = vert.normal
-            positions.append((pos.x, pos.y, pos.z))
-            normals.append((norm.x, norm.y, norm.z))
+        # Read straight into flat typed buffers, which aud writes out without
+        # converting every vertex into Python tuples first
+        positions = array('f', [0.0]) * (len(mesh.vertices) * 3)
+        normals = array('f', [0.0]) * (len(mesh.vertices) * 3)
+        mesh.vertices.foreach_get('co', positions)
+        mesh.vertices.foreach_get('normal', normals)
 
-        vertCounts = []
-        vertIndices = []
-        for poly in polygons:
-            verts = poly.vertices
-            vertCounts.append(len(verts))
-
-            for l in poly.loop_indices:
-                loop = loops[l]
-                vertIndices.append(loop.vertex_index)
+        vertCounts = array('i', [0]) * len(mesh.polygons)
+        vertIndices = array('i', [0]) * len(mesh.loops)
+        mesh.polygons.foreach_get('loop_total', vertCounts)
+        mesh.loops.foreach_get('vertex_index', vertIndices)
 
         prim.set_attribute('faceVertexCounts', vertCounts, as_type='int[]')
         prim.set_attribute('faceVertexIndices', vertIndices, as_type='int[]')
@@ -223,7 +222,7 @@ class AUDExporter(object):
             self.apply_transforms(node, prim, frame=frame)
         return prim
 
-    def apply_transforms(self, node: bpy.types.Object, prim: aud.Prim, frame=None):
+    def transform_values(self, node: bpy.types.Object):
         location = node.location
         location = (location.x, location.y, location.z)
 
@@ -233,12 +232,15 @@ class AUDExporter(object):
         scale = node.scale
         scale = (scale.x, scale.y, scale.z)
 
-        attrMap = (
+        return (
             ('xformOp:translate', location),
             ('xformOp:rotateXYZ', rotation),
             ('xformOp:scale', scale)
         )
 
+    def apply_transforms(self, node: bpy.types.Object, prim: aud.Prim, frame=None):
+        attrMap = self.transform_values(node)
+
         if frame is None:
             prim.set_xform_order()
         for attr, val in attrMap:
@@ -1,42 +1,1163 @@
-import aud
+"""
+Tests for aud. Run them from the root of the repository with
+
+    python -m pytest tests.py
+
+or python tests.py. The tests that compare files with USD itself are skipped when its
+Python bindings (pxr) aren't installed.
+"""
+import array
 import os
+import shutil
+import tempfile
+import struct
+import subprocess
+import sys
+import unittest
+import warnings
+import zipfile
+
+import aud
 from aud import audGeom
 
+try:
+    from pxr import Usd
+except ImportError:
+    Usd = None
 
 root_directory = os.path.dirname(os.path.abspath(__file__))
-output_file = os.path.join(root_directory, 'sample_data', 'test.usda')
 
-stage = aud.Stage()
-stage.set_frame_range(1, 200)
-stage.set_framerate(24)
-stage.set_up_axis('Y')
+needs_usd = unittest.skipIf(Usd is None, 'The USD Python bindings are not installed')
+
+
+def build_sample_stage():
+    """Return the stage that aud has always been checked with"""
+    stage = aud.Stage()
+    stage.set_frame_range(1, 200)
+    stage.set_framerate(24)
+    stage.set_up_axis('Y')
+
+    root = aud.Prim('root')
+    stage.add_child(root)
+
+    cyl = root.add_child(audGeom.Cylinder('cylinder'))
+    root.add_child(audGeom.Cube('Cube'))
+    cyl.set_attribute('height', 10)
+    cyl.set_attribute('axis', 'Y')
+
+    translate = cyl.set_attribute('xformOp:translate', (-1.99, 0, 2), as_type='double3')
+    translate.set_keyframe(1, (1, 2, 3))
+    translate.set_keyframe(2, (5, 4, 3))
+    translate.set_keyframe(100, (10, 10, 10))
+
+    cyl.set_xform_order()
+
+    xf = root.add_child(audGeom.Xform('foo'))
+    xf.add_inherit(cyl, mode='add')
+
+    xf.add_variant("lodVariant")
+
+    lodVariant = xf.add_child(aud.VariantSet("lodVariant"))
+    hiLOD = lodVariant.add_child(aud.Variant("hi"))
+
+    hiLOD.add_child(audGeom.Xform('HiGeometry'))
+    return stage
+
+
+# What build_sample_stage was written as before saving was reworked. Saving with the
+# default options has to keep writing exactly this
+SAMPLE_USDA = '''#usda 1.0
+(
+    "Written by AUD v{version}"
+    startTimeCode = 1
+    endTimeCode = 200
+    timeCodesPerSecond = 24
+    upAxis = "Y"
+)
+
+
+def "root" (
+)
+{{
+
+    def Cylinder "cylinder" (
+    )
+    {{
+        double height = 10
+        uniform token axis = "Y"
+        double3 xformOp:translate.timeSamples = {{
+            1: (1, 2, 3),
+            2: (5, 4, 3),
+            100: (10, 10, 10),
+        }}
+
+        uniform token[] xformOpOrder = ["xformOp:translate", "xformOp:rotateXYZ", "xformOp:scale"]
+
+    }}
+
+    def Cube "Cube" (
+    )
+    {{
+
+    }}
+
+    def Xform "foo" (
+        variantSets = [
+            "lodVariant",
+
+        ]
+        add inherits = [
+            </root/cylinder>,
+
+        ]
+    )
+    {{
+        variantSet "lodVariant" = {{
+            "hi" {{
+
+                def Xform "HiGeometry" (
+                )
+                {{
+
+                }}
+
+            }}
+
+        }}
+
+    }}
+
+}}
+'''.format(version=aud.__version__)
+
+
+def usd_contents(location, selections=()):
+    """Return what USD composes from a file, to compare files that aud wrote with
+
+    Args:
+        location (str): The file to open
+        selections: The prim path, variant set and variant of variants to select
+
+    Returns:
+        list: The path, type and instancing of each prim, with its attribute values
+
+    """
+    stage = Usd.Stage.Open(location)
+    for path, variant_set, variant in selections:
+        stage.GetPrimAtPath(path).GetVariantSet(variant_set).SetVariantSelection(variant)
+
+    contents = []
+    for prim in stage.Traverse():
+        attributes = []
+        for attr in prim.GetAuthoredAttributes():
+            samples = [(frame, attr.Get(frame)) for frame in attr.GetTimeSamples()]
+            attributes.append((attr.GetName(), str(attr.Get()), str(samples)))
+        contents.append((str(prim.GetPath()), prim.GetTypeName(), prim.IsInstance(),
+                         sorted(attributes)))
+    return contents
+
+
+def authored_attribute(name, value, as_type):
+    """Return a new attribute with a value that's written out"""
+    attr = aud.Attribute(name, as_type=as_type)
+    attr.set_value(value)
+    return attr
+
+
+def composition_list(name, *items):
+    """Return a new prepended list of references, inherits or the like"""
+    iterable = aud.Iterable(name, mode='prepend')
+    iterable.extend(items)
+    return iterable
+
+
+class TempDirTestCase(unittest.TestCase):
+    """Gives each test a directory to write files to, which is removed afterwards"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def read(self, name):
+        with open(self.path(name)) as f:
+            return f.read()
+
+
+class TestLegacyOutput(TempDirTestCase):
+
+    def test_save_is_unchanged(self):
+        build_sample_stage().save(self.path('sample.usda'))
+        self.assertEqual(self.read('sample.usda'), SAMPLE_USDA)
+
+    def test_lines_match_save(self):
+        stage = build_sample_stage()
+        self.assertEqual(''.join(stage.iter_lines()), SAMPLE_USDA)
+
+
+class TestDeduplicate(TempDirTestCase):
+
+    def build_stage(self):
+        stage = aud.Stage()
+        root = stage.add_child(audGeom.Xform('root'))
+        root.add_variant('lod')
+        variants = root.add_child(aud.VariantSet('lod'))
+        parents = [('mesh', root), ('hiMesh', variants.add_child(aud.Variant('hi')))]
+        for name, parent in parents:
+            for index in range(3):
+                mesh = parent.add_child(audGeom.Mesh('{}{}'.format(name, index)))
+                mesh.set_attribute('points', array.array('f', [0, 1, 2] * 4),
+                                   as_type='point3f[]')
+                mesh.set_attribute('xformOp:translate', (index, 0, 0), as_type='double3')
+        return stage
+
+    def test_report(self):
+        report = self.build_stage().save_deduplicated(self.path('stage.usda'))
+        self.assertEqual((report.prims, report.unique, report.prototypes, report.instances),
+                         (6, 1, 1, 6))
+
+    def test_variant_children_are_instanced(self):
+        self.build_stage().save_deduplicated(self.path('stage.usda'))
+        text = self.read('stage.usda')
+        self.assertEqual(text.count('instanceable = True'), 6)
+        self.assertEqual(text.count('point3f[] points'), 1)
+
+    @needs_usd
+    def test_usda_matches_usdc(self):
+        stage = self.build_stage()
+        usda = stage.save_deduplicated(self.path('stage.usda'))
+        usdc = stage.save_deduplicated(self.path('stage.usdc'))
+        self.assertEqual(repr(usda), repr(usdc))
+
+        selections = [('/root', 'lod', 'hi')]
+        contents = usd_contents(self.path('stage.usda'), selections)
+        self.assertEqual(contents, usd_contents(self.path('stage.usdc'), selections))
+        self.assertEqual(sum(1 for prim in contents if prim[2]), 6)
+
+
+class TestApiSchemas(TempDirTestCase):
+
+    def build_stage(self):
+        stage = aud.Stage()
+        mesh = stage.add_child(audGeom.Mesh('mesh'))
+        mesh.add_api_schema('MaterialBindingAPI')
+        mesh.add_api_schema('CollectionAPI:lights')
+        mesh.add_api_schema('SkelBindingAPI', mode='append')
+        return stage
+
+    def schemas(self, stage):
+        return [(iterable.mode, [str(obj) for obj in iterable])
+                for iterable in stage.get_prim_at_path('/mesh').api_schemas]
+
+    @needs_usd
+    def test_round_trip(self):
+        stage = self.build_stage()
+        for name in ('stage.usda', 'stage.usdc'):
+            with self.subTest(name):
+                stage.save(self.path(name))
+                usd_stage = Usd.Stage.Open(self.path(name))
+                prim = usd_stage.GetPrimAtPath('/mesh')
+                self.assertEqual(list(prim.GetAppliedSchemas()),
+                                 ['MaterialBindingAPI', 'CollectionAPI:lights', 'SkelBindingAPI'])
+                self.assertEqual(self.schemas(aud.open_stage(self.path(name))), self.schemas(stage))
+
+
+class TestUsdaReader(TempDirTestCase):
+
+    # Text with everything that aud has no model for, and where it is
+    UNSUPPORTED_USDA = '''#usda 1.0
+(
+    subLayers = [@other.usda@]
+)
+
+def Xform "root" (
+    variants = {
+        string lod = "hi"
+    }
+    customData = {
+        int count = 1
+    }
+    prepend kind = ["component"]
+    references = @other.usda@ (offset = 10)
+    prepend apiSchemas = ["MaterialBindingAPI"]
+)
+{
+    float a.connect = </root.b>
+    float b = 1 (
+        customData = {int count = 2}
+    )
+    dictionary d = {int count = 3}
+    variantSet "lod" = {
+        "hi" {
+            float c.spline = {}
+        }
+    }
+}
+'''
+
+    LEFT_OUT = [
+        ("'subLayers' metadata", '</>'),
+        ("'variants' metadata", '</root>'),
+        ("'customData' metadata", '</root>'),
+        ("'prepend kind' metadata", '</root>'),
+        ('layer offsets and custom data of references', '</root>'),
+        ('attribute connections', '</root.a>'),
+        ("'customData' metadata", '</root.b>'),
+        ('dictionary attributes', '</root.d>'),
+        ('splines', '</root{lod=hi}.c>'),
+    ]
+
+    def read_warnings(self, lazy):
+        """Read the unsupported text, returning the stage and what was warned about"""
+        with open(self.path('stage.usda'), 'w') as f:
+            f.write(self.UNSUPPORTED_USDA)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            stage = aud.usda.read_usda(self.path('stage.usda'), lazy=lazy)
+            # Lazy reads only read the attributes when they're used
+            for path in ('/root', '/root/lod/hi'):
+                list(stage.get_prim_at_path(path).iter_attributes())
+        return stage, [str(warning.message) for warning in caught
+                       if warning.category is aud.usda.UnsupportedDataWarning]
+
+    def test_left_out_data_is_warned_about(self):
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                stage, messages = self.read_warnings(lazy)
+                for what, path in self.LEFT_OUT:
+                    self.assertTrue(any(what in message and path in message
+                                        for message in messages), (what, path, messages))
+                self.assertEqual(len(stage.get_prim_at_path('/root').api_schemas), 1)
+
+    @needs_usd
+    def test_round_trip(self):
+        build_sample_stage().save(self.path('sample.usda'))
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                aud.usda.read_usda(self.path('sample.usda'), lazy=lazy).save(
+                    self.path('read.usda')
+                )
+                self.assertEqual(usd_contents(self.path('read.usda')),
+                                 usd_contents(self.path('sample.usda')))
+
+    def test_star_import_keeps_builtins(self):
+        namespace = {}
+        exec('from aud import *', namespace)
+        for name in ('open', 'os', 'sys', 'time', 'struct'):
+            self.assertNotIn(name, namespace)
+        self.assertIs(namespace['open_stage'], aud.open_stage)
+        self.assertIs(aud.open, aud.open_stage)
+
+        build_sample_stage().save(self.path('sample.usda'))
+        self.assertEqual(aud.open(self.path('sample.usda')).lines(),
+                         aud.open_stage(self.path('sample.usda')).lines())
+
+
+class TestLiveLists(TempDirTestCase):
+
+    def build_stage(self):
+        stage = aud.Stage()
+        root = stage.add_child(audGeom.Xform('root'))
+        root.add_child(audGeom.Mesh('mesh'))
+        return stage, root
+
+    def test_children(self):
+        stage, root = self.build_stage()
+        child = audGeom.Xform('child')
+        root.children.append(child)
+        self.assertIs(stage.get_prim_at_path('/root/child'), child)
+        self.assertEqual([prim.name for prim in root.children], ['mesh', 'child'])
+
+        root.children.remove(child)
+        self.assertIsNone(stage.get_prim_at_path('/root/child'))
+        self.assertIsNone(child.parent)
+
+        root.children = [child]
+        self.assertIsNone(stage.get_prim_at_path('/root/mesh'))
+        self.assertEqual(child.path(), '/root/child')
+
+    def test_attributes(self):
+        stage, root = self.build_stage()
+        attr = authored_attribute('size', 2.0, 'double')
+        root.attributes.append(attr)
+        self.assertIs(root.get_attribute('size'), attr)
+        self.assertIn(attr, root.attributes)
+        self.assertEqual(root.attributes, [attr])
+        self.assertIn('double size = 2', ''.join(stage.iter_lines()))
+
+        with self.assertRaises(ValueError):
+            root.attributes.append(aud.Attribute('size', value=3.0, as_type='double'))
+        with self.assertRaises(TypeError):
+            root.attributes.append(aud.Property('size'))
+
+        del root.attributes[0]
+        self.assertIsNone(root.get_attribute('size'))
+        self.assertEqual(len(root.attributes), 0)
+
+    def test_properties(self):
+        stage, root = self.build_stage()
+        kind = aud.Property('kind')
+        kind.set_value('component')
+        root.properties.append(kind)
+        self.assertIs(root.get_property('kind'), kind)
+        self.assertIn('kind = "component"', ''.join(stage.iter_lines()))
+
+        root.properties.pop()
+        self.assertIsNone(root.get_property('kind'))
+
+    def test_composition_lists(self):
+        stage, root = self.build_stage()
+        references = composition_list('references', aud.IterObject('./rock.usda', is_file=True))
+        root.references.append(references)
+        self.assertEqual(root.references, [references])
+        self.assertIn('@./rock.usda@', ''.join(stage.iter_lines()))
+
+        root.references.remove(references)
+        self.assertNotIn('@./rock.usda@', ''.join(stage.iter_lines()))
+        with self.assertRaises(TypeError):
+            root.inherits.append('/root/mesh')
+
+
+class TestUsdz(TempDirTestCase):
+
+    def setUp(self):
+        super(TestUsdz, self).setUp()
+        os.mkdir(self.path('textures'))
+        for name in ('textures/wood.png', 'textures/rock.png'):
+            with open(self.path(name), 'wb') as f:
+                f.write(b'not really a png')
+
+        # A layer that uses an asset of its own
+        rock = aud.Stage()
+        material = rock.add_child(aud.Prim('rock'))
+        material.set_attribute('rockTexture', './textures/rock.png', as_type='asset')
+        rock.save(self.path('rock.usda'))
+
+    def build_stage(self):
+        stage = aud.Stage()
+        mesh = stage.add_child(audGeom.Mesh('mesh'))
+        mesh.set_attribute('texture', './textures/wood.png', as_type='asset')
+        mesh.add_reference(aud.IterObject('./rock.usda', object_name='/rock', is_file=True))
+        return stage
+
+    def entries(self, name):
+        """Return the names of the entries of a package and the offsets of their data"""
+        entries = []
+        with open(self.path(name), 'rb') as f:
+            for info in zipfile.ZipFile(f).infolist():
+                f.seek(info.header_offset + 26)
+                name_size, extra_size = struct.unpack('<HH', f.read(4))
+                data = info.header_offset + 30 + name_size + extra_size
+                entries.append((info.filename, data))
+        return entries
+
+    def test_assets_are_packaged(self):
+        self.build_stage().save(self.path('stage.usdz'))
+        entries = self.entries('stage.usdz')
+        self.assertEqual([name for name, _ in entries], [
+            'stage.usdc', 'rock.usda', 'textures/wood.png', 'textures/rock.png'
+        ])
+        for name, offset in entries:
+            self.assertEqual(offset % 64, 0, name)
+
+    def test_create_usdz_packages_assets(self):
+        self.build_stage().save(self.path('stage.usda'))
+        names = aud.create_usdz(self.path('stage.usdz'), [self.path('stage.usda')])
+        self.assertEqual(names, ['stage.usda', 'rock.usda', 'textures/wood.png',
+                                 'textures/rock.png'])
+        self.assertEqual([name for name, _ in self.entries('stage.usdz')], names)
+
+    def test_missing_assets_raise(self):
+        stage = self.build_stage()
+        stage.add_child(aud.Prim('missing')).add_reference('./missing.usda')
+        with open(self.path('stage.usdz'), 'w+b') as f:
+            with self.assertRaises(ValueError):
+                stage.write_usdz(f, 'stage.usdc', asset_directory=self.directory)
+            self.assertEqual(f.tell(), 0)
+
+        stage = self.build_stage()
+        stage.add_child(aud.Prim('outside')).add_reference('../outside.usda')
+        with self.assertRaises(ValueError):
+            stage.save(self.path('stage.usdz'))
+
+    @needs_usd
+    def test_usd_opens_package(self):
+        self.build_stage().save(self.path('stage.usdz'))
+        stage = Usd.Stage.Open(self.path('stage.usdz'))
+        mesh = stage.GetPrimAtPath('/mesh')
+        for name, path in (('texture', 'textures/wood.png'),
+                           ('rockTexture', 'textures/rock.png')):
+            resolved = mesh.GetAttribute(name).Get().resolvedPath
+            self.assertEqual(resolved, '{}[{}]'.format(self.path('stage.usdz'), path))
+
+
+class TestIncrementalSave(TempDirTestCase):
+
+    def build_stage(self):
+        stage = aud.Stage()
+        root = stage.add_child(audGeom.Xform('root'))
+        mesh = root.add_child(audGeom.Mesh('mesh'))
+        mesh.set_attribute('points', array.array('f', [0.5, 1, 2] * 2), as_type='point3f[]')
+        mesh.set_attribute('xformOp:translate', (1, 2, 3), as_type='double3')
+        mesh.set_property('kind', 'component')
+        root.add_child(audGeom.Xform('other'))
+        return stage
+
+    # Each change is made to the stage after an incremental save, and has to show up in
+    # the next one
+    CHANGES = [
+        ('set_value', lambda stage, mesh: mesh.get_attribute('xformOp:translate').set_value(
+            (4, 5, 6))),
+        ('set_keyframe', lambda stage, mesh: mesh.get_attribute('xformOp:translate')
+            .set_keyframe(1, (0, 0, 0))),
+        ('set_keyframes', lambda stage, mesh: mesh.get_attribute('xformOp:translate')
+            .set_keyframes([1, 2], [(0, 0, 0), (1, 1, 1)])),
+        ('attribute set_precision', lambda stage, mesh: mesh.get_attribute('points')
+            .set_precision(1)),
+        ('as_type', lambda stage, mesh: setattr(mesh.get_attribute('xformOp:translate'),
+                                                'as_type', 'float3')),
+        ('set_attribute', lambda stage, mesh: mesh.set_attribute('doubleSided', True)),
+        ('set_property', lambda stage, mesh: mesh.set_property('kind', 'assembly')),
+        ('remove_property', lambda stage, mesh: mesh.remove_property('kind')),
+        ('add_reference', lambda stage, mesh: mesh.add_reference('./rock.usda')),
+        ('add_payload', lambda stage, mesh: mesh.add_payload('./rock.usda')),
+        ('add_inherit', lambda stage, mesh: mesh.add_inherit('/root/other')),
+        ('add_variant', lambda stage, mesh: mesh.add_variant('lod')),
+        ('add_api_schema', lambda stage, mesh: mesh.add_api_schema('MaterialBindingAPI')),
+        ('set_xform_order', lambda stage, mesh: mesh.set_xform_order()),
+        ('rename', lambda stage, mesh: setattr(mesh, 'name', 'renamed')),
+        ('add_child', lambda stage, mesh: mesh.add_child(audGeom.Xform('child'))),
+        ('stage set_precision', lambda stage, mesh: stage.set_precision(2)),
+        ('children.append', lambda stage, mesh: mesh.children.append(audGeom.Xform('child'))),
+        ('children.pop', lambda stage, mesh: stage.get_prim_at_path('/root').children.pop()),
+        ('attributes.append', lambda stage, mesh: mesh.attributes.append(
+            authored_attribute('size', 1.0, 'double'))),
+        ('attributes.remove', lambda stage, mesh: mesh.attributes.remove(
+            mesh.get_attribute('points'))),
+        ('properties.clear', lambda stage, mesh: mesh.properties.clear()),
+        ('references.append', lambda stage, mesh: mesh.references.append(
+            composition_list('references', aud.IterObject('./rock.usda', is_file=True)))),
+        ('inherits.append', lambda stage, mesh: mesh.inherits.append(
+            composition_list('inherits', aud.IterObject(object_name='/root/other')))),
+    ]
+
+    def check(self, change):
+        stage = self.build_stage()
+        mesh = stage.get_prim_at_path('/root/mesh')
+        stage.save(self.path('before.usda'), incremental=True)
+        change(stage, mesh)
+        stage.save(self.path('incremental.usda'), incremental=True)
+        stage.save(self.path('full.usda'))
+        self.assertNotEqual(self.read('incremental.usda'), self.read('before.usda'))
+        self.assertEqual(self.read('incremental.usda'), self.read('full.usda'))
+
+    def test_changes_are_written(self):
+        for name, change in self.CHANGES:
+            with self.subTest(name):
+                self.check(change)
+
+    def test_buffers_changed_in_place_need_mark_dirty(self):
+        def change(stage, mesh):
+            attr = mesh.get_attribute('points')
+            attr.value[0] = 7
+            attr.mark_dirty()
+
+        self.check(change)
+
+    def test_unchanged_prims_are_reused(self):
+        stage = self.build_stage()
+        stage.save(self.path('first.usda'), incremental=True)
+        with aud.instrumented() as aggregator:
+            stage.save(self.path('second.usda'), incremental=True)
+        self.assertEqual(self.read('first.usda'), self.read('second.usda'))
+        reused = sum(total[0] for (kind, name, _), total in aggregator.totals.items()
+                     if name == 'prim.text_reused')
+        self.assertEqual(reused, 3)
+
+
+class TestFormatting(unittest.TestCase):
+
+    # Values that were formatted without a type before, with the type they're written as
+    PLAIN_VALUES = [
+        ([(0, 1.5, 2), (3, 4, 5)], 'point3f[]'),
+        ([1, 2, 3], 'int[]'),
+        ([True, False], 'bool[]'),
+        ([0.1, 1e-07, 1e+20], 'double[]'),
+        ([(1, 2), (3, 4, 5)], 'float3[]'),
+        (['a', 'b'], 'token[]'),
+        ([], 'float[]'),
+    ]
+
+    def test_typed_matches_untyped(self):
+        for value, as_type in self.PLAIN_VALUES:
+            with self.subTest(as_type=as_type, value=value):
+                self.assertEqual(aud.formatted_value(value, as_type=as_type),
+                                 aud.formatted_value(value))
+        self.assertEqual(aud.formatted_value((1, 2.5, 3), array=False, as_type='double3'),
+                         aud.formatted_value((1, 2.5, 3), array=False))
+
+    def test_buffers_are_grouped_by_type(self):
+        self.assertEqual(aud.format_typed(array.array('f', [0, 1.5, 2, 3, 4, 5]), 'point3f[]'),
+                         '[(0.0, 1.5, 2.0), (3.0, 4.0, 5.0)]')
+        self.assertEqual(aud.format_typed(memoryview(array.array('i', [1, 2, 3, 4])), 'int2[]'),
+                         '[(1, 2), (3, 4)]')
+        self.assertEqual(aud.format_typed(array.array('i', [1, 2, 3]), 'int[]'), '[1, 2, 3]')
+
+
+class TestBufferValues(unittest.TestCase):
+
+    def test_buffers_are_kept_as_passed(self):
+        points = array.array('f', [0, 1, 2, 3, 4, 5])
+        attr = aud.Attribute('points', as_type='point3f[]')
+        attr.set_value(points)
+        self.assertIs(attr.value, points)
+        self.assertEqual(''.join(attr.iter_lines()),
+                         'point3f[] points = [(0.0, 1.0, 2.0), (3.0, 4.0, 5.0)]')
+
+    def test_bytes_are_read_as_the_scalar_type(self):
+        attr = aud.Attribute('points', as_type='point3f[]')
+        attr.set_value(struct.pack('<3f', 1, 2, 3))
+        self.assertEqual(''.join(attr.iter_lines()), 'point3f[] points = [(1.0, 2.0, 3.0)]')
+
+    def test_lengths_that_dont_fit_raise(self):
+        attr = aud.Attribute('points', as_type='point3f[]')
+        self.assertRaises(ValueError, attr.set_value, array.array('f', [0, 1]))
+        self.assertRaises(ValueError, attr.set_keyframe, 1, array.array('f', [0, 1, 2, 3]))
+
+
+class TestSchemaDefaults(unittest.TestCase):
+
+    def test_defaults_are_copies(self):
+        size = audGeom.Cube('cube').get_attribute('size', defaults=True)
+        self.assertEqual((size.value, size.as_type, size.is_uniform), (2, 'double', False))
+        size.set_value(3)
+        self.assertEqual(audGeom.Cube('other').get_attribute('size', defaults=True).value, 2)
+        self.assertIsNone(audGeom.Cube('cube').get_attribute('size'))
+        self.assertIsNone(audGeom.Cube('cube').get_attribute('missing', defaults=True))
+
+    def test_registry_matches_the_class_walk(self):
+        for name in ('Mesh', 'Cube', 'Xform', 'Camera', 'BasisCurves'):
+            cls = getattr(audGeom, name)
+            # The defaults were looked up in the bases of a class and then the class
+            expected = {}
+            for klass in cls._class_inheritence():
+                for value in klass.__dict__.values():
+                    if isinstance(value, aud.Attribute):
+                        expected.setdefault(value.name, value)
+            with self.subTest(name):
+                self.assertEqual(cls._schema_defaults()[0], expected)
+
+    def test_registry_is_built_once_per_class(self):
+        class Ball(audGeom.Sphere):
+            __slots__ = ()
+
+        with aud.instrumented() as aggregator:
+            for _ in range(3):
+                Ball('ball').get_attribute('radius', defaults=True)
+        built = [total[0] for (kind, name, _), total in aggregator.totals.items()
+                 if name == 'schema.registry']
+        self.assertEqual(built, [1])
+
+
+class TestPrimPaths(unittest.TestCase):
+
+    def build_stage(self):
+        stage = aud.Stage()
+        root = stage.add_child(aud.Prim('root'))
+        geo = root.add_child(aud.Prim('geo'))
+        geo.add_attribute(aud.Attribute('size', as_type='double'))
+        hi = root.add_child(aud.VariantSet('lod')).add_child(aud.Variant('hi'))
+        hi.add_child(aud.Prim('mesh'))
+        return stage, root, geo
+
+    def test_prims_are_indexed(self):
+        stage, root, geo = self.build_stage()
+        self.assertIs(stage.get_prim_at_path('/root/geo'), geo)
+        self.assertEqual(stage.get_prim_at_path('/root/lod/hi/mesh').path(), '/root/lod/hi/mesh')
+        self.assertIsNone(stage.get_prim_at_path('/missing'))
+
+    def test_renames_update_paths(self):
+        stage, root, geo = self.build_stage()
+        attr = geo.get_attribute('size')
+        self.assertEqual(attr.path(), '/root/geo/size')
+
+        root.name = 'top'
+        self.assertIs(stage.get_prim_at_path('/top/geo'), geo)
+        self.assertIsNone(stage.get_prim_at_path('/root/geo'))
+        self.assertEqual(attr.path(), '/top/geo/size')
+
+    def test_moves_update_paths(self):
+        stage, root, geo = self.build_stage()
+        root.children.remove(geo)
+        self.assertIsNone(stage.get_prim_at_path('/root/geo'))
+        self.assertIsNone(geo.parent)
+
+        other = stage.add_child(aud.Prim('other'))
+        other.add_child(geo)
+        self.assertIs(stage.get_prim_at_path('/other/geo'), geo)
+        self.assertEqual(geo.get_attribute('size').path(), '/other/geo/size')
+
+    def test_detached_subtrees_update_paths(self):
+        root = aud.Prim('root')
+        geo = root.add_child(aud.Prim('geo'))
+        self.assertEqual(geo.path(), '/root/geo')
+
+        stage = aud.Stage()
+        top = stage.add_child(aud.Prim('top'))
+        top.add_child(root)
+        self.assertEqual(geo.path(), '/top/root/geo')
+        self.assertIs(stage.get_prim_at_path('/top/root/geo'), geo)
+        self.assertIsNone(stage.get_prim_at_path('/root/geo'))
+
+        top.add_child(aud.Prim('instance')).add_inherit(geo)
+        self.assertIn('</top/root/geo>', ''.join(stage.iter_lines()))
+
+
+def animated_stage(set_samples, as_type='double3'):
+    """Return the text of a stage with an attribute animated by a function"""
+    stage = aud.Stage()
+    attr = stage.add_child(aud.Prim('root')).set_attribute('t', None, as_type=as_type)
+    set_samples(attr)
+    return ''.join(stage.iter_lines())
+
+
+class TestTimeSamples(unittest.TestCase):
+
+    FRAMES = [1, 2, 3]
+    VALUES = [(1, 1, 1), (2, 2.5, 2), (3, 3, 3)]
+
+    def set_each(self, attr):
+        for frame, value in zip(self.FRAMES, self.VALUES):
+            attr.set_keyframe(frame, value)
+
+    def test_bulk_matches_set_keyframe(self):
+        bulk = animated_stage(lambda attr: attr.set_keyframes(self.FRAMES, self.VALUES))
+        self.assertEqual(bulk, animated_stage(self.set_each))
+
+        # Buffers hold floats, which are written like float tuples are
+        flat = array.array('d', [number for value in self.VALUES for number in value])
+        floats = [tuple(float(number) for number in value) for value in self.VALUES]
+        self.assertEqual(animated_stage(lambda attr: attr.set_keyframes(self.FRAMES, flat)),
+                         animated_stage(lambda attr: attr.set_keyframes(self.FRAMES, floats)))
+
+    def test_frames_are_sorted(self):
+        samples = aud.TimeSamples([3, 1, 2], array.array('d', [3, 3, 1, 1, 2, 2]), 'double2')
+        self.assertEqual(list(samples), [1, 2, 3])
+        self.assertEqual(list(samples[2]), [2, 2])
+        self.assertRaises(ValueError, aud.TimeSamples, [1, 1], [1, 2])
+        self.assertRaises(ValueError, aud.TimeSamples, [1, 2], [1])
+
+    def test_new_samples_are_merged(self):
+        def change(attr):
+            attr.set_keyframes(self.FRAMES, self.VALUES)
+            attr.set_keyframe(2, (5, 5, 5))
+            attr.set_keyframes([4], [(4, 4, 4)])
+
+        samples = aud.Attribute('t', as_type='double3')
+        change(samples)
+        self.assertEqual(list(samples.keyframes), [1, 2, 3, 4])
+        self.assertEqual(samples.keyframes[2], (5, 5, 5))
+
+
+class TestReduceSamples(TempDirTestCase):
+
+    def test_reduce_samples(self):
+        self.assertEqual(aud.reduce_samples([1, 2, 3, 4, 5], [0, 1, 2, 2, 2]), [0, 2, 4])
+        self.assertEqual(aud.reduce_samples([1, 2, 3], [0, 1.05, 2]), [0, 1, 2])
+        self.assertEqual(aud.reduce_samples([1, 2, 3], [0, 1.05, 2], tolerance=0.1), [0, 2])
+        self.assertEqual(aud.reduce_samples([1, 2, 3, 4], [1, 2, 3, 5], interpolate=False),
+                         [0, 1, 2, 3])
+        self.assertEqual(aud.reduce_samples([1, 2, 3, 4], [1, 1, 1, 2], interpolate=False),
+                         [0, 3])
+
+    def test_held_types_only_drop_repeats(self):
+        attr = aud.Attribute('count', as_type='int')
+        for frame, value in enumerate([0, 1, 2, 2, 2]):
+            attr.set_keyframe(frame, value)
+        self.assertEqual(attr.reduced_keyframes(), [(0, 0), (1, 1), (2, 2), (4, 2)])
+
+    def test_save_reports_what_was_dropped(self):
+        stage = aud.Stage()
+        attr = stage.add_child(aud.Prim('root')).set_attribute('t', None, as_type='double')
+        attr.set_keyframes(range(10), [float(frame) for frame in range(10)])
+
+        self.assertEqual(stage.save(self.path('stage.usda'), reduce_tolerance=0),
+                         {'/root.t': 8})
+        self.assertIn('{\n        0: 0.0,\n        9: 9.0,\n    }', self.read('stage.usda'))
+
+
+class TestCompactOutput(TempDirTestCase):
+
+    def test_compact_is_smaller(self):
+        stage = build_sample_stage()
+        stage.save(self.path('pretty.usda'))
+        stage.save(self.path('compact.usda'), compact=True)
+        compact = self.read('compact.usda')
+        self.assertLess(len(compact), len(self.read('pretty.usda')))
+        self.assertFalse([line for line in compact.splitlines() if line != line.lstrip()])
+        self.assertNotIn('\n\n', compact)
+        self.assertIn('1: (1,2,3),', compact)
+
+    @needs_usd
+    def test_compact_reads_the_same(self):
+        stage = build_sample_stage()
+        stage.save(self.path('pretty.usda'))
+        stage.save(self.path('compact.usda'), compact=True)
+        selections = [('/root/foo', 'lodVariant', 'hi')]
+        self.assertEqual(usd_contents(self.path('compact.usda'), selections),
+                         usd_contents(self.path('pretty.usda'), selections))
+
+
+class TestPrecision(TempDirTestCase):
+
+    VALUES = [0.1, 1 / 3.0, 2.5, 1e-7, 123456.789]
+
+    def test_float32_reads_back_the_same(self):
+        floats = array.array('f', self.VALUES)
+        texts = aud.format_typed(floats, 'float[]', precision=aud.FLOAT32)[1:-1].split(', ')
+        self.assertEqual(array.array('f', [float(text) for text in texts]), floats)
+        self.assertEqual(texts[:3], ['0.1', '0.33333334', '2.5'])
+        # Doubles are still written in full
+        self.assertEqual(aud.format_typed(self.VALUES, 'double[]', precision=aud.FLOAT32),
+                         aud.format_typed(self.VALUES, 'double[]'))
+
+    def test_significant_digits(self):
+        self.assertEqual(aud.format_typed([1 / 3.0, 2.0], 'double[]', precision=4),
+                         '[0.3333, 2]')
+        self.assertEqual(aud.format_typed((1 / 3.0, 2, 3), 'float3', precision=3),
+                         '(0.333, 2, 3)')
+        for precision in (0, -1, True, 'single'):
+            self.assertRaises(ValueError, aud.SaveOptions, precision=precision)
+
+    def test_attribute_overrides_stage(self):
+        stage = aud.Stage()
+        prim = stage.add_child(aud.Prim('root'))
+        prim.set_attribute('a', 1 / 3.0, as_type='double')
+        prim.set_attribute('b', 1 / 3.0, as_type='double').set_precision(2)
+
+        stage.set_precision(4)
+        stage.save(self.path('stage.usda'))
+        self.assertIn('double a = 0.3333\n', self.read('stage.usda'))
+        self.assertIn('double b = 0.33\n', self.read('stage.usda'))
+
+        stage.save(self.path('stage.usda'), precision=aud.DOUBLE)
+        self.assertIn('double a = 0.3333333333333333\n', self.read('stage.usda'))
+        self.assertIn('double b = 0.33\n', self.read('stage.usda'))
+
+
+def build_mesh_stage():
+    """Return the sample stage with a mesh, whose arrays are long enough to compress"""
+    stage = build_sample_stage()
+    mesh = stage.get_prim_at_path('/root').add_child(audGeom.Mesh('mesh'))
+    mesh.set_attribute('points', array.array('f', range(60)), as_type='point3f[]')
+    mesh.set_attribute('faceVertexCounts', [4] * 5, as_type='int[]')
+    mesh.set_attribute('faceVertexIndices', list(range(20)), as_type='int[]')
+    mesh.set_attribute('extent', [(0, 1, 2), (57, 58, 59)], as_type='float3[]')
+    mesh.set_attribute('doubleSided', True)
+    return stage
+
+
+class TestCrate(TempDirTestCase):
+
+    SELECTIONS = [('/root/foo', 'lodVariant', 'hi')]
+
+    def contents(self, name):
+        return usd_contents(self.path(name), self.SELECTIONS)
+
+    @needs_usd
+    def test_usdc_matches_usda(self):
+        stage = build_mesh_stage()
+        stage.save(self.path('stage.usda'))
+        stage.save(self.path('stage.usdc'))
+        self.assertEqual(self.contents('stage.usdc'), self.contents('stage.usda'))
+
+        usd_stage = Usd.Stage.Open(self.path('stage.usdc'))
+        self.assertEqual((usd_stage.GetStartTimeCode(), usd_stage.GetEndTimeCode()), (1, 200))
+        self.assertEqual(usd_stage.GetMetadata('upAxis'), 'Y')
+
+    def test_arrays_are_read_lazily(self):
+        build_mesh_stage().save(self.path('stage.usdc'))
+        stage = aud.Stage.read_crate(self.path('stage.usdc'))
+        points = stage.get_prim_at_path('/root/mesh').get_attribute('points')
+        self.assertIsInstance(points._value, aud.LazyValue)
+        self.assertEqual(points.value, array.array('f', range(60)))
+        indices = stage.get_prim_at_path('/root/mesh').get_attribute('faceVertexIndices')
+        self.assertEqual(list(indices.value), list(range(20)))
+
+    @needs_usd
+    def test_round_trip(self):
+        build_mesh_stage().save(self.path('stage.usdc'))
+        aud.Stage.read_crate(self.path('stage.usdc')).save(self.path('read.usda'))
+        aud.open_stage(self.path('stage.usdc')).save(self.path('opened.usdc'))
+        self.assertEqual(self.contents('read.usda'), self.contents('stage.usdc'))
+        self.assertEqual(self.contents('opened.usdc'), self.contents('stage.usdc'))
+
+
+class TestLazyUsda(TempDirTestCase):
+
+    def test_attributes_are_read_on_first_use(self):
+        build_mesh_stage().save(self.path('stage.usda'))
+        stage = aud.open_stage(self.path('stage.usda'), lazy=True)
+        mesh = stage.get_prim_at_path('/root/mesh')
+        self.assertIsInstance(mesh._attributes, aud.LazyValue)
+        self.assertEqual(mesh.get_attribute('points').value, array.array('f', range(60)))
+        self.assertNotIsInstance(mesh._attributes, aud.LazyValue)
+
+    def test_prims_are_indexed_by_offset(self):
+        build_mesh_stage().save(self.path('stage.usda'))
+        with open(self.path('stage.usda'), 'rb') as f:
+            data = f.read()
+        reader = aud.usda.LazyUsdaReader(data, self.path('stage.usda'))
+        reader.read()
+        start, end = reader.ranges['/root/mesh']
+        self.assertTrue(data[start:end].startswith(b'def Mesh "mesh"'))
+        self.assertTrue(data[start:end].rstrip().endswith(b'}'))
+        self.assertIn('/root/foo/lodVariant/hi/HiGeometry', reader.ranges)
+
+    def test_lazy_saves_the_same_as_eager(self):
+        build_mesh_stage().save(self.path('stage.usda'))
+        for extension in ('usda', 'usdc'):
+            with self.subTest(extension):
+                for lazy in (False, True):
+                    stage = aud.open_stage(self.path('stage.usda'), lazy=lazy)
+                    stage.save(self.path('{}.{}'.format(lazy, extension)))
+                with open(self.path('True.' + extension), 'rb') as lazy_file:
+                    with open(self.path('False.' + extension), 'rb') as eager_file:
+                        self.assertEqual(lazy_file.read(), eager_file.read())
+
+    def test_changes_to_lazy_prims_are_saved(self):
+        build_mesh_stage().save(self.path('stage.usda'))
+        stage = aud.open_stage(self.path('stage.usda'), lazy=True)
+        stage.get_prim_at_path('/root/mesh').set_attribute('doubleSided', False)
+        stage.save(self.path('changed.usda'))
+        self.assertIn('uniform bool doubleSided = False', self.read('changed.usda'))
+
+
+def build_wide_stage(roots=4, children=6):
+    """Return a stage with enough animated subtrees to split between processes"""
+    stage = aud.Stage()
+    for root_index in range(roots):
+        root = stage.add_child(audGeom.Xform('group{}'.format(root_index)))
+        for index in range(children):
+            cube = root.add_child(audGeom.Cube('cube{}'.format(index)))
+            cube.set_attribute('size', float(index))
+            translate = cube.set_attribute('xformOp:translate', None, as_type='double3')
+            translate.set_keyframes(range(5), [(frame, index, 0) for frame in range(5)])
+    return stage
+
+
+class TestParallelSave(TempDirTestCase):
+
+    def test_workers_write_the_same_text(self):
+        stage = build_wide_stage()
+        serial = stage.save(self.path('serial.usda'), reduce_tolerance=0)
+        for workers in (2, 3):
+            with self.subTest(workers=workers):
+                reduced = stage.save(self.path('parallel.usda'), reduce_tolerance=0,
+                                     workers=workers)
+                self.assertEqual(self.read('parallel.usda'), self.read('serial.usda'))
+                self.assertEqual(reduced, serial)
+
+    def test_compact_workers_write_the_same_text(self):
+        stage = build_wide_stage(roots=1, children=12)
+        stage.save(self.path('serial.usda'), compact=True)
+        stage.save(self.path('parallel.usda'), compact=True, workers=4)
+        self.assertEqual(self.read('parallel.usda'), self.read('serial.usda'))
+
+
+class TestSaveLayers(TempDirTestCase):
+
+    def test_layers_are_named_after_their_prims(self):
+        layers = build_wide_stage(roots=2).save_layers(self.path('shot.usda'), depth=1)
+        self.assertEqual(layers, {
+            '/group0': self.path('shot.group0.usda'),
+            '/group1': self.path('shot.group1.usda'),
+        })
+        root = self.read('shot.usda')
+        self.assertIn('prepend payload = [\n        @./shot.group0.usda@</group0>,', root)
+        self.assertNotIn('cube0', root)
+        self.assertIn('defaultPrim = "group1"', self.read('shot.group1.usda'))
+
+    def test_split_by_type_and_size(self):
+        stage = build_wide_stage(roots=2, children=2)
+        layers = stage.save_layers(self.path('shot.usda'), types=audGeom.Cube)
+        self.assertEqual(sorted(layers), ['/group0/cube0', '/group0/cube1', '/group1/cube0',
+                                          '/group1/cube1'])
+        # The smallest subtrees that are big enough are split, so any size splits leaves
+        self.assertEqual(sorted(stage.save_layers(self.path('sized.usda'), min_size=1)),
+                         sorted(layers))
+        self.assertEqual(stage.save_layers(self.path('sized.usda'), min_size=10 ** 9), {})
+
+    def test_invalid_splits_raise(self):
+        stage = build_wide_stage(roots=1)
+        self.assertRaises(ValueError, stage.save_layers, self.path('shot.usda'), depth=1,
+                          arc='inherits')
+        self.assertRaises(ValueError, stage.save_layers, self.path('shot.usdz'), depth=1)
+
+    @needs_usd
+    def test_layers_compose_the_same(self):
+        stage = build_wide_stage()
+        stage.save(self.path('whole.usda'))
+        expected = usd_contents(self.path('whole.usda'))
+        for name, arc, workers in (('payload.usda', 'payload', None),
+                                   ('references.usdc', 'references', 2)):
+            with self.subTest(name):
+                stage.save_layers(self.path(name), depth=2, arc=arc, workers=workers)
+                self.assertEqual(usd_contents(self.path(name)), expected)
+
+
+class TestBenchmarkSuite(TempDirTestCase):
+
+    PARAMS = dict(prims=20, depth=2, attributes=2, array_length=10, keyframes=2, variants=2)
+
+    def test_stages_are_reproducible(self):
+        from benchmarks.suite.stages import build_stage
+
+        first = ''.join(build_stage(**self.PARAMS).iter_lines())
+        self.assertEqual(''.join(build_stage(**self.PARAMS).iter_lines()), first)
+        self.assertNotEqual(''.join(build_stage(seed=1, **self.PARAMS).iter_lines()), first)
+
+    def test_compare_finds_regressions(self):
+        from benchmarks.suite.compare import compare
+
+        def results(seconds, output_bytes):
+            return {'cases': [{'name': 'prims=20', 'results': {
+                'save_usda': {'seconds': seconds, 'output_bytes': output_bytes},
+            }}]}
+
+        baseline = results(1.0, 1000)
+        self.assertEqual(compare(results(1.1, 1010), baseline), [])
+        self.assertEqual(compare(results(1.5, 1100), baseline), [
+            ('prims=20', 'save_usda.output_bytes', 1000, 1100),
+            ('prims=20', 'save_usda.seconds', 1.0, 1.5),
+        ])
+        # Times that are too short to measure aren't compared
+        self.assertEqual(compare(results(0.005, 1000), results(0.001, 1000)), [])
+
+    def test_each_phase_is_measured(self):
+        from benchmarks.suite.measure import run_case
+
+        results = run_case(self.PARAMS, self.directory, repeats=1)
+        self.assertEqual(sorted(results), ['author', 'save_usda', 'save_usdc'])
+        for phase, values in results.items():
+            with self.subTest(phase):
+                self.assertGreater(values['seconds'], 0)
+                self.assertGreater(values['peak_rss'], 0)
+        self.assertGreater(results['save_usda']['output_bytes'], 0)
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+class TestInstrumentation(TempDirTestCase):
+
+    def test_saves_are_reported(self):
+        with aud.instrumented() as aggregator:
+            build_mesh_stage().save(self.path('stage.usda'))
+            build_mesh_stage().save(self.path('stage.usdc'))
+
+        spans = dict(((name, labels), (calls, sums))
+                     for name, labels, calls, _, sums in aggregator.top(count=100))
+        self.assertEqual(spans['save', (('format', 'usda'),)][0], 1)
+        self.assertEqual(spans['save', (('format', 'usdc'),)][0], 1)
+        self.assertEqual(spans['prim.lines', (('type', 'Mesh'),)][0], 1)
+        # Elements are summed, e.g. the 20 points of the mesh
+        calls, sums = spans['attribute.format', (('type', 'point3f[]'),)]
+        self.assertEqual((calls, sums), (1, {'elements': 20}))
+        self.assertIn('attribute.pack', aggregator.report(count=100))
+
+    def test_hooks_are_removed(self):
+        events = []
+
+        def hook(kind, name, value, tags):
+            events.append((kind, name))
+
+        aud.add_hook(hook)
+        try:
+            build_sample_stage().save(self.path('stage.usda'))
+        finally:
+            aud.remove_hook(hook)
+        self.assertIn(('span', 'save'), events)
+
+        del events[:]
+        build_sample_stage().save(self.path('stage.usda'))
+        self.assertEqual(events, [])
+
+
+class TestStageStats(TempDirTestCase):
+
+    def test_counts(self):
+        stats = build_mesh_stage().stats()
+        self.assertEqual(stats.prims, 8)
+        self.assertEqual(stats.prims_by_type, {
+            None: 1, 'Cylinder': 1, 'Cube': 1, 'Xform': 2, 'VariantSet': 1, 'Variant': 1,
+            'Mesh': 1,
+        })
+        self.assertEqual(stats.attributes, 9)
+        self.assertEqual(stats.attributes_by_type['int[]'], 2)
+        # 20 points, 5 counts, 20 indices, 2 extents and 3 names in xformOpOrder
+        self.assertEqual(stats.array_elements, 50)
+        self.assertEqual(stats.keyframes, 3)
+        self.assertEqual(stats.max_depth, 5)
+
+    def test_sizes_are_estimated(self):
+        from benchmarks.suite.stages import DEFAULTS, build_stage
 
-root = aud.Prim('root')
-stage.add_child(root)
+        stage = build_stage(**dict(DEFAULTS, prims=200, keyframes=10, variants=2))
+        stats = stage.stats()
+        # usdc is estimated from the raw size of the values, which it compresses
+        for name, options, estimate, slack in (
+                ('stage.usda', {}, stats.usda_bytes, 0.15),
+                ('compact.usda', {'compact': True}, stats.compact_bytes, 0.15),
+                ('stage.usdc', {}, stats.usdc_bytes, 1.0)):
+            with self.subTest(name):
+                stage.save(self.path(name), **options)
+                size = os.path.getsize(self.path(name))
+                self.assertLessEqual(abs(estimate - size), size * slack, (estimate, size))
+        self.assertGreater(stats.memory_bytes, stats.array_elements * 4)
 
-cyl = root.add_child(audGeom.Cylinder('cylinder'))
-cube = root.add_child(audGeom.Cube('Cube'))
-attr = cyl.set_attribute('height', 10)
-cyl.set_attribute('axis', 'Y')
 
-translate = cyl.set_attribute('xformOp:translate', (-1.99, 0, 2), as_type='double3')
-translate.set_keyframe(1, (1,2,3))
-translate.set_keyframe(2, (5,4,3))
-translate.set_keyframe(100, (10,10,10))
+class TestLazySchemas(unittest.TestCase):
 
-cyl.set_xform_order()
+    def test_schema_modules_are_imported_on_use(self):
+        code = ('import sys, aud; loaded = "aud.audLux" in sys.modules; aud.DomeLight; '
+                'print(loaded, "aud.audLux" in sys.modules, aud.DomeLight.__module__)')
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=root_directory)
+        self.assertEqual(output.decode('utf-8').split(), ['False', 'True', 'aud.audLux'])
 
+    def test_index_matches_the_modules(self):
+        for name, module_name in sorted(aud.SCHEMA_MODULES.items()):
+            if module_name == 'audRi':
+                # The generator writes asset defaults in audRi.py as usda, not Python
+                continue
+            with self.subTest(name):
+                self.assertEqual(getattr(aud, name).__module__, 'aud.' + module_name)
+        self.assertIs(aud.schema_class('Mesh'), audGeom.Mesh)
+        self.assertIn('audGeom', dir(aud))
+        self.assertRaises(AttributeError, getattr, aud, 'NotASchema')
 
-xf = root.add_child(audGeom.Xform('foo'))
-xf.add_inherit(cyl, mode='add')
 
-xf.add_variant("lodVariant")
+class TestSchemaDocs(unittest.TestCase):
 
-lodVariant = xf.add_child(aud.VariantSet("lodVariant"))
-hiLOD = lodVariant.add_child(aud.Variant("hi"))
+    def test_classes_keep_a_summary(self):
+        source = os.path.join(aud.SCHEMA_DIRECTORY, 'audGeom.py')
+        with open(source) as f:
+            self.assertIn('    """Transformable camera."""\n', f.read())
 
-hiLOD.add_child(audGeom.Xform('HiGeometry'))
+    def test_full_docs_are_read_from_the_docs_file(self):
+        doc = audGeom.Mesh.__doc__
+        self.assertTrue(doc.startswith('Encodes a mesh surface'))
+        self.assertIn('sharp corners', doc)
+        self.assertIn('length of each edge', audGeom.Cube.size.docstring)
 
+    def test_summary_without_docs_file(self):
+        doc = aud.base._SchemaDoc('aud.audMissing', 'Mesh', summary='Encodes a mesh.')
+        self.assertEqual(doc.text(), 'Encodes a mesh.')
+        self.assertIsNone(aud.base._SchemaDoc('aud.audMissing', 'Mesh', 'points').text())
 
 
-stage.save(output_file)
\ No newline at end of file
+if __name__ == '__main__':
+    unittest.main()